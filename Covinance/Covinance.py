@@ -4,6 +4,7 @@ import os
 import sys
 from datetime import datetime
 from urllib.parse import quote
+from functools import lru_cache
 import glob
 
 # Set up deps path BEFORE importing requests (like Songbird/Covasify does with deps)
@@ -388,10 +389,35 @@ SALVAGE_ITEMS = {
 # Features:
 # - Per-endpoint TTL (MARKET 120s, SYSTEM 300s, METADATA 3600s)
 # - Smart cache keys (includes endpoint + all params)
-# - 3-attempt retry with exponential backoff (1s, 2s, 4s)
+# - 3-attempt retry with exponential backoff (1s, 2s) on transient failures
+#   (timeouts, connection errors, 429/5xx), honouring Retry-After
 # - Thread-safe cache management
+# - Bounded LRU (entry + approximate byte budget) with background expiry sweeper
+# - Stale-while-revalidate for market data (stale copy served, refreshed in background)
+# - Radius subsumption for /nearby queries (a complete wider sphere answers a
+#   narrower one, filtered on distance)
 # ============================================================================
 
+class TransientApiError(Exception):
+    """Retryable API failure (timeout, connection error, 429/5xx) raised by fetch functions"""
+    
+    def __init__(self, message: str, status_code: int = None, retry_after: float = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after  # Server-requested delay in seconds, if any
+    
+    def to_result(self) -> dict:
+        """Error dict handed to callers once retries are exhausted"""
+        result = {"error": str(self)}
+        if self.status_code is not None:
+            result["status_code"] = self.status_code
+        return result
+
+
+class FetchCancelled(Exception):
+    """Raised by a fetch function whose fan-out call was cancelled at the batch deadline (never retried)"""
+
+
 class ReliabilityClient:
     """Caching and retry wrapper for API calls with per-endpoint TTL"""
     
@@ -401,12 +427,37 @@ class ReliabilityClient:
     TTL_METADATA = 3600   # 1 hour - Station services, system info (very stable)
     TTL_DEFAULT = 300     # 5 min - Everything else
     INFLIGHT_WAIT_TIMEOUT = 30  # Max seconds to wait for in-flight requests
+    PERSIST_MIN_TTL = TTL_SYSTEM  # Only entries likely to outlive a restart go to disk
+    MAX_RETRY_WAIT = 10.0  # Cap on a Retry-After honoured inside the retry loop
+    
+    # Radius subsumption for /nearby endpoints
+    RADIUS_PARAM = 'maxDistance'
+    RADIUS_RESULT_CAP = 1000  # Ardent's nearby result cap - a response this large may be truncated
+    
+    # Memory budget (either limit triggers LRU eviction)
+    MAX_CACHE_ENTRIES = 4000
+    MAX_CACHE_BYTES = 64 * 1024 * 1024  # Approximate - see _estimate_size
+    SWEEP_INTERVAL = 60  # Seconds between expired-entry sweeps
+    SIZE_SAMPLE_ROWS = 8  # List responses: rows serialized to extrapolate entry size
     
-    def __init__(self):
+    # Stale-while-revalidate (market data only): expired entries are still served
+    # for up to MARKET_MAX_STALE seconds past their TTL while a background refresh runs
+    MARKET_MAX_STALE = 300
+    REVALIDATE_WORKERS = 2
+    
+    def __init__(self, persistent_store=None, max_entries: int = None, max_bytes: int = None,
+                 background_submit=None):
         import threading
-        self.cache = {}  # {key: (result, cached_time, ttl)}
+        from collections import OrderedDict
+        self.cache = OrderedDict()  # {key: (result, cached_time, ttl)} - least recently used first
+        self.entry_sizes = {}  # {key: approximate bytes}
+        self.cache_bytes = 0
+        self.max_entries = max_entries or self.MAX_CACHE_ENTRIES
+        self.max_bytes = max_bytes or self.MAX_CACHE_BYTES
         self.lock = threading.RLock()  # Thread-safe cache access
         self.in_flight = {}  # {key: (event, result_holder)}
+        self.revalidating = set()  # Keys with a background refresh queued, not started yet
+        self.persistent_store = persistent_store  # Optional PersistentCacheStore (second tier)
         from datetime import datetime
         self.datetime = datetime
         
@@ -415,15 +466,46 @@ class ReliabilityClient:
             'cache_hits': 0,
             'cache_misses': 0,
             'inflight_hits': 0,
+            'disk_hits': 0,  # Subset of cache_hits served from the persistent tier
             'api_calls': 0,
-            'errors': 0
+            'errors': 0,
+            'evictions': 0,  # LRU evictions (over entry/byte budget)
+            'expired_swept': 0,  # Expired entries removed by the sweeper
+            'stale_served': 0,  # Expired market entries served while revalidating
+            'revalidations': 0,  # Background refreshes queued
+            'injected': 0,  # Entries stored from local game files (Market.json)
+            'radius_hits': 0  # Subset of cache_hits answered by filtering a wider /nearby sphere
         }
+        
+        # Complete /nearby responses by query scope (everything but maxDistance)
+        self.radius_index = {}  # {scope key: {cache key: radius}}
+        self.radius_keys = {}  # {cache key: scope key}
+        
+        # Refreshes go to the caller's background lane (background_submit(fn, *args)),
+        # otherwise to a small dedicated pool
+        self.revalidate_executor = None
+        if background_submit is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self.revalidate_executor = ThreadPoolExecutor(
+                max_workers=self.REVALIDATE_WORKERS, thread_name_prefix='covinance-revalidate'
+            )
+            background_submit = self.revalidate_executor.submit
+        self.background_submit = background_submit
+        
+        # Background sweeper - expired entries are dropped instead of lingering until evicted
+        self.stop_event = threading.Event()
+        self.sweeper = threading.Thread(target=self._sweep_loop, name='covinance-cache-sweeper', daemon=True)
+        self.sweeper.start()
     
-    def _make_cache_key(self, endpoint, params):
-        """Include ALL relevant parameters in cache key"""
+    def _make_cache_key(self, endpoint, params, view=None):
+        """Include ALL relevant parameters in cache key (and the row view, if any)"""
         import json
+        from urllib.parse import unquote
+        endpoint = unquote(endpoint)  # Quoted and unquoted system names share one entry
         # Sort params to ensure consistent keys
         param_str = json.dumps(params, sort_keys=True) if params else ""
+        if view:
+            return f"{endpoint}:{param_str}|view={view}"
         return f"{endpoint}:{param_str}"
     
     def _get_ttl_for_endpoint(self, endpoint: str) -> int:
@@ -432,7 +514,7 @@ class ReliabilityClient:
         
         Market data (prices/stock) changes frequently → 2 min
         System data (coordinates/stations) is moderately stable → 5 min
-        Metadata (services/info) is very stable → 1 hour
+        Metadata (services/info/security status) is very stable → 1 hour
         """
         endpoint_lower = endpoint.lower()
         
@@ -441,7 +523,7 @@ class ReliabilityClient:
             return self.TTL_MARKET
         
         # Metadata - very stable
-        if any(x in endpoint_lower for x in ['/nearest/', '/service', '/station/name']):
+        if any(x in endpoint_lower for x in ['/nearest/', '/service', '/station/name', '/status']):
             return self.TTL_METADATA
         
         # System data - moderately stable
@@ -451,39 +533,242 @@ class ReliabilityClient:
         # Default
         return self.TTL_DEFAULT
     
-    def get_cached_or_fetch(self, endpoint, params, fetch_fn):
+    def _estimate_size(self, result) -> int:
+        """
+        Approximate memory footprint of a cached response in bytes.
+        
+        Large list responses are extrapolated from a few serialized rows
+        rather than dumping the whole payload.
+        """
+        import json
+        try:
+            if isinstance(result, list) and result and isinstance(result[0], MarketRow):
+                # Compact rows: slot/object sizes, shared interned names excluded
+                sample = result[:self.SIZE_SAMPLE_ROWS]
+                return sys.getsizeof(result) + sum(row.footprint() for row in sample) * len(result) // len(sample)
+            if isinstance(result, list) and len(result) > self.SIZE_SAMPLE_ROWS:
+                sample = result[:self.SIZE_SAMPLE_ROWS]
+                return len(json.dumps(sample, default=str)) * len(result) // len(sample)
+            return len(json.dumps(result, default=str))
+        except (TypeError, ValueError):
+            return 1024
+    
+    def _stale_window(self, ttl: int) -> int:
+        """Seconds past TTL an entry may still be served (market TTL only)"""
+        return self.MARKET_MAX_STALE if ttl == self.TTL_MARKET else 0
+    
+    def _read_entry(self, key):
+        """Return fresh cached entry as (data, age, ttl) and mark it recently used (call under lock)"""
+        entry = self.cache.get(key)
+        if entry is None:
+            return None
+        cached_data, cached_time, cached_ttl = entry
+        age = (self.datetime.now() - cached_time).total_seconds()
+        if age >= cached_ttl:
+            return None
+        self.cache.move_to_end(key)
+        return cached_data, age, cached_ttl
+    
+    def _read_stale_entry(self, key):
+        """Return expired-but-servable entry as (data, age, ttl), None if fresh, missing or too stale (call under lock)"""
+        entry = self.cache.get(key)
+        if entry is None:
+            return None
+        cached_data, cached_time, cached_ttl = entry
+        age = (self.datetime.now() - cached_time).total_seconds()
+        if age < cached_ttl or age >= cached_ttl + self._stale_window(cached_ttl):
+            return None
+        self.cache.move_to_end(key)
+        return cached_data, age, cached_ttl
+    
+    def _store_entry(self, key, result, cached_time, ttl):
+        """Insert/replace an entry and evict least recently used entries over budget (call under lock)"""
+        self._remove_entry(key)
+        size = self._estimate_size(result)
+        self.cache[key] = (result, cached_time, ttl)
+        self.entry_sizes[key] = size
+        self.cache_bytes += size
+        
+        # Never evict the entry just stored
+        while len(self.cache) > 1 and (len(self.cache) > self.max_entries or self.cache_bytes > self.max_bytes):
+            oldest_key = next(iter(self.cache))
+            self._remove_entry(oldest_key)
+            self.stats['evictions'] += 1
+    
+    def _remove_entry(self, key):
+        """Drop an entry and its size accounting (call under lock)"""
+        if self.cache.pop(key, None) is not None:
+            self.cache_bytes -= self.entry_sizes.pop(key, 0)
+        scope_key = self.radius_keys.pop(key, None)
+        if scope_key is not None:
+            spheres = self.radius_index.get(scope_key, {})
+            spheres.pop(key, None)
+            if not spheres:
+                self.radius_index.pop(scope_key, None)
+    
+    def _radius_scope(self, endpoint, params, view=None):
+        """
+        (scope key, radius) for a /nearby request with maxDistance, None for anything else.
+        
+        Requests in the same scope differ only in radius, so a complete answer for
+        a wider radius contains every row of a narrower one.
+        """
+        if '/nearby' not in endpoint or not params or params.get(self.RADIUS_PARAM) is None:
+            return None
+        try:
+            radius = float(params[self.RADIUS_PARAM])
+        except (TypeError, ValueError):
+            return None
+        rest = {k: v for k, v in params.items() if k != self.RADIUS_PARAM}
+        return self._make_cache_key(endpoint, rest, view) + '|radius', radius
+    
+    def _index_radius(self, key, endpoint, params, view, result):
+        """Register a just-stored /nearby response as a superset for smaller radii if complete (call under lock)"""
+        scope = self._radius_scope(endpoint, params, view)
+        if scope is None or not isinstance(result, list):
+            return
+        count = getattr(result, 'source_count', None)  # Rows the API sent, before the row view
+        if count is None:
+            if view is not None:
+                return  # Filtered rows without the API's row count - truncation unknown
+            count = len(result)
+        if count >= self.RADIUS_RESULT_CAP:
+            return
+        
+        scope_key, radius = scope
+        # A complete wider sphere makes the narrower ones in the same scope redundant
+        for other_key, other_radius in list(self.radius_index.get(scope_key, {}).items()):
+            if other_radius < radius and other_key != key:
+                self._remove_entry(other_key)
+        self.radius_index.setdefault(scope_key, {})[key] = radius
+        self.radius_keys[key] = scope_key
+    
+    def _read_subsumed(self, endpoint, params, view=None):
+        """
+        Answer a /nearby request from a fresh, complete cached response for a wider radius.
+        
+        Returns:
+            (rows within the requested radius, radius of the sphere used) or None (call under lock)
+        """
+        scope = self._radius_scope(endpoint, params, view)
+        if scope is None:
+            return None
+        scope_key, radius = scope
+        spheres = self.radius_index.get(scope_key)
+        if not spheres:
+            return None
+        
+        for key, sphere_radius in sorted(spheres.items(), key=lambda item: item[1]):
+            if sphere_radius < radius:
+                continue
+            entry = self._read_entry(key)
+            if entry is None:
+                continue
+            rows = []
+            for row in entry[0]:
+                distance = row.get('distance')
+                if distance is None:
+                    return None  # Can't filter rows without a distance
+                if distance <= radius:
+                    rows.append(row)
+            return rows, sphere_radius
+        return None
+    
+    def sweep_expired(self) -> int:
+        """Remove all expired entries, returns count removed"""
+        with self.lock:
+            now = self.datetime.now()
+            expired = [
+                key for key, (_, cached_time, cached_ttl) in self.cache.items()
+                if (now - cached_time).total_seconds() >= cached_ttl + self._stale_window(cached_ttl)
+            ]
+            for key in expired:
+                self._remove_entry(key)
+            self.stats['expired_swept'] += len(expired)
+        return len(expired)
+    
+    def _sweep_loop(self):
+        """Sweeper thread body - runs until shutdown()"""
+        while not self.stop_event.wait(self.SWEEP_INTERVAL):
+            try:
+                removed = self.sweep_expired()
+                if removed:
+                    log('info', f'COVINANCE: Cache sweeper removed {removed} expired entries')
+            except Exception as e:
+                log('warning', f'COVINANCE: Cache sweep failed: {str(e)}')
+    
+    def shutdown(self):
+        """Stop the sweeper thread and background refreshes"""
+        self.stop_event.set()
+        if self.revalidate_executor is not None:
+            self.revalidate_executor.shutdown(wait=False)
+    
+    def get_cached_or_fetch(self, endpoint, params, fetch_fn, view=None):
         """Get from cache or fetch with retry (thread-safe with in-flight deduplication)"""
         import threading
-        import time
         
-        key = self._make_cache_key(endpoint, params)
+        key = self._make_cache_key(endpoint, params, view)
         
         # Check cache (thread-safe)
         with self.lock:
-            if key in self.cache:
-                cached_data, cached_time, cached_ttl = self.cache[key]
-                age = (self.datetime.now() - cached_time).total_seconds()
-                if age < cached_ttl:
-                    self.stats['cache_hits'] += 1
-                    log('info', f'COVINANCE: Cache HIT for {endpoint} (age: {age:.1f}s, ttl: {cached_ttl}s)')
-                    return cached_data
+            entry = self._read_entry(key)
+            if entry is not None:
+                cached_data, age, cached_ttl = entry
+                self.stats['cache_hits'] += 1
+                log('info', f'COVINANCE: Cache HIT for {endpoint} (age: {age:.1f}s, ttl: {cached_ttl}s)')
+                return cached_data
+            
+            # Narrower radius than a complete cached /nearby sphere - filter it
+            subsumed = self._read_subsumed(endpoint, params, view)
+            if subsumed is not None:
+                rows, sphere_radius = subsumed
+                self.stats['cache_hits'] += 1
+                self.stats['radius_hits'] += 1
+                log('info', f'COVINANCE: Radius HIT for {endpoint} ({params[self.RADIUS_PARAM]}ly from the cached {sphere_radius:g}ly sphere)')
+                return rows
+            
+            # Stale-while-revalidate: serve expired market data now, refresh once in background
+            stale = self._read_stale_entry(key)
+            if stale is not None:
+                cached_data, age, cached_ttl = stale
+                self.stats['stale_served'] += 1
+                if key not in self.in_flight and key not in self.revalidating:
+                    self.revalidating.add(key)
+                    self.stats['revalidations'] += 1
+                    try:
+                        self.background_submit(self._revalidate, key, endpoint, params, fetch_fn, view)
+                    except RuntimeError:
+                        self.revalidating.discard(key)  # Executor shut down
+                log('info', f'COVINANCE: Stale HIT for {endpoint} (age: {age:.1f}s, ttl: {cached_ttl}s) - revalidating')
+                return cached_data
             
             # Check if request already in-flight
             if key in self.in_flight:
                 event, result_holder = self.in_flight[key]
                 log('info', f'COVINANCE: In-flight HIT for {endpoint} - waiting for result')
         
+        # Second tier: persistent disk cache (outside the lock - SQLite read)
+        if self.persistent_store is not None and key not in self.in_flight:
+            disk_entry = self.persistent_store.get(key)
+            if disk_entry is not None:
+                cached_data, cached_at, cached_ttl = disk_entry
+                with self.lock:
+                    self._store_entry(key, cached_data, self.datetime.fromtimestamp(cached_at), cached_ttl)
+                    self._index_radius(key, endpoint, params, view, cached_data)
+                    self.stats['cache_hits'] += 1
+                    self.stats['disk_hits'] += 1
+                log('info', f'COVINANCE: Disk cache HIT for {endpoint} (ttl: {cached_ttl}s)')
+                return cached_data
+        
         # If in-flight, wait outside the lock
         if key in self.in_flight:
             event.wait(timeout=self.INFLIGHT_WAIT_TIMEOUT)
             with self.lock:
-                if key in self.cache:
-                    cached_data, cached_time, cached_ttl = self.cache[key]
-                    age = (self.datetime.now() - cached_time).total_seconds()
-                    if age < cached_ttl:
-                        self.stats['inflight_hits'] += 1
-                        log('info', f'COVINANCE: In-flight result retrieved for {endpoint}')
-                        return cached_data
+                entry = self._read_entry(key)
+                if entry is not None:
+                    self.stats['inflight_hits'] += 1
+                    log('info', f'COVINANCE: In-flight result retrieved for {endpoint}')
+                    return entry[0]
             # Timeout or cache miss - fall through to fetch
         
         # Mark as in-flight
@@ -501,16 +786,48 @@ class ReliabilityClient:
         if result_holder[0] is not None or result_holder[1] is not None:
             event.wait(timeout=self.INFLIGHT_WAIT_TIMEOUT)
             with self.lock:
-                if key in self.cache:
-                    cached_data, cached_time, cached_ttl = self.cache[key]
-                    return cached_data
+                entry = self._read_entry(key)
+                if entry is not None:
+                    return entry[0]
                 if result_holder[1] is not None:
                     raise result_holder[1]
         
-        # We're the fetcher - determine TTL
+        # We're the fetcher
+        try:
+            return self._fetch_and_store(key, endpoint, params, fetch_fn, result_holder, view)
+        finally:
+            self._finish_in_flight(key)
+    
+    def _revalidate(self, key, endpoint, params, fetch_fn, view=None):
+        """
+        Background refresh of a stale entry (errors keep the stale copy until it ages out).
+        
+        Only registers as the key's in-flight fetch once it starts running: while it
+        waits behind other background work, a caller past the stale cap fetches
+        for itself instead of waiting on a refresh that hasn't started.
+        """
+        import threading
+        
+        with self.lock:
+            self.revalidating.discard(key)
+            if key in self.in_flight or self._read_entry(key) is not None:
+                return  # A foreground fetch refreshed it (or is refreshing it) meanwhile
+            result_holder = [None, None]
+            self.in_flight[key] = (threading.Event(), result_holder)
+        
+        try:
+            self._fetch_and_store(key, endpoint, params, fetch_fn, result_holder, view)
+        except Exception as e:
+            log('warning', f'COVINANCE: Background refresh failed for {endpoint}: {str(e)}')
+        finally:
+            self._finish_in_flight(key)
+    
+    def _fetch_and_store(self, key, endpoint, params, fetch_fn, result_holder, view=None):
+        """Fetch with retry (3 attempts, exponential backoff) and cache successful responses"""
+        import time
+        
         ttl = self._get_ttl_for_endpoint(endpoint)
         
-        # Fetch with retry (3 attempts, exponential backoff)
         # NOTE: fetch_fn NOT inside lock - we want concurrent API calls
         last_error = None
         result = None
@@ -519,54 +836,83 @@ class ReliabilityClient:
         with self.lock:
             self.stats['cache_misses'] += 1
         
-        try:
-            for attempt in range(3):
-                try:
-                    # Increment API call counter for this attempt (thread-safe)
-                    with self.lock:
-                        self.stats['api_calls'] += 1
-                    log('info', f'COVINANCE: Cache MISS - Fetching {endpoint} (attempt {attempt + 1}/3, ttl: {ttl}s)')
-                    result = fetch_fn(endpoint, params)
-                    
-                    # Check if result is an error response or None
-                    is_error = (isinstance(result, dict) and 'error' in result) or result is None
-                    
-                    if is_error:
-                        # Don't cache error responses (404s, timeouts, etc.) or None
-                        error_msg = result.get('error') if isinstance(result, dict) else 'None result'
-                        log('warning', f'COVINANCE: Not caching error response for {endpoint}: {error_msg}')
-                        with self.lock:
-                            result_holder[0] = result
-                        return result
-                    
-                    # Store successful response in cache (thread-safe)
+        for attempt in range(3):
+            try:
+                # Increment API call counter for this attempt (thread-safe)
+                with self.lock:
+                    self.stats['api_calls'] += 1
+                log('info', f'COVINANCE: Cache MISS - Fetching {endpoint} (attempt {attempt + 1}/3, ttl: {ttl}s)')
+                result = fetch_fn(endpoint, params)
+                
+                # Check if result is an error response or None
+                is_error = (isinstance(result, dict) and 'error' in result) or result is None
+                
+                if is_error:
+                    # Don't cache error responses (404s, timeouts, etc.) or None
+                    error_msg = result.get('error') if isinstance(result, dict) else 'None result'
+                    log('warning', f'COVINANCE: Not caching error response for {endpoint}: {error_msg}')
                     with self.lock:
-                        self.cache[key] = (result, self.datetime.now(), ttl)
                         result_holder[0] = result
-                    
                     return result
-                    
-                except Exception as e:
-                    last_error = e
-                    if attempt < 2:  # Don't sleep on last attempt
-                        wait = 2 ** attempt  # 1s, 2s, 4s
-                        log('warning', f'COVINANCE: API call failed (attempt {attempt + 1}/3), retrying in {wait}s...')
-                        time.sleep(wait)
-                    else:
-                        log('error', f'COVINANCE: API call failed after 3 attempts: {str(e)}')
-            
-            # All retries failed
-            with self.lock:
-                result_holder[1] = last_error
-            raise last_error
-            
-        finally:
-            # Always clean up in-flight tracking and signal waiters
+                
+                # Store successful response in cache (thread-safe)
+                with self.lock:
+                    self._store_entry(key, result, self.datetime.now(), ttl)
+                    self._index_radius(key, endpoint, params, view, result)
+                    result_holder[0] = result
+                
+                # Write-behind to disk tier (queued, not on the request path)
+                if self.persistent_store is not None and ttl >= self.PERSIST_MIN_TTL:
+                    self.persistent_store.put(key, result, ttl)
+                
+                return result
+                
+            except FetchCancelled:
+                raise  # Batch deadline passed - nothing to retry or cache, waiters fetch for themselves
+            except Exception as e:
+                last_error = e
+                if attempt < 2:  # Don't sleep on last attempt
+                    wait = 2 ** attempt  # 1s, 2s
+                    retry_after = getattr(e, 'retry_after', None)
+                    if retry_after:
+                        wait = max(wait, min(retry_after, self.MAX_RETRY_WAIT))
+                    log('warning', f'COVINANCE: API call failed (attempt {attempt + 1}/3): {str(e)} - retrying in {wait:.1f}s...')
+                    time.sleep(wait)
+                else:
+                    log('error', f'COVINANCE: API call failed after 3 attempts: {str(e)}')
+        
+        # Transient failures keep the error-dict contract (never cached)
+        if isinstance(last_error, TransientApiError):
+            result = last_error.to_result()
             with self.lock:
-                if key in self.in_flight:
-                    event, _ = self.in_flight[key]
-                    event.set()  # Wake up any waiters
-                    del self.in_flight[key]
+                result_holder[0] = result
+            return result
+        
+        # All retries failed
+        with self.lock:
+            result_holder[1] = last_error
+        raise last_error
+    
+    def inject(self, endpoint, params, result, view=None, ttl=None):
+        """
+        Store data obtained without an API call (e.g. the game's Market.json) as a fresh entry.
+        
+        Replaces whatever the API returned for the same key; memory only - the
+        source file is simply re-read after a restart.
+        """
+        key = self._make_cache_key(endpoint, params, view)
+        ttl = ttl or self._get_ttl_for_endpoint(endpoint)
+        with self.lock:
+            self._store_entry(key, result, self.datetime.now(), ttl)
+            self.stats['injected'] += 1
+    
+    def _finish_in_flight(self, key):
+        """Clean up in-flight tracking and signal waiters"""
+        with self.lock:
+            if key in self.in_flight:
+                event, _ = self.in_flight[key]
+                event.set()  # Wake up any waiters
+                del self.in_flight[key]
 
     def get_stats(self):
         """Get cache performance statistics"""
@@ -578,62 +924,1667 @@ class ReliabilityClient:
                 'cache_hit_rate': f"{hit_rate:.1f}%",
                 'total_requests': total,
                 'api_calls_saved': self.stats['cache_hits'] + self.stats['inflight_hits'],
+                'entries': len(self.cache),
+                'max_entries': self.max_entries,
+                'cache_bytes': self.cache_bytes,
+                'max_bytes': self.max_bytes,
                 **self.stats
             }
 
 
 
+# ============================================================================
+# PERSISTENT CACHE TIER
+# ============================================================================
+# SQLite-backed second tier behind ReliabilityClient's in-memory cache.
+# - Same keys as _make_cache_key, same per-endpoint TTLs
+# - Opened lazily on first lookup (expired rows purged at open)
+# - Writes go through a background writer thread (never on the request path)
+# - Other local indexes (galaxy, rare goods) register their own tables and
+#   share the same connection and writer
+# ============================================================================
+
+class PersistentCacheStore:
+    """SQLite second-tier cache so plugin restarts start warm"""
+    
+    WRITE_BATCH_SIZE = 200  # Max rows per write transaction
+    
+    def __init__(self, db_path: str):
+        import threading
+        import queue
+        self.db_path = db_path
+        self.lock = threading.Lock()  # Serializes access to the shared connection
+        self.conn = None
+        self.opened = False
+        self.available = True  # Flips to False after a fatal SQLite error
+        self.schemas = []  # Extra CREATE TABLE statements from other indexes
+        self.write_queue = queue.Queue()
+        self.writer = threading.Thread(target=self._writer_loop, name='covinance-cache-writer', daemon=True)
+        self.writer.start()
+    
+    def _connect(self):
+        """Open the database on first use and purge expired rows"""
+        import sqlite3
+        import time
+        
+        if self.opened:
+            return self.conn
+        
+        with self.lock:
+            if self.opened:
+                return self.conn
+            self.opened = True
+            try:
+                conn = sqlite3.connect(self.db_path, check_same_thread=False)
+                conn.execute('PRAGMA journal_mode=WAL')
+                conn.execute('PRAGMA synchronous=NORMAL')
+                conn.execute(
+                    'CREATE TABLE IF NOT EXISTS cache ('
+                    'key TEXT PRIMARY KEY, payload TEXT NOT NULL, cached_at REAL NOT NULL, ttl INTEGER NOT NULL)'
+                )
+                for ddl in self.schemas:
+                    conn.execute(ddl)
+                purged = conn.execute('DELETE FROM cache WHERE cached_at + ttl < ?', (time.time(),)).rowcount
+                conn.commit()
+                self.conn = conn
+                log('info', f'COVINANCE: Persistent cache opened ({os.path.basename(self.db_path)}, purged {purged} expired)')
+            except Exception as e:
+                self.available = False
+                log('warning', f'COVINANCE: Persistent cache unavailable: {str(e)}')
+        return self.conn
+    
+    def get(self, key: str):
+        """
+        Look up a non-expired entry.
+        
+        Returns:
+            (result, cached_at_epoch, ttl) or None
+        """
+        import time
+        
+        if not self.available:
+            return None
+        conn = self._connect()
+        if conn is None:
+            return None
+        
+        try:
+            with self.lock:
+                row = conn.execute('SELECT payload, cached_at, ttl FROM cache WHERE key = ?', (key,)).fetchone()
+        except Exception as e:
+            log('warning', f'COVINANCE: Persistent cache read failed: {str(e)}')
+            return None
+        
+        if not row:
+            return None
+        payload, cached_at, ttl = row
+        if time.time() - cached_at >= ttl:
+            return None
+        try:
+            return json.loads(payload), cached_at, ttl
+        except ValueError:
+            return None
+    
+    def put(self, key: str, result, ttl: int):
+        """Queue an entry for write-behind (returns immediately)"""
+        import time
+        if self.available:
+            self.write_queue.put((None, (key, result, time.time(), ttl)))
+    
+    def register_schema(self, ddl: str):
+        """Add a CREATE TABLE IF NOT EXISTS statement for another local index"""
+        self.schemas.append(ddl)
+        if self.opened and self.conn is not None:
+            with self.lock:
+                self.conn.execute(ddl)
+                self.conn.commit()
+    
+    def write(self, statement: str, row: tuple):
+        """Queue an arbitrary parameterized write for the background writer"""
+        if self.available:
+            self.write_queue.put((statement, row))
+    
+    def query(self, statement: str, args: tuple = ()) -> list:
+        """Run a read query (empty list if the store is unavailable)"""
+        if not self.available:
+            return []
+        conn = self._connect()
+        if conn is None:
+            return []
+        try:
+            with self.lock:
+                return conn.execute(statement, args).fetchall()
+        except Exception as e:
+            log('warning', f'COVINANCE: Persistent store query failed: {str(e)}')
+            return []
+    
+    def _writer_loop(self):
+        """Drain the write queue in batches until a None sentinel arrives"""
+        import queue
+        
+        while True:
+            item = self.write_queue.get()
+            batch = [item]
+            while len(batch) < self.WRITE_BATCH_SIZE:
+                try:
+                    batch.append(self.write_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            stop = None in batch
+            # Group rows per statement - cache entries are serialized here, off the request path
+            grouped = {}
+            for entry in batch:
+                if entry is None:
+                    continue
+                statement, row = entry
+                if statement is None:
+                    key, result, cached_at, ttl = row
+                    try:
+                        row = (key, json.dumps(result, default=MarketRow.to_json), cached_at, ttl)
+                    except (TypeError, ValueError):
+                        continue  # Not JSON-serializable - keep it memory-only
+                    statement = 'INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)'
+                grouped.setdefault(statement, []).append(row)
+            
+            try:
+                conn = self._connect() if grouped and self.available else None
+                if conn is not None:
+                    with self.lock:
+                        for statement, rows in grouped.items():
+                            conn.executemany(statement, rows)
+                        conn.commit()
+            except Exception as e:
+                log('warning', f'COVINANCE: Persistent cache write failed: {str(e)}')
+            finally:
+                for _ in batch:
+                    self.write_queue.task_done()
+            
+            if stop:
+                return
+    
+    def flush(self):
+        """Block until all queued writes are on disk"""
+        self.write_queue.join()
+    
+    def close(self):
+        """Flush pending writes and close the database"""
+        self.write_queue.put(None)
+        self.writer.join(timeout=5)
+        with self.lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+
+
+# ============================================================================
+# GALAXY INDEX
+# ============================================================================
+# Local spatial index of system coordinates, filled from every API response
+# carrying systemX/Y/Z and from Journal StarPos. Grid bucketing answers radius
+# and k-nearest queries. Coverage spheres remember where a /nearby response
+# listed every system, so repeat radius queries inside visited space stay local.
+# ============================================================================
+
+class GalaxyIndex:
+    """Grid-bucketed system coordinate index with coverage tracking"""
+    
+    CELL_SIZE = 25.0  # LY per grid cell edge
+    COVERAGE_TTL = 7 * 86400  # Seconds a /nearby sweep is trusted as complete
+    NEARBY_RESULT_CAP = 1000  # Responses this large may be truncated - not trusted as coverage
+    
+    def __init__(self, store=None):
+        import threading
+        self.store = store  # Optional PersistentCacheStore for on-disk persistence
+        self.lock = threading.RLock()
+        self.systems = {}  # {name_lower: (name, x, y, z)}
+        self.cells = {}  # {(ix, iy, iz): set(name_lower)}
+        self.coverage = []  # [(x, y, z, radius, covered_at)]
+        self.loaded = False
+        
+        if self.store is not None:
+            self.store.register_schema(
+                'CREATE TABLE IF NOT EXISTS galaxy_systems ('
+                'name TEXT PRIMARY KEY, x REAL NOT NULL, y REAL NOT NULL, z REAL NOT NULL)'
+            )
+            self.store.register_schema(
+                'CREATE TABLE IF NOT EXISTS galaxy_coverage ('
+                'x REAL NOT NULL, y REAL NOT NULL, z REAL NOT NULL, radius REAL NOT NULL, covered_at REAL NOT NULL)'
+            )
+    
+    def _ensure_loaded(self):
+        """Load persisted systems and coverage on first use"""
+        import time
+        
+        if self.loaded:
+            return
+        with self.lock:
+            if self.loaded:
+                return
+            self.loaded = True
+            if self.store is None:
+                return
+            for name, x, y, z in self.store.query('SELECT name, x, y, z FROM galaxy_systems'):
+                self._insert(name, x, y, z)
+            cutoff = time.time() - self.COVERAGE_TTL
+            self.coverage = [
+                tuple(row) for row in self.store.query(
+                    'SELECT x, y, z, radius, covered_at FROM galaxy_coverage WHERE covered_at > ?', (cutoff,)
+                )
+            ]
+            log('info', f'COVINANCE: Galaxy index loaded ({len(self.systems)} systems, {len(self.coverage)} covered regions)')
+    
+    def _cell(self, x: float, y: float, z: float) -> tuple:
+        size = self.CELL_SIZE
+        return (int(x // size), int(y // size), int(z // size))
+    
+    def _insert(self, name: str, x: float, y: float, z: float) -> bool:
+        """Insert/move a system in memory, returns True if it was new or moved (call under lock)"""
+        key = name.lower()
+        existing = self.systems.get(key)
+        if existing is not None:
+            if existing[1:] == (x, y, z):
+                return False
+            self.cells.get(self._cell(*existing[1:]), set()).discard(key)
+        self.systems[key] = (name, x, y, z)
+        self.cells.setdefault(self._cell(x, y, z), set()).add(key)
+        return True
+    
+    def add_system(self, name: str, x: float, y: float, z: float):
+        """Record one system's coordinates"""
+        if not name or x is None or y is None or z is None:
+            return
+        self._ensure_loaded()
+        with self.lock:
+            changed = self._insert(name, float(x), float(y), float(z))
+        if changed and self.store is not None:
+            self.store.write('INSERT OR REPLACE INTO galaxy_systems VALUES (?, ?, ?, ?)', (name, float(x), float(y), float(z)))
+    
+    def ingest(self, data):
+        """Pick up coordinates from any API response (dict or list of rows with systemName + systemX/Y/Z)"""
+        rows = data if isinstance(data, list) else [data] if isinstance(data, dict) else []
+        seen = set()
+        for row in rows:
+            if not isinstance(row, (dict, MarketRow)):
+                continue
+            name = row.get('systemName')
+            if not name or name in seen or row.get('systemX') is None:
+                continue
+            seen.add(name)
+            self.add_system(name, row.get('systemX'), row.get('systemY'), row.get('systemZ'))
+    
+    def coordinates(self, name: str):
+        """(x, y, z) for a system, or None if unknown"""
+        if not name:
+            return None
+        self._ensure_loaded()
+        with self.lock:
+            entry = self.systems.get(name.lower())
+        return entry[1:] if entry else None
+    
+    def add_coverage(self, center: tuple, radius: float):
+        """Remember that every system within radius of center is now indexed"""
+        import time
+        self._ensure_loaded()
+        entry = (center[0], center[1], center[2], float(radius), time.time())
+        with self.lock:
+            # Drop regions the new sphere swallows
+            self.coverage = [
+                c for c in self.coverage
+                if not self._contains(c[:3], c[3], entry)
+            ]
+            self.coverage.append(entry)
+        if self.store is not None:
+            self.store.write('INSERT INTO galaxy_coverage VALUES (?, ?, ?, ?, ?)', entry)
+    
+    def _contains(self, center: tuple, radius: float, region: tuple) -> bool:
+        """True if sphere (center, radius) lies entirely inside coverage region"""
+        import math
+        return math.dist(center, region[:3]) + radius <= region[3]
+    
+    def is_covered(self, center: tuple, radius: float) -> bool:
+        """True if a trusted /nearby sweep already listed every system within radius of center"""
+        import time
+        self._ensure_loaded()
+        cutoff = time.time() - self.COVERAGE_TTL
+        with self.lock:
+            return any(
+                region[4] > cutoff and self._contains(center, radius, region)
+                for region in self.coverage
+            )
+    
+    def query_radius(self, center: tuple, radius: float) -> list:
+        """
+        Systems within radius of center.
+        
+        Returns:
+            [(name, distance, x, y, z)] sorted by distance
+        """
+        import math
+        self._ensure_loaded()
+        
+        low = self._cell(center[0] - radius, center[1] - radius, center[2] - radius)
+        high = self._cell(center[0] + radius, center[1] + radius, center[2] + radius)
+        
+        found = []
+        with self.lock:
+            for ix in range(low[0], high[0] + 1):
+                for iy in range(low[1], high[1] + 1):
+                    for iz in range(low[2], high[2] + 1):
+                        for key in self.cells.get((ix, iy, iz), ()):
+                            name, x, y, z = self.systems[key]
+                            distance = math.dist(center, (x, y, z))
+                            if distance <= radius:
+                                found.append((name, distance, x, y, z))
+        found.sort(key=lambda item: item[1])
+        return found
+    
+    def nearest(self, center: tuple, k: int, max_radius: float) -> list:
+        """k nearest indexed systems within max_radius, as [(name, distance, x, y, z)]"""
+        # Grow the search shell until k systems are found or max_radius is reached
+        radius = min(self.CELL_SIZE, max_radius)
+        while True:
+            found = self.query_radius(center, radius)
+            if len(found) >= k or radius >= max_radius:
+                return found[:k]
+            radius = min(radius * 2, max_radius)
+
+
+# ============================================================================
+# RARE GOODS INDEX
+# ============================================================================
+# Where each rare good is sold (commodity -> station/system/coordinates).
+# Rare goods are tied to one home station, so locations are stable and only
+# re-checked after LOCATION_TTL. Built from the galaxy-wide commodity exports
+# endpoint (one call per rare good, fleet carriers excluded) and persisted in
+# the shared PersistentCacheStore, so discovery becomes a local distance filter.
+# ============================================================================
+
+class RareGoodsIndex:
+    """Persistent commodity -> home station index for rare goods"""
+    
+    LOCATION_TTL = 30 * 86400  # Seconds before a rare good's locations are re-checked
+    
+    def __init__(self, store=None):
+        import threading
+        self.store = store  # Optional PersistentCacheStore for on-disk persistence
+        self.lock = threading.RLock()
+        self.locations = {}  # {commodity: {market_id: (station, system, x, y, z)}}
+        self.scanned_at = {}  # {commodity: epoch of last successful lookup}
+        self.loaded = False
+        
+        if self.store is not None:
+            self.store.register_schema(
+                'CREATE TABLE IF NOT EXISTS rare_goods_locations ('
+                'commodity TEXT NOT NULL, market_id INTEGER NOT NULL, station TEXT, system TEXT NOT NULL, '
+                'x REAL NOT NULL, y REAL NOT NULL, z REAL NOT NULL, PRIMARY KEY (commodity, market_id))'
+            )
+            self.store.register_schema(
+                'CREATE TABLE IF NOT EXISTS rare_goods_scans ('
+                'commodity TEXT PRIMARY KEY, scanned_at REAL NOT NULL)'
+            )
+    
+    def _ensure_loaded(self):
+        """Load persisted locations and scan times on first use"""
+        if self.loaded:
+            return
+        with self.lock:
+            if self.loaded:
+                return
+            self.loaded = True
+            if self.store is None:
+                return
+            for commodity, scanned_at in self.store.query('SELECT commodity, scanned_at FROM rare_goods_scans'):
+                self.scanned_at[commodity] = scanned_at
+            for commodity, market_id, station, system, x, y, z in self.store.query(
+                'SELECT commodity, market_id, station, system, x, y, z FROM rare_goods_locations'
+            ):
+                self.locations.setdefault(commodity, {})[market_id] = (station, system, x, y, z)
+            log('info', f'COVINANCE: Rare goods index loaded ({len(self.scanned_at)} commodities, '
+                        f'{sum(len(v) for v in self.locations.values())} stations)')
+    
+    def stale(self, commodities) -> list:
+        """Commodities never looked up, or whose last lookup is older than LOCATION_TTL"""
+        import time
+        self._ensure_loaded()
+        cutoff = time.time() - self.LOCATION_TTL
+        with self.lock:
+            return [c for c in commodities if self.scanned_at.get(c, 0) <= cutoff]
+    
+    def indexed_count(self) -> int:
+        """Number of rare goods with a completed lookup"""
+        self._ensure_loaded()
+        with self.lock:
+            return len(self.scanned_at)
+    
+    def update(self, commodity: str, locations: list):
+        """
+        Replace a rare good's known locations after a successful lookup.
+        
+        Args:
+            locations: [(market_id, station, system, x, y, z)] - empty if none found
+        """
+        import time
+        self._ensure_loaded()
+        now = time.time()
+        with self.lock:
+            self.locations[commodity] = {loc[0]: tuple(loc[1:]) for loc in locations}
+            self.scanned_at[commodity] = now
+        if self.store is not None:
+            self.store.write('DELETE FROM rare_goods_locations WHERE commodity = ?', (commodity,))
+            for loc in locations:
+                self.store.write('INSERT OR REPLACE INTO rare_goods_locations VALUES (?, ?, ?, ?, ?, ?, ?)', (commodity,) + tuple(loc))
+            self.store.write('INSERT OR REPLACE INTO rare_goods_scans VALUES (?, ?)', (commodity, now))
+    
+    def within(self, center: tuple, radius: float) -> list:
+        """
+        Indexed rare goods stations within radius of center.
+        
+        Returns:
+            [(commodity, station, system, distance, market_id)] sorted by distance
+        """
+        import math
+        self._ensure_loaded()
+        found = []
+        with self.lock:
+            for commodity, markets in self.locations.items():
+                for market_id, (station, system, x, y, z) in markets.items():
+                    distance = math.dist(center, (x, y, z))
+                    if distance <= radius:
+                        found.append((commodity, station, system, distance, market_id))
+        found.sort(key=lambda item: item[3])
+        return found
+
+
 # ============================================================================
 # PARALLEL EXECUTION
 # ============================================================================
 # Enables concurrent API calls for performance-critical operations.
 # Primary use: Rare goods discovery (143 commodities in parallel)
+#
+# One worker pool with three lanes, served in priority order:
+# - interactive: requests a voice response is waiting on right now
+# - fanout: multi-request scans behind a command (rare goods, route engine)
+# - background: neighbourhood prefetch and stale-entry refreshes
+# INTERACTIVE_RESERVE workers never take fanout/background work, so an
+# interactive task starts within milliseconds even while a 300-task scan has
+# every other worker busy. Background work is capped at BACKGROUND_LIMIT workers.
 # ============================================================================
 
+class PriorityExecutor:
+    """Lane-aware thread pool (interactive > fanout > background) with per-lane queue stats"""
+    
+    LANES = ('interactive', 'fanout', 'background')
+    INTERACTIVE_RESERVE = 2  # Workers kept free for interactive tasks
+    BACKGROUND_LIMIT = 2  # Max workers running background tasks at once
+    
+    def __init__(self, max_workers: int):
+        import threading
+        from collections import deque
+        self.max_workers = max(max_workers, self.INTERACTIVE_RESERVE + 1)
+        self.queues = {lane: deque() for lane in self.LANES}
+        self.running = dict.fromkeys(self.LANES, 0)
+        self.stats = {
+            lane: {'submitted': 0, 'completed': 0, 'cancelled': 0, 'wait_total': 0.0, 'wait_max': 0.0}
+            for lane in self.LANES
+        }
+        self.condition = threading.Condition()
+        self.local = threading.local()
+        self.shutting_down = False
+        self.workers = [
+            threading.Thread(target=self._worker_loop, name=f'covinance-worker-{i}', daemon=True)
+            for i in range(self.max_workers)
+        ]
+        for worker in self.workers:
+            worker.start()
+    
+    def submit(self, lane: str, fn, *args, **kwargs):
+        """Queue fn(*args, **kwargs) on a lane, returns a concurrent.futures.Future"""
+        import time
+        from concurrent.futures import Future
+        
+        if lane not in self.queues:
+            raise ValueError(f'Unknown executor lane: {lane}')
+        future = Future()
+        entry = (future, fn, args, kwargs, time.monotonic())
+        with self.condition:
+            if self.shutting_down:
+                raise RuntimeError('cannot schedule new tasks after shutdown')
+            self.queues[lane].append(entry)
+            self.stats[lane]['submitted'] += 1
+            self.condition.notify()
+        future.add_done_callback(lambda done: self._discard_cancelled(lane, entry))
+        return future
+    
+    def _discard_cancelled(self, lane: str, entry):
+        """Done-callback: drop a cancelled task from its queue so 'queued' only counts live work"""
+        if not entry[0].cancelled():
+            return
+        with self.condition:
+            try:
+                self.queues[lane].remove(entry)
+            except ValueError:
+                return  # Already taken by a worker (counted there) or cleared by shutdown()
+            self.stats[lane]['cancelled'] += 1
+    
+    def current_lane(self):
+        """Lane of the task running on this thread (None outside the pool, e.g. a COVAS action thread)"""
+        return getattr(self.local, 'lane', None)
+    
+    def _next_task(self):
+        """Highest-priority runnable (lane, task), None if nothing may start now (call under lock)"""
+        busy_non_interactive = self.running['fanout'] + self.running['background']
+        for lane in self.LANES:
+            if not self.queues[lane]:
+                continue
+            if lane != 'interactive':
+                if busy_non_interactive >= self.max_workers - self.INTERACTIVE_RESERVE:
+                    continue
+                if lane == 'background' and self.running['background'] >= self.BACKGROUND_LIMIT:
+                    continue
+            return lane, self.queues[lane].popleft()
+        return None
+    
+    def _worker_loop(self):
+        """Worker thread body - runs until shutdown()"""
+        import time
+        
+        while True:
+            with self.condition:
+                picked = self._next_task()
+                while picked is None:
+                    if self.shutting_down:
+                        return
+                    self.condition.wait()
+                    picked = self._next_task()
+                lane, (future, fn, args, kwargs, queued_at) = picked
+                self.running[lane] += 1
+            
+            try:
+                if not future.set_running_or_notify_cancel():
+                    with self.condition:
+                        self.stats[lane]['cancelled'] += 1
+                    continue
+                waited = time.monotonic() - queued_at
+                with self.condition:
+                    self.stats[lane]['wait_total'] += waited
+                    self.stats[lane]['wait_max'] = max(self.stats[lane]['wait_max'], waited)
+                self.local.lane = lane
+                try:
+                    future.set_result(fn(*args, **kwargs))
+                except BaseException as e:
+                    future.set_exception(e)
+                with self.condition:
+                    self.stats[lane]['completed'] += 1
+            finally:
+                self.local.lane = None
+                with self.condition:
+                    self.running[lane] -= 1
+                    self.condition.notify()  # A lane cap may have just opened up
+    
+    def get_stats(self) -> dict:
+        """Per lane: queued, running, submitted, completed, cancelled, avg/max queue wait (ms)"""
+        with self.condition:
+            stats = {}
+            for lane in self.LANES:
+                lane_stats = self.stats[lane]
+                started = lane_stats['completed'] + self.running[lane]
+                stats[lane] = {
+                    'queued': len(self.queues[lane]),
+                    'running': self.running[lane],
+                    'submitted': lane_stats['submitted'],
+                    'completed': lane_stats['completed'],
+                    'cancelled': lane_stats['cancelled'],
+                    'avg_wait_ms': lane_stats['wait_total'] / started * 1000 if started else 0.0,
+                    'max_wait_ms': lane_stats['wait_max'] * 1000
+                }
+            return stats
+    
+    def shutdown(self, wait: bool = True):
+        """Cancel queued tasks and stop the workers once running tasks finish"""
+        with self.condition:
+            self.shutting_down = True
+            for queue in self.queues.values():
+                while queue:
+                    queue.popleft()[0].cancel()
+            self.condition.notify_all()
+        if wait:
+            for worker in self.workers:
+                worker.join(timeout=5)
+
+
 class ParallelRunner:
     """Execute API calls in parallel with progress tracking"""
     
     def __init__(self, max_workers: int = 8):
-        from concurrent.futures import ThreadPoolExecutor
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.max_workers = max_workers
+        self.executor = PriorityExecutor(max_workers)
+    
+    def submit(self, lane: str, fn, *args, **kwargs):
+        """Queue a single task on a lane (see PriorityExecutor.LANES)"""
+        return self.executor.submit(lane, fn, *args, **kwargs)
     
-    def run_batch(self, tasks, timeout_per_task: float = 10.0):
+    def current_lane(self):
+        return self.executor.current_lane()
+    
+    def get_lane_stats(self) -> dict:
+        return self.executor.get_stats()
+    
+    def run_batch(self, tasks, timeout_per_task: float = 10.0, deadline: float = None, lane: str = 'fanout'):
         """
-        Execute tasks in parallel.
+        Execute tasks in parallel, returning whatever finished within the deadline.
         
         Args:
             tasks: List of callable functions (no arguments)
-            timeout_per_task: Max seconds per individual task
+            timeout_per_task: Max seconds per individual task (sets the default deadline)
+            deadline: Overall seconds for the batch (default: len(tasks) * timeout_per_task).
+                      Queued tasks are cancelled when it passes; running ones are abandoned.
+            lane: Executor lane ('interactive', 'fanout' or 'background')
         
         Returns:
-            (successful_results, exceptions)
+            (successful_results, exceptions, abandoned_count)
         """
-        from concurrent.futures import as_completed
+        from concurrent.futures import wait
         
         if not tasks:
-            return [], []
+            return [], [], 0
+        
+        if deadline is None:
+            deadline = len(tasks) * timeout_per_task
+        
+        futures = [self.executor.submit(lane, task) for task in tasks]
+        done, not_done = wait(futures, timeout=deadline)
+        
+        # Drop queued work - a late result is no use to a voice response
+        for future in not_done:
+            future.cancel()
+        if not_done:
+            log('warning', f'Parallel batch deadline ({deadline:.0f}s) reached - abandoned {len(not_done)}/{len(futures)} tasks')
         
-        futures = [self.executor.submit(task) for task in tasks]
         results = []
         exceptions = []
-        
-        for future in as_completed(futures, timeout=len(tasks) * timeout_per_task):
+        for future in futures:
+            if future not in done:
+                continue
             try:
-                result = future.result(timeout=timeout_per_task)
+                result = future.result()
                 if result is not None:
                     results.append(result)
             except Exception as e:
                 exceptions.append(e)
                 log('warning', f'Parallel task failed: {str(e)}')
         
-        return results, exceptions
+        return results, exceptions, len(not_done)
+    
+    def run_ordered(self, tasks, timeout_per_task: float = 10.0, lane: str = 'fanout'):
+        """
+        Execute tasks in parallel, yielding results in task order as they finish.
+        
+        Lets callers consume a pre-sorted list (e.g. by distance) and stop early -
+        tasks not yet started are cancelled when the generator is closed.
+        
+        Args:
+            tasks: List of callable functions (no arguments)
+            timeout_per_task: Max seconds to wait for each individual task
+            lane: Executor lane ('interactive', 'fanout' or 'background')
+        
+        Yields:
+            (index, result) for each task that returned a non-None result
+        """
+        futures = [self.executor.submit(lane, task) for task in tasks]
+        try:
+            for index, future in enumerate(futures):
+                try:
+                    result = future.result(timeout=timeout_per_task)
+                except Exception as e:
+                    log('warning', f'Parallel task failed: {str(e)}')
+                    continue
+                if result is not None:
+                    yield index, result
+        finally:
+            for future in futures:
+                future.cancel()
+    
+    def shutdown(self):
+        """Cleanup thread pool"""
+        self.executor.shutdown(wait=True)
+
+
+# ============================================================================
+# RATE LIMITING
+# ============================================================================
+# One per-host token bucket shared by every thread that calls the Ardent API
+# (action threads and all worker lanes), adaptive on 429/503 and Retry-After.
+# ============================================================================
+
+class TokenBucket:
+    """
+    Thread-safe token bucket shared by every Ardent API caller.
+    
+    The refill rate adapts (AIMD): successful responses raise it by about
+    INCREASE_STEP req/s per second of traffic up to max_rate, every 429/503
+    halves it (at most once per DECREASE_INTERVAL, so a burst of throttled
+    responses counts once) and a Retry-After blocks all tokens until that
+    moment has passed. Interactive reservations skip the queue - the token is
+    still taken, so bulk callers absorb the debt.
+    """
+    
+    MIN_RATE = 1.0
+    INCREASE_STEP = 2.0  # req/s added per second of successful traffic
+    DECREASE_FACTOR = 0.5
+    DECREASE_INTERVAL = 1.0  # Seconds between rate cuts
+    MAX_RETRY_AFTER = 30.0  # Cap on server-requested pauses
+    
+    def __init__(self, rate: float, burst: int, max_rate: float = None):
+        import threading
+        import time
+        self.rate = rate  # Tokens added per second
+        self.max_rate = max(rate, max_rate or rate)
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0  # Retry-After pause (monotonic time)
+        self.last_decrease = 0.0
+        self.throttled = 0  # 429/503 responses seen
+        self.lock = threading.Lock()
+    
+    def reserve(self, interactive: bool = False) -> float:
+        """Take one token, returns seconds the caller must wait before sending (0 if available now)"""
+        import time
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            wait = 0.0 if self.tokens >= 0 or interactive else -self.tokens / self.rate
+            return max(wait, self.blocked_until - now)
+    
+    def reward(self):
+        """Additive increase after a successful response"""
+        with self.lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.INCREASE_STEP / self.rate)
+    
+    def penalize(self, retry_after: float = None):
+        """Multiplicative decrease after a 429/503, plus the server's Retry-After pause if given"""
+        import time
+        with self.lock:
+            now = time.monotonic()
+            self.throttled += 1
+            if now - self.last_decrease >= self.DECREASE_INTERVAL:
+                self.rate = max(self.MIN_RATE, self.rate * self.DECREASE_FACTOR)
+                self.tokens = min(self.tokens, 0.0)  # Drop the saved-up burst
+                self.last_decrease = now
+            if retry_after:
+                self.blocked_until = max(self.blocked_until, now + min(retry_after, self.MAX_RETRY_AFTER))
+    
+    @staticmethod
+    def parse_retry_after(value) -> float:
+        """Retry-After header (delay-seconds or HTTP-date) to seconds, None if absent/unparseable"""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            from email.utils import parsedate_to_datetime
+            from datetime import timezone
+            when = parsedate_to_datetime(value)
+            return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError, IndexError):
+            return None
+
+
+# ============================================================================
+# ASYNC FAN-OUT
+# ============================================================================
+# A fan-out batch runs as asyncio tasks on a short-lived event loop: an
+# asyncio.Semaphore bounds the calls in flight, asyncio.wait(timeout=) gives
+# the whole batch one deadline and the stragglers are cancelled when it passes.
+# The blocking part of each call (call_ardent_api on the pooled requests
+# session, with its cache, rate limit and retries) goes through
+# loop.run_in_executor onto the worker pool's fanout lane - aiohttp/httpx are
+# not in the bundled deps/. Cancelling a call cancels it in the lane queue if
+# it hasn't started, and otherwise sets its cancel event: the fetch stops
+# before sending, or at the next body chunk, and frees its worker.
+# ============================================================================
+
+class LaneSubmitter:
+    """Executor facade for loop.run_in_executor - submits to one ParallelRunner lane"""
+    
+    def __init__(self, runner: ParallelRunner, lane: str):
+        self.runner = runner
+        self.lane = lane
+    
+    def submit(self, fn, *args):
+        return self.runner.submit(self.lane, fn, *args)
+
+
+class AsyncArdentClient:
+    """asyncio fan-out for Ardent calls (semaphore-bounded, one deadline, stragglers cancelled)"""
+    
+    MAX_CONCURRENCY = 8  # Calls in flight at once - matches the fanout workers and pooled connections
+    
+    def __init__(self, runner: ParallelRunner, max_concurrency: int = None):
+        import threading
+        self.executor = LaneSubmitter(runner, 'fanout')
+        self.max_concurrency = max_concurrency or self.MAX_CONCURRENCY
+        self.lock = threading.Lock()
+        self.stats = {'batches': 0, 'calls': 0, 'completed': 0, 'failed': 0, 'cancelled': 0}
+    
+    def fetch_many(self, fetch_fn, calls: list, timeout: float) -> list:
+        """
+        Run fetch_fn(*call, cancel_event) for every call, blocking until all are done or the deadline.
+        
+        Args:
+            fetch_fn: Blocking fetch taking a call's arguments plus a threading.Event
+                      that is set when the call is cancelled
+            calls: Argument tuples, one per call
+            timeout: Overall deadline in seconds for the whole batch
+        
+        Returns:
+            Results aligned with calls: fetch_fn's return value, or None if it failed
+            or was cut off by the deadline
+        """
+        import asyncio
+        
+        if not calls:
+            return []
+        return asyncio.run(self._gather(fetch_fn, calls, timeout))
+    
+    async def _gather(self, fetch_fn, calls: list, timeout: float) -> list:
+        """Start every call, cancel whatever is still pending at the deadline"""
+        import asyncio
+        
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        tasks = [asyncio.ensure_future(self._call(semaphore, fetch_fn, call)) for call in calls]
+        done, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)  # Cancellation reaches the lane queue / cancel events
+            log('warning', f'COVINANCE: Fan-out deadline ({timeout:.1f}s) reached - cancelled {len(pending)}/{len(tasks)} calls')
+        
+        results = []
+        failed = 0
+        for task in tasks:
+            if task in done and task.exception() is None:
+                results.append(task.result())
+                continue
+            if task in done:
+                failed += 1
+                log('warning', f'COVINANCE: Fan-out call failed: {str(task.exception())}')
+            results.append(None)
+        
+        with self.lock:
+            self.stats['batches'] += 1
+            self.stats['calls'] += len(tasks)
+            self.stats['completed'] += len(done) - failed
+            self.stats['failed'] += failed
+            self.stats['cancelled'] += len(pending)
+        return results
+    
+    async def _call(self, semaphore, fetch_fn, call: tuple):
+        """One call: wait for a concurrency slot, then run the blocking fetch on the fanout lane"""
+        import asyncio
+        import threading
+        
+        cancel = threading.Event()
+        async with semaphore:
+            try:
+                return await asyncio.get_running_loop().run_in_executor(self.executor, fetch_fn, *call, cancel)
+            except asyncio.CancelledError:
+                cancel.set()  # Already running - stop before sending or at the next chunk
+                raise
+    
+    def get_stats(self) -> dict:
+        with self.lock:
+            return dict(self.stats)
+
+
+# ============================================================================
+# JOURNAL TAILER
+# ============================================================================
+# Keeps a byte offset into the latest Journal.*.log and parses only lines
+# appended since the last poll. Latest location and ship state are kept in
+# memory, so actions never re-read a multi-MB journal per voice command.
+# Switches to a new journal file automatically when the game starts a new one.
+# ============================================================================
+
+class JournalTailer:
+    """Incremental Journal reader with in-memory location and ship state"""
+    
+    RESCAN_INTERVAL = 5  # Seconds between directory scans for a newer journal file
+    
+    # Cheap byte-level prefilter - only lines mentioning these events get JSON-parsed
+    TRACKED_EVENTS = (b'"Location"', b'"FSDJump"', b'"Docked"', b'"Loadout"', b'"LoadGame"', b'"Cargo"')
+    
+    def __init__(self, find_latest_file):
+        import threading
+        self.find_latest_file = find_latest_file  # Callable returning latest journal path (or "")
+        self.lock = threading.RLock()  # Actions may poll concurrently
+        self.journal_file = ""
+        self.offset = 0  # Bytes of journal_file already parsed
+        self.last_scan = 0.0
+        self._reset_state()
+    
+    def _reset_state(self):
+        """Forget everything learned from the previous journal file"""
+        self.location = {}  # {'event', 'system', 'station', 'market_id', 'coordinates'}
+        self.ship_data = {}  # CargoCapacity, MaxJumpRange, ShipType, Credits, CurrentCargo
+    
+    def poll(self) -> bool:
+        """
+        Parse journal lines appended since the last poll.
+        
+        Returns:
+            True if any tracked event was applied
+        """
+        import time
+        
+        with self.lock:
+            now = time.monotonic()
+            if not self.journal_file or now - self.last_scan >= self.RESCAN_INTERVAL:
+                self.last_scan = now
+                latest = self.find_latest_file()
+                if latest and latest != self.journal_file:
+                    log('info', f'COVINANCE: Tailing journal: {os.path.basename(latest)}')
+                    self.journal_file = latest
+                    self.offset = 0
+                    self._reset_state()
+            
+            if not self.journal_file:
+                return False
+            
+            try:
+                size = os.path.getsize(self.journal_file)
+            except OSError as e:
+                log('warning', f'COVINANCE: Journal not readable: {str(e)}')
+                self.journal_file = ""
+                return False
+            
+            # File shrank (rewritten) - start over
+            if size < self.offset:
+                self.offset = 0
+                self._reset_state()
+            
+            if size == self.offset:
+                return False
+            
+            with open(self.journal_file, 'rb') as f:
+                f.seek(self.offset)
+                chunk = f.read(size - self.offset)
+            
+            # Only consume complete lines - the game may be mid-write
+            end = chunk.rfind(b'\n')
+            if end < 0:
+                return False
+            self.offset += end + 1
+            
+            applied = 0
+            for raw in chunk[:end].splitlines():
+                if not any(marker in raw for marker in self.TRACKED_EVENTS):
+                    continue
+                try:
+                    event = json.loads(raw)
+                except ValueError:
+                    continue
+                if isinstance(event, dict) and self._apply_event(event):
+                    applied += 1
+            
+            return applied > 0
+    
+    def _apply_event(self, event: dict) -> bool:
+        """Update in-memory state from one journal event (events arrive oldest first)"""
+        event_type = event.get('event', '')
+        
+        # Location event (current system when loading game)
+        if event_type == 'Location':
+            self.location = {
+                'event': event_type,
+                'system': event.get('StarSystem'),
+                'station': event.get('StationName'),
+                'market_id': event.get('MarketID'),  # Only present when docked
+                'coordinates': self._coordinates(event) or self.location.get('coordinates')
+            }
+        
+        # FSDJump event (jumping to new system)
+        elif event_type == 'FSDJump':
+            self.location = {
+                'event': event_type,
+                'system': event.get('StarSystem'),
+                'station': None,  # Left station when jumping
+                'market_id': None,
+                'coordinates': self._coordinates(event) or self.location.get('coordinates')
+            }
+        
+        # Docked event (docked at station) - no StarPos, keep last known coordinates
+        elif event_type == 'Docked':
+            self.location = {
+                'event': event_type,
+                'system': event.get('StarSystem'),
+                'station': event.get('StationName'),
+                'market_id': event.get('MarketID'),
+                'coordinates': self.location.get('coordinates')
+            }
+        
+        # Loadout event - has cargo capacity and ship stats
+        elif event_type == 'Loadout':
+            self.ship_data['CargoCapacity'] = event.get('CargoCapacity', 0)
+            self.ship_data['MaxJumpRange'] = event.get('MaxJumpRange', 0)
+            self.ship_data['ShipType'] = event.get('Ship', '')
+        
+        # LoadGame event - has credits
+        elif event_type == 'LoadGame':
+            self.ship_data['Credits'] = event.get('Credits', 0)
+        
+        # Cargo event - current cargo contents (Count when Inventory only went to Cargo.json)
+        elif event_type == 'Cargo':
+            inventory = event.get('Inventory')
+            if inventory is not None:
+                self.ship_data['CurrentCargo'] = sum(item.get('Count', 0) for item in inventory)
+            else:
+                self.ship_data['CurrentCargo'] = event.get('Count', 0)
+        
+        else:
+            return False
+        
+        return True
+    
+    def _coordinates(self, event: dict):
+        """Convert StarPos [x, y, z] to coordinate dict"""
+        coords = event.get('StarPos')
+        if coords and len(coords) == 3:
+            return {'x': coords[0], 'y': coords[1], 'z': coords[2]}
+        return None
+    
+    def get_location(self) -> dict:
+        """Latest known location state (copy)"""
+        with self.lock:
+            return dict(self.location)
+    
+    def get_ship_data(self) -> dict:
+        """Latest known ship stats (copy)"""
+        with self.lock:
+            return dict(self.ship_data)
+
+
+# ============================================================================
+# GAME FILE WATCHER
+# ============================================================================
+# Elite Dangerous rewrites Market.json (full market of the station you are docked
+# at, whenever the commodities screen is opened), Cargo.json and Status.json next
+# to the journals. A poll is one os.stat per file; files are only re-read when
+# their mtime/size changed. Market.json items are converted to Ardent's row shape
+# so they can be injected into the cache and overlaid on API responses.
+# ============================================================================
+
+class GameFileWatcher:
+    """Change-driven reader for Market.json, Cargo.json and Status.json"""
+    
+    FILES = ('Market.json', 'Cargo.json', 'Status.json')
+    
+    def __init__(self, find_directory):
+        import threading
+        self.find_directory = find_directory  # Callable returning the journal directory (or "")
+        self.lock = threading.RLock()
+        self.directory = ""
+        self.signatures = {}  # File name -> (mtime_ns, size) of the copy last loaded
+        self.market = None  # See _parse_market
+        self.cargo_count = None
+        self.status = {}
+    
+    def poll(self) -> set:
+        """
+        Re-read files that changed since the last poll.
+        
+        Returns:
+            Names of the files that were (re)loaded
+        """
+        changed = set()
+        with self.lock:
+            if not self.directory:
+                self.directory = self.find_directory()
+                if not self.directory:
+                    return changed
+            
+            for name in self.FILES:
+                path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                signature = (stat.st_mtime_ns, stat.st_size)
+                if self.signatures.get(name) == signature:
+                    continue
+                try:
+                    with open(path, 'rb') as f:
+                        data = json.loads(f.read())
+                except (OSError, ValueError):
+                    continue  # The game may be mid-write - picked up on the next poll
+                self.signatures[name] = signature
+                if isinstance(data, dict) and self._apply(name, data):
+                    changed.add(name)
+        return changed
+    
+    def _apply(self, name: str, data: dict) -> bool:
+        """Update in-memory state from one freshly read file"""
+        if name == 'Market.json':
+            market = self._parse_market(data)
+            if market is None:
+                return False
+            self.market = market
+        elif name == 'Cargo.json':
+            if data.get('Vessel', 'Ship') != 'Ship':
+                return False  # SRV cargo
+            inventory = data.get('Inventory')
+            if inventory is not None:
+                self.cargo_count = sum(item.get('Count', 0) for item in inventory)
+            else:
+                self.cargo_count = data.get('Count')
+        else:
+            self.status = data
+        return True
+    
+    @staticmethod
+    def _parse_market(data: dict) -> dict:
+        """Market.json to {'market_id', 'station', 'system', 'timestamp', 'rows'} (rows in Ardent format)"""
+        market_id = data.get('MarketID')
+        items = data.get('Items')
+        if not market_id or not isinstance(items, list):
+            return None  # Market.json without Items (market screen not opened)
+        
+        station = data.get('StationName')
+        system = data.get('StarSystem')
+        timestamp = data.get('timestamp')
+        rows = []
+        for item in items:
+            name = (item.get('Name') or '').lower()
+            if name.startswith('$') and name.endswith('_name;'):
+                name = name[1:-6]  # $hydrogenfuel_name; -> hydrogenfuel
+            if not name:
+                continue
+            rows.append({
+                'commodityName': name,
+                'marketId': market_id,
+                'stationName': station,
+                'stationType': data.get('StationType'),
+                'systemName': system,
+                'buyPrice': item.get('BuyPrice', 0),
+                'sellPrice': item.get('SellPrice', 0),
+                'stock': item.get('Stock', 0),
+                'demand': item.get('Demand', 0),
+                'stockBracket': item.get('StockBracket', 0),
+                'demandBracket': item.get('DemandBracket', 0),
+                'meanPrice': item.get('MeanPrice', 0),
+                'updatedAt': timestamp
+            })
+        return {'market_id': market_id, 'station': station, 'system': system, 'timestamp': timestamp, 'rows': rows}
+    
+    def get_market(self) -> dict:
+        """Latest parsed Market.json (None until one with Items has been read)"""
+        with self.lock:
+            return self.market
+    
+    def get_ship_data(self) -> dict:
+        """CurrentCargo (Cargo.json, else Status.json) and Credits (Status.json) where known"""
+        with self.lock:
+            cargo = self.cargo_count if self.cargo_count is not None else self.status.get('Cargo')
+            values = (('CurrentCargo', cargo), ('Credits', self.status.get('Balance')))
+            return {field: value for field, value in values if value is not None}
+
+
+# ============================================================================
+# PROJECTED STATE PROVIDER
+# ============================================================================
+# COVAS NEXT hands every action its projected_states - in-memory projections of
+# the Journal and Status.json it already tails. Location and ship stats are read
+# from there; fields a projection lacks (COVAS just started, older COVAS build,
+# field not tracked) come from Cargo.json/Status.json, then the JournalTailer.
+# ============================================================================
+
+class ProjectedStateProvider:
+    """Location and ship stats from COVAS projected_states, game file / Journal fallback per field"""
+    
+    LOCATION_FIELDS = ('system', 'station', 'coordinates')
+    SHIP_FIELDS = ('ShipType', 'CargoCapacity', 'MaxJumpRange', 'CurrentCargo', 'Credits')
+    
+    def __init__(self, journal_tailer: JournalTailer, game_files: GameFileWatcher = None):
+        import threading
+        self.journal_tailer = journal_tailer
+        self.game_files = game_files  # Already polled by the caller
+        self.stats = {'snapshots': 0, 'journal_fallbacks': 0}
+        self.lock = threading.Lock()
+    
+    def snapshot(self, projected_states: dict) -> dict:
+        """
+        Current location and ship stats, in the same shape as the JournalTailer state.
+        
+        Returns:
+            {'location': {system, station, coordinates}, 'ship': {ShipType, CargoCapacity,
+             MaxJumpRange, CurrentCargo, Credits}} - fields unknown to both sources are absent
+        """
+        states = projected_states or {}
+        location = self._location(states.get('Location') or {})
+        ship = self._ship(states.get('ShipInfo') or {}, states.get('Cargo') or {},
+                          states.get('CurrentStatus') or {})
+        if self.game_files is not None:
+            for field, value in self.game_files.get_ship_data().items():
+                ship.setdefault(field, value)
+        
+        missing_location = [f for f in self.LOCATION_FIELDS if f not in location]
+        missing_ship = [f for f in self.SHIP_FIELDS if f not in ship]
+        with self.lock:
+            self.stats['snapshots'] += 1
+            if missing_location or missing_ship:
+                self.stats['journal_fallbacks'] += 1
+        
+        if missing_location or missing_ship:
+            log('info', f'COVINANCE: Journal fallback for {", ".join(missing_location + missing_ship)}')
+            try:
+                self.journal_tailer.poll()
+            except Exception as e:
+                log('error', f'COVINANCE: Error reading journal: {str(e)}')
+            journal_location = self.journal_tailer.get_location()
+            journal_ship = self.journal_tailer.get_ship_data()
+            
+            same_system = journal_location.get('system') == location.get('system', journal_location.get('system'))
+            for field in missing_location:
+                # Journal station/coordinates only describe the projected system if it's the same one
+                if field in journal_location and (field == 'system' or same_system):
+                    location[field] = journal_location[field]
+            for field in missing_ship:
+                if field in journal_ship:
+                    ship[field] = journal_ship[field]
+        
+        return {'location': location, 'ship': ship}
+    
+    def _location(self, state: dict) -> dict:
+        """Location projection (StarSystem, Station, Docked, StarPos) to tailer location fields"""
+        location = {}
+        system = state.get('StarSystem')
+        if system and system != 'Unknown':
+            location['system'] = system
+        if 'Docked' in state:
+            location['station'] = state.get('Station') if state['Docked'] else None
+        coords = state.get('StarPos')
+        if coords and len(coords) == 3:
+            location['coordinates'] = {'x': coords[0], 'y': coords[1], 'z': coords[2]}
+        return location
+    
+    def _ship(self, ship_info: dict, cargo: dict, status: dict) -> dict:
+        """ShipInfo / Cargo / CurrentStatus projections to tailer ship fields"""
+        values = (
+            ('ShipType', ship_info.get('Type')),
+            ('CargoCapacity', ship_info.get('CargoCapacity', cargo.get('Capacity'))),
+            ('MaxJumpRange', ship_info.get('MaximumJumpRange')),
+            ('CurrentCargo', cargo.get('TotalItems', status.get('Cargo'))),
+            ('Credits', status.get('Balance')),
+        )
+        return {field: value for field, value in values if value is not None}
+    
+    def get_stats(self) -> dict:
+        with self.lock:
+            return dict(self.stats)
+
+
+# ============================================================================
+# NEIGHBOURHOOD PREFETCHER
+# ============================================================================
+# Background thread that tails the Journal every POLL_INTERVAL seconds and, on
+# each new FSDJump/Docked/Location, runs a prefetch plan for the new position on
+# the executor's background lane. Plans are generators that yield after every API
+# request; any foreground request bumps the generation counter and the running
+# plan stops at its next yield (requests already on the wire complete and are
+# cached - a foreground call for the same key joins them in flight).
+# ============================================================================
+
+class NeighbourhoodPrefetcher:
+    """Warms the cache for the commander's new system when the Journal reports a jump or dock"""
+    
+    POLL_INTERVAL = 2.0  # Seconds between Journal polls
+    TRIGGER_EVENTS = ('FSDJump', 'Docked', 'Location')
+    
+    def __init__(self, journal_tailer: JournalTailer, runner: ParallelRunner, plan_fn, on_poll=None):
+        import threading
+        self.journal_tailer = journal_tailer
+        self.runner = runner  # Plans run on its background lane
+        self.plan_fn = plan_fn  # Callable(location) -> generator yielding after each request
+        self.on_poll = on_poll  # Optional extra work per poll tick
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.generation = 0
+        self.running = 0  # Plans currently executing
+        self.last_trigger = None
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.stats = {'triggers': 0, 'requests': 0, 'completed': 0, 'interrupted': 0}
+    
+    def start(self):
+        """Start the Journal watch thread (idempotent)"""
+        import threading
+        if self.thread is not None:
+            return
+        # Current position is the baseline - only later events trigger a prefetch
+        location = self.journal_tailer.get_location()
+        self.last_trigger = (location.get('event'), location.get('system'), location.get('station'))
+        self.thread = threading.Thread(target=self._watch_loop, name='covinance-journal-watch', daemon=True)
+        self.thread.start()
+    
+    def _watch_loop(self):
+        """Watch thread body - runs until stop()"""
+        while not self.stop_event.wait(self.POLL_INTERVAL):
+            try:
+                self.journal_tailer.poll()
+                if self.on_poll is not None:
+                    self.on_poll()
+                location = self.journal_tailer.get_location()
+                trigger = (location.get('event'), location.get('system'), location.get('station'))
+                if trigger[0] in self.TRIGGER_EVENTS and trigger[1] and trigger != self.last_trigger:
+                    self.last_trigger = trigger
+                    self.trigger(location)
+            except Exception as e:
+                log('warning', f'COVINANCE: Journal watch failed: {str(e)}')
+    
+    def trigger(self, location: dict):
+        """Queue a prefetch plan for a location (supersedes any plan still running)"""
+        with self.lock:
+            self.generation += 1
+            generation = self.generation
+            self.stats['triggers'] += 1
+        log('info', f"COVINANCE: Prefetching neighbourhood of {location.get('system')} ({location.get('event')})")
+        self.runner.submit('background', self._run_plan, location, generation)
+    
+    def _run_plan(self, location: dict, generation: int):
+        """Worker body - step through the plan until done, superseded or interrupted"""
+        with self.lock:
+            if generation != self.generation:
+                return
+            self.running += 1
+        self.local.active = True
+        plan = None
+        try:
+            plan = self.plan_fn(location)
+            for _ in plan:
+                with self.lock:
+                    self.stats['requests'] += 1
+                    stopped = generation != self.generation or self.stop_event.is_set()
+                    if stopped:
+                        self.stats['interrupted'] += 1
+                if stopped:
+                    log('info', f"COVINANCE: Prefetch for {location.get('system')} stopped early (foreground request or newer event)")
+                    return
+            with self.lock:
+                self.stats['completed'] += 1
+        except Exception as e:
+            log('warning', f'COVINANCE: Prefetch failed: {str(e)}')
+        finally:
+            if plan is not None:
+                plan.close()
+            self.local.active = False
+            with self.lock:
+                self.running -= 1
+    
+    def in_prefetch(self) -> bool:
+        """True when called from a prefetch plan (its API calls must not interrupt it)"""
+        return getattr(self.local, 'active', False)
+    
+    def interrupt(self):
+        """Foreground request arrived - stop the running plan at its next request boundary"""
+        if self.running and not self.in_prefetch():
+            with self.lock:
+                self.generation += 1
+    
+    def get_stats(self) -> dict:
+        with self.lock:
+            return dict(self.stats)
+    
+    def stop(self):
+        """Stop watching - queued plans see the new generation and return at once"""
+        self.stop_event.set()
+        with self.lock:
+            self.generation += 1
+        if self.thread is not None:
+            self.thread.join(timeout=2)
+
+
+# ============================================================================
+# STREAMING JSON ROWS
+# ============================================================================
+# Push-style JSON decoder for streamed requests responses.
+# Bytes are fed as they arrive; a top-level array is parsed one element at a
+# time and each element is filtered/projected by a row view immediately.
+# ============================================================================
+
+class JsonRowStream:
+    """Incremental JSON decoder - feed() chunks as they arrive, finish() returns the value"""
+    
+    def __init__(self, fields=None, keep=None):
+        import codecs
+        self.fields = fields  # Row view fields (None = decode the body whole)
+        self.keep = keep  # Row view predicate
+        self.decoder = json.JSONDecoder()
+        self.text = codecs.getincrementaldecoder('utf-8')()
+        self.mode = 'whole' if fields is None else None  # None until the first character is seen
+        self.parts = []  # Body text in 'whole' mode
+        self.buffer = ''
+        self.pos = 0
+        self.rows = []
+        self.count = 0  # Array elements decoded, kept or not
+        self.closed = False  # Closing ']' of the array seen
+    
+    def feed(self, chunk: bytes):
+        """Decode one chunk, emitting every array element it completes"""
+        if self.closed:
+            return
+        if self.mode == 'whole':
+            self.parts.append(self.text.decode(chunk))
+            return
+        
+        self.buffer = self.buffer[self.pos:] + self.text.decode(chunk)
+        self.pos = 0
+        
+        if self.mode is None:
+            stripped = self.buffer.lstrip()
+            if not stripped:
+                return
+            if stripped[0] != '[':
+                # Not a list - nothing to stream, decode the whole body at the end
+                self.mode = 'whole'
+                self.parts.append(stripped)
+                self.buffer = ''
+                return
+            self.mode = 'array'
+            self.buffer = stripped
+            self.pos = 1
+        
+        buffer = self.buffer
+        while True:
+            # Skip separators between elements
+            while self.pos < len(buffer) and buffer[self.pos] in ' \t\r\n,':
+                self.pos += 1
+            if self.pos >= len(buffer):
+                return
+            if buffer[self.pos] == ']':
+                self.closed = True
+                return
+            try:
+                row, self.pos = self.decoder.raw_decode(buffer, self.pos)
+            except ValueError:
+                return  # Element incomplete - wait for the next chunk
+            self.count += 1
+            if isinstance(row, dict) and self.keep(row):
+                self.rows.append(MarketRow(row, self.fields))
+    
+    def finish(self):
+        """Decoded value: kept rows (as a RowList of MarketRow) for arrays, the plain value otherwise"""
+        if self.mode == 'array':
+            if not self.closed:
+                raise ValueError('Truncated JSON array in API response')
+            return RowList(self.rows, self.count)
+        return json.loads(''.join(self.parts) + self.text.decode(b'', final=True))
+
+
+class RowList(list):
+    """Rows kept from a streamed array, remembering how many elements the API sent"""
+    
+    __slots__ = ('source_count',)
+    
+    def __init__(self, rows=(), source_count: int = None):
+        super().__init__(rows)
+        self.source_count = len(self) if source_count is None else source_count
+
+
+# ============================================================================
+# COMPACT MARKET ROWS
+# ============================================================================
+# Market responses (/exports, /imports) are cached as MarketRow records rather
+# than dicts: one __slots__ field per known Ardent key, with commodity, station
+# and system names interned so thousands of cached rows share one copy of each.
+# Rows keep dict-style reads (row.get / row['key'] / 'key' in row), so action
+# code filters and sorts them unchanged. Unknown keys go to a small overflow dict.
+# ============================================================================
+
+class MarketRow:
+    """Slotted market order with interned names and dict-style access"""
+    
+    FIELDS = ('commodityName', 'marketId', 'stationName', 'stationType', 'systemName', 'systemAddress',
+              'systemX', 'systemY', 'systemZ', 'maxLandingPadSize', 'distanceToArrival', 'isPlanetary',
+              'buyPrice', 'sellPrice', 'stock', 'demand', 'stockBracket', 'demandBracket', 'meanPrice',
+              'distance', 'updatedAt')
+    INTERNED = frozenset(('commodityName', 'stationName', 'stationType', 'systemName', 'maxLandingPadSize'))
+    
+    __slots__ = FIELDS + ('extra',)
+    
+    _FIELD_SET = frozenset(FIELDS)
+    _MISSING = object()
+    
+    def __init__(self, data: dict, fields=None):
+        """Build from an API row, optionally keeping only the given fields"""
+        self.extra = None
+        for key, value in data.items():
+            if fields is not None and key not in fields:
+                continue
+            self[key] = value
+    
+    @classmethod
+    def pack(cls, rows: list) -> list:
+        """Convert a list of API row dicts (other items are left as-is)"""
+        if isinstance(rows, RowList):
+            return rows  # Streamed - already MarketRow records
+        return [cls(row) if isinstance(row, dict) else row for row in rows]
+    
+    def get(self, key, default=None):
+        if key in self._FIELD_SET:
+            return getattr(self, key, default)
+        return self.extra.get(key, default) if self.extra else default
+    
+    def __getitem__(self, key):
+        value = self.get(key, self._MISSING)
+        if value is self._MISSING:
+            raise KeyError(key)
+        return value
+    
+    def __setitem__(self, key, value):
+        if key in self._FIELD_SET:
+            if key in self.INTERNED and isinstance(value, str):
+                value = sys.intern(value)
+            setattr(self, key, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
     
-    def shutdown(self):
-        """Cleanup thread pool"""
-        self.executor.shutdown(wait=True)
+    def __contains__(self, key) -> bool:
+        return self.get(key, self._MISSING) is not self._MISSING
+    
+    def keys(self) -> list:
+        present = [field for field in self.FIELDS if hasattr(self, field)]
+        return present + list(self.extra) if self.extra else present
+    
+    def items(self) -> list:
+        return [(key, self[key]) for key in self.keys()]
+    
+    def to_dict(self) -> dict:
+        return dict(self.items())
+    
+    def footprint(self) -> int:
+        """Approximate bytes owned by this row (interned names are shared, not counted)"""
+        size = sys.getsizeof(self)
+        for field in self.FIELDS:
+            if field not in self.INTERNED:
+                value = getattr(self, field, None)
+                if value is not None:
+                    size += sys.getsizeof(value)
+        if self.extra:
+            size += sys.getsizeof(self.extra) + sum(sys.getsizeof(v) for v in self.extra.values())
+        return size
+    
+    @staticmethod
+    def to_json(obj):
+        """json.dumps default= hook - serializes MarketRow as a plain dict"""
+        if isinstance(obj, MarketRow):
+            return obj.to_dict()
+        raise TypeError(f'{type(obj).__name__} is not JSON serializable')
+    
+    def __repr__(self) -> str:
+        return f'MarketRow({self.to_dict()!r})'
 
 
 class COVINANCE(PluginBase):
+    # Wall-clock budget for per-commodity fan-outs (replaces fixed "top N" caps)
+    FANOUT_TIME_BUDGET = 8.0
+    RARE_SCAN_TIME_BUDGET = 20.0  # Rare goods per-system stock scan
+    
+    # Route engine limits (circular route / chain planners)
+    ROUTE_MAX_SYSTEMS = 60  # Candidate systems whose full market is prefetched
+    ROUTE_BEAM_WIDTH = 250  # Partial routes kept per hop during beam search
+    FULL_MARKET_MAX_SYSTEMS = 40  # Nearest systems loaded by a full-market profit scan
+    
+    # Sample commodities for radius-wide profit scans
+    PROFIT_SCAN_COMMODITIES = ['palladium', 'gold', 'bertrandite', 'indite', 'gallite',
+                               'painite', 'platinum', 'osmium', 'praseodymium']
+    
+    # Trade time model (seconds) for credits-per-hour ranking
+    JUMP_SECONDS = 45  # Charge + hyperspace per jump
+    DOCK_SECONDS = 60  # Docking request, approach and landing
+    TRADE_SECONDS = 30  # Commodity market transaction
+    SUPERCRUISE_BASE_SECONDS = 45  # Drop-in/out overhead
+    SUPERCRUISE_SQRT_FACTOR = 1.9  # Seconds per sqrt(ls) to the station
+    
+    # Commodity name normalization: drop spaces, hyphens, underscores, apostrophes in one pass
+    COMMODITY_STRIP_TABLE = str.maketrans('', '', " -_'")
+    
+    # Row views for streamed market responses: (fields kept, row predicate).
+    # Rows failing the predicate are dropped while the response is still downloading.
+    TRADE_ROW_FIELDS = ('commodityName', 'systemName', 'stationName', 'stationType', 'marketId',
+                        'maxLandingPadSize', 'distanceToArrival', 'isPlanetary', 'buyPrice', 'sellPrice',
+                        'stock', 'demand', 'distance', 'systemX', 'systemY', 'systemZ', 'updatedAt')
+    ROW_VIEWS = {
+        'buy': (TRADE_ROW_FIELDS, lambda row: (row.get('buyPrice') or 0) > 0),
+        'sell': (TRADE_ROW_FIELDS, lambda row: (row.get('sellPrice') or 0) > 0),
+        'buy_orbital': (TRADE_ROW_FIELDS, lambda row: (row.get('buyPrice') or 0) > 0
+                        and row.get('stationType') != 'OnFootSettlement'),
+        'sell_orbital': (TRADE_ROW_FIELDS, lambda row: (row.get('sellPrice') or 0) > 0
+                         and row.get('stationType') != 'OnFootSettlement'),
+    }
+    STREAM_CHUNK_BYTES = 64 * 1024
+    
+    # Background prefetch after a jump/dock: nearby sphere radius (at least the jump range)
+    # and how many of the closest neighbours also get their markets warmed
+    PREFETCH_RADIUS = 50
+    PREFETCH_NEIGHBOURS = 3
+    
+    # Market.json rows are served from cache (no API call) until this long after the game wrote them
+    LIVE_MARKET_TTL = 3600
+    
+    # Per-host request budget shared by every thread using the requests session.
+    # The rate adapts between TokenBucket.MIN_RATE and API_RATE_MAX on 429/503 feedback.
+    API_RATE_PER_SECOND = 25.0
+    API_RATE_MAX = 60.0
+    API_RATE_BURST = 25
+    
     def __init__(self, plugin_manifest: PluginManifest):
         super().__init__(plugin_manifest)
         
@@ -641,12 +2592,34 @@ class COVINANCE(PluginBase):
         self.api_base_url = "https://api.ardent-insight.com/v2"
         
         # Initialize reliability client (caching + retry with per-endpoint TTL)
-        self.reliability_client = ReliabilityClient()
-        self.parallel_runner = ParallelRunner(max_workers=8)
+        # Second tier persists metadata/system lookups across restarts
+        plugin_folder = self.get_plugin_folder_path()
+        persistent_store = PersistentCacheStore(os.path.join(plugin_folder, '_covinance_cache.db')) if plugin_folder else None
+        # Shared worker pool: 8 workers for fan-outs/background + 2 kept free for interactive work
+        self.parallel_runner = ParallelRunner(max_workers=10)
+        self.reliability_client = ReliabilityClient(
+            persistent_store=persistent_store,
+            background_submit=lambda fn, *args: self.parallel_runner.submit('background', fn, *args)
+        )
+        # Local system coordinates (shares the on-disk store) - answers nearby/distance queries offline
+        self.galaxy_index = GalaxyIndex(persistent_store)
+        # Rare goods home stations (shares the on-disk store) - discovery without per-system scans
+        self.rare_goods_index = RareGoodsIndex(persistent_store)
+        # Shared HTTP session - keep-alive connections reused across all API calls
+        self.http_session = self._create_http_session()
+        # Per-host rate limit
+        self.rate_limiter = TokenBucket(self.API_RATE_PER_SECOND, self.API_RATE_BURST, self.API_RATE_MAX)
+        # asyncio fan-outs (bounded concurrency, batch deadline) over the same session and rate limit
+        self.async_client = AsyncArdentClient(self.parallel_runner)
         # Track current system/station from Journal
         self.current_system = None
         self.current_station = None
         self.system_coordinates = None
+        self.journal_tailer = JournalTailer(self.get_latest_journal_file)
+        self.game_files = GameFileWatcher(self.get_journal_directory)
+        self.state_provider = ProjectedStateProvider(self.journal_tailer, self.game_files)
+        self.prefetcher = NeighbourhoodPrefetcher(self.journal_tailer, self.parallel_runner,
+                                                  self._prefetch_neighbourhood, self._refresh_game_files)
         
         # Cache for API responses (5 minute expiration)
         self.cache = {}
@@ -698,16 +2671,8 @@ class COVINANCE(PluginBase):
             >>> _normalize_commodity_name("Mollusc Fluid")
             ValueError: Mollusc Fluid is a salvage item...
         """
-        # Step 1: Basic normalization
-        #   - Lowercase
-        #   - Remove spaces, hyphens, underscores, apostrophes
-        #   - Strip whitespace
-        normalized = commodity.lower()
-        normalized = normalized.replace(' ', '')
-        normalized = normalized.replace('-', '')
-        normalized = normalized.replace('_', '')
-        normalized = normalized.replace("'", '')
-        normalized = normalized.strip()
+        # Steps 1+3: Basic normalization and alias lookup (memoized, see _commodity_key)
+        normalized = self._commodity_key(commodity)
         
         # Step 2: Check if this is a salvage item (not tradeable)
         if normalized in SALVAGE_ITEMS:
@@ -717,6 +2682,23 @@ class COVINANCE(PluginBase):
                 f"not traded at stations. Turn in at Search & Rescue contacts."
             )
         
+        return normalized
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _commodity_key(name: str) -> str:
+        """
+        Alias-resolved match key for any commodity name (user input or API name).
+        
+        Memoized: the ~400 API commodity names and repeated voice inputs are
+        normalized once, after that every row comparison is one cache lookup.
+        Salvage items keep their plain normalized name (no alias applied).
+        """
+        # Step 1: Lowercase, remove spaces/hyphens/underscores/apostrophes, strip whitespace
+        normalized = name.lower().translate(COVINANCE.COMMODITY_STRIP_TABLE).strip()
+        if normalized in SALVAGE_ITEMS:
+            return normalized
+        
         # Step 3: Apply alias if it exists, otherwise return normalized name
         #   - 100 validated aliases for name mismatches
         #   - 286 commodities work directly without alias
@@ -739,24 +2721,14 @@ class COVINANCE(PluginBase):
         Returns:
             True if they match (considering aliases), False otherwise
         """
-        try:
-            # Normalize both using the SAME method (symmetric!)
-            normalized_user = self._normalize_commodity_name(user_input)
-            # Apply same normalization to API name - this handles aliases too
-            try:
-                normalized_api = self._normalize_commodity_name(api_commodity_name)
-            except ValueError:
-                # If API name is invalid (e.g., salvage), just normalize without aliases
-                normalized_api = api_commodity_name.lower().replace(' ', '').replace('-', '').replace('_', '').replace("'", '')
-            
-            # Now simple direct comparison works!
-            # Both "azure milk" and "blue milk" will normalize to "bluemilk"
-            # And API "Azure Milk" will also normalize to "bluemilk"
-            return normalized_user == normalized_api
-            
-        except ValueError:
-            # If normalization fails (e.g., salvage item), no match
+        # Normalize both using the SAME memoized key (symmetric!)
+        # Both "azure milk" and "blue milk" will normalize to "bluemilk"
+        # And API "Azure Milk" will also normalize to "bluemilk"
+        normalized_user = self._commodity_key(user_input)
+        if normalized_user in SALVAGE_ITEMS:
+            # Salvage items are never traded - no match
             return False
+        return normalized_user == self._commodity_key(api_commodity_name)
     
     def _normalize_service_name(self, service: str) -> str:
         """
@@ -920,6 +2892,11 @@ class COVINANCE(PluginBase):
             dict with 'x', 'y', 'z' keys, or None if not found
         """
         try:
+            # Local galaxy index first (filled from earlier responses and Journal StarPos)
+            local = self.galaxy_index.coordinates(system_name)
+            if local is not None:
+                return {'x': local[0], 'y': local[1], 'z': local[2]}
+            
             endpoint = f'/system/name/{quote(system_name)}'
             response = self.call_ardent_api(endpoint, {})
             
@@ -935,6 +2912,41 @@ class COVINANCE(PluginBase):
             log('error', f'COVINANCE _get_system_coordinates error for {system_name}: {str(e)}')
             return None
     
+    def _get_nearby_systems(self, system_name: str, max_distance: float):
+        """
+        Systems within max_distance of a system (same row shape as /system/name/{x}/nearby).
+        
+        Answered from the local galaxy index when an earlier sweep already covers
+        the whole sphere, otherwise fetched from the API and recorded as coverage.
+        
+        Returns:
+            List of {systemName, distance, systemX, systemY, systemZ}, or the API error dict
+        """
+        center = self.galaxy_index.coordinates(system_name)
+        if center is not None and self.galaxy_index.is_covered(center, max_distance):
+            rows = [
+                {'systemName': name, 'distance': distance, 'systemX': x, 'systemY': y, 'systemZ': z}
+                for name, distance, x, y, z in self.galaxy_index.query_radius(center, max_distance)
+                if name.lower() != system_name.lower()
+            ]
+            log('info', f'COVINANCE: Nearby systems for {system_name} ({max_distance}ly) served from galaxy index - {len(rows)} systems')
+            return rows
+        
+        response = self.call_ardent_api(f'/system/name/{quote(system_name)}/nearby', {'maxDistance': max_distance})
+        
+        if isinstance(response, list):
+            self.galaxy_index.ingest(response)
+            if center is None:
+                center = self.galaxy_index.coordinates(system_name)
+            # Only a complete, coordinate-carrying answer can stand in for future queries
+            complete = len(response) < self.galaxy_index.NEARBY_RESULT_CAP and all(
+                r.get('systemX') is not None for r in response
+            )
+            if center is not None and complete:
+                self.galaxy_index.add_coverage(center, max_distance)
+        
+        return response
+    
     @override
     def register_actions(self, helper: PluginHelper):
         """Register all plugin actions"""
@@ -1666,6 +3678,10 @@ class COVINANCE(PluginBase):
                     "reference_system": {
                         "type": "string",
                         "description": "System to search from (optional, defaults to current location)"
+                    },
+                    "full_market": {
+                        "type": "boolean",
+                        "description": "Scan every commodity in every nearby system instead of the default sample of high-value metals (default: false). Use when user asks for 'all commodities', 'full market scan', 'everything nearby'."
                     }
                 },
                 "required": []
@@ -1778,7 +3794,7 @@ class COVINANCE(PluginBase):
                 "properties": {
                     "num_hops": {
                         "type": "integer",
-                        "description": "Number of commodity swaps (default: 3)"
+                        "description": "Number of commodity swaps (1-8, default: 3)"
                     },
                     "max_distance": {
                         "type": "integer",
@@ -1879,6 +3895,10 @@ class COVINANCE(PluginBase):
                     "min_pad_size": {
                         "type": "integer",
                         "description": "Minimum landing pad size: 1=small, 2=medium, 3=large (optional, auto from Journal)"
+                    },
+                    "max_results": {
+                        "type": "integer",
+                        "description": "Stop after this many safe stations are found (default: 10)"
                     }
                 },
                 "required": []
@@ -1934,6 +3954,9 @@ class COVINANCE(PluginBase):
             log('info', f'COVINANCE: Current location: {self.current_system}')
         else:
             log('warning', 'COVINANCE: Could not determine current system from Journal')
+        
+        # Warm the cache in the background after every jump/dock
+        self.prefetcher.start()
     
     @override
     def on_chat_stop(self, helper: PluginHelper):
@@ -1995,124 +4018,248 @@ class COVINANCE(PluginBase):
             return ""
     
     def update_location_from_journal(self):
-        """Read current system and station from ED Journal"""
+        """Read current system and station from ED Journal (incremental - only new lines are parsed)"""
         try:
-            journal_file = self.get_latest_journal_file()
-            if not journal_file:
-                return
+            self.journal_tailer.poll()
+            location = self.journal_tailer.get_location()
             
-            log('info', f'COVINANCE: Reading journal: {os.path.basename(journal_file)}')
-            
-            # Read journal file line by line (newest events at end)
-            with open(journal_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            # Process events in reverse order to find most recent location
-            for line in reversed(lines):
-                try:
-                    event = json.loads(line.strip())
-                    event_type = event.get('event', '')
-                    
-                    # Location event (current system when loading game)
-                    if event_type == 'Location':
-                        self.current_system = event.get('StarSystem')
-                        self.current_station = event.get('StationName')
-                        coords = event.get('StarPos')
-                        if coords:
-                            self.system_coordinates = {
-                                'x': coords[0],
-                                'y': coords[1],
-                                'z': coords[2]
-                            }
-                        log('info', f'COVINANCE: Found Location event - System: {self.current_system}')
-                        return
-                    
-                    # FSDJump event (jumping to new system)
-                    elif event_type == 'FSDJump':
-                        self.current_system = event.get('StarSystem')
-                        self.current_station = None  # Left station when jumping
-                        coords = event.get('StarPos')
-                        if coords:
-                            self.system_coordinates = {
-                                'x': coords[0],
-                                'y': coords[1],
-                                'z': coords[2]
-                            }
-                        log('info', f'COVINANCE: Found FSDJump event - System: {self.current_system}')
-                        return
-                    
-                    # Docked event (docked at station)
-                    elif event_type == 'Docked':
-                        self.current_station = event.get('StationName')
-                        self.current_system = event.get('StarSystem')
-                        log('info', f'COVINANCE: Found Docked event - Station: {self.current_station}')
-                        return
-                    
-                except json.JSONDecodeError:
-                    continue
-                except Exception as e:
-                    log('error', f'COVINANCE: Error parsing journal line: {str(e)}')
-                    continue
+            if not location:
+                log('warning', 'COVINANCE: No location events found in journal')
+                return
             
-            log('warning', 'COVINANCE: No location events found in journal')
+            self._apply_journal_location(location)
             
         except Exception as e:
             log('error', f'COVINANCE: Error reading journal: {str(e)}')
     
+    def _apply_journal_location(self, location: dict):
+        """Adopt a Journal location (system, station, StarPos) as the current position"""
+        if not location or not location.get('system'):
+            return
+        if location['system'] != self.current_system:
+            self.system_coordinates = None  # Don't carry the previous system's StarPos over
+        self.current_system = location['system']
+        self.current_station = location.get('station')
+        if location.get('coordinates'):
+            self.system_coordinates = location['coordinates']
+            coords = location['coordinates']
+            self.galaxy_index.add_system(self.current_system, coords['x'], coords['y'], coords['z'])
+    
+    def _state_snapshot(self, args: dict, projected_states: dict) -> dict:
+        """
+        Game state for one action invocation: location and ship stats.
+        
+        Read from COVAS projected_states (no file I/O), with the Journal polled only
+        for missing fields. Delegating actions pass it on as args['_state_snapshot'],
+        so one voice command resolves state once however many actions it chains through.
+        
+        Returns:
+            {'location': {...}, 'ship': {CargoCapacity, Credits, MaxJumpRange, CurrentCargo, ShipType}}
+        """
+        snapshot = args.get('_state_snapshot')
+        if snapshot is not None:
+            return snapshot
+        
+        self._refresh_game_files()
+        snapshot = self.state_provider.snapshot(projected_states)
+        self._apply_journal_location(snapshot['location'])
+        return snapshot
+    
+    def _prefetch_neighbourhood(self, location: dict):
+        """
+        Prefetch plan for a new position (run by NeighbourhoodPrefetcher).
+        
+        Warms, in order: the system's station list, plain exports/imports, exports
+        with the ship's trade filters (best trade from here) and the route engine's
+        trade-filtered buy/sell rows; the nearby-systems sphere; then the same
+        station list, plain and route engine market keys for the closest
+        neighbours. Yields after every request so the plan can be stopped between them.
+        """
+        system = location.get('system')
+        if not system:
+            return
+        ship = self.journal_tailer.get_ship_data()
+        ship_type = ship.get('ShipType', '')
+        required_pad = self._get_landing_pad_size(ship_type) if ship_type else 'S'
+        radius = max(self.PREFETCH_RADIUS, ship.get('MaxJumpRange') or 0)
+        
+        # Same endpoint/params/view as the actions (default filters), so their first lookup is a cache hit
+        trade_params = self._trade_market_params(required_pad, False, True)
+        calls = self._prefetch_system_calls(system, trade_params)
+        calls.insert(3, (f'/system/name/{quote(system)}/commodities/exports', trade_params, None))
+        for endpoint, params, view in calls:
+            self.call_ardent_api(endpoint, params, view)
+            yield
+        
+        nearby = self._get_nearby_systems(system, radius)
+        yield
+        if not isinstance(nearby, list):
+            return
+        
+        neighbours = sorted(
+            (row for row in nearby if row.get('systemName') and row['systemName'].lower() != system.lower()),
+            key=lambda row: row.get('distance') or 0
+        )[:self.PREFETCH_NEIGHBOURS]
+        for row in neighbours:
+            for endpoint, params, view in self._prefetch_system_calls(row['systemName'], trade_params):
+                self.call_ardent_api(endpoint, params, view)
+                yield
+    
+    def _prefetch_system_calls(self, system: str, trade_params: dict) -> list:
+        """
+        Station metadata, full market listings and route engine market rows for one
+        system as (endpoint, params, view) - the route engine keys match _fetch_market_index
+        """
+        return [
+            (f'/system/name/{quote(system)}/stations', None, None),
+            (f'/system/name/{quote(system)}/commodities/exports', {}, None),
+            (f'/system/name/{quote(system)}/commodities/imports', {}, None),
+            (f'/system/name/{quote(system)}/commodities/exports', trade_params, 'buy'),
+            (f'/system/name/{quote(system)}/commodities/imports', trade_params, 'sell'),
+        ]
+    
+    def _refresh_game_files(self):
+        """Poll Market.json/Cargo.json/Status.json - a new Market.json is injected into the cache"""
+        try:
+            changed = self.game_files.poll()
+        except Exception as e:
+            log('error', f'COVINANCE: Error reading game files: {str(e)}')
+            return
+        if 'Market.json' not in changed:
+            return
+        
+        market = self.game_files.get_market()
+        age = self._market_age(market)
+        if age is None or age >= self.LIVE_MARKET_TTL:
+            return  # Left over from an earlier visit - Ardent is at least as fresh
+        self.reliability_client.inject(f"/market/{market['market_id']}/commodities", {},
+                                       MarketRow.pack(market['rows']), ttl=int(self.LIVE_MARKET_TTL - age))
+        log('info', f"COVINANCE: Live market loaded from Market.json - {market['station']} ({len(market['rows'])} commodities)")
+    
+    @staticmethod
+    def _parse_timestamp(value):
+        """ISO timestamp ('...Z' or with offset) to aware datetime, None if missing/invalid"""
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    
+    def _market_age(self, market: dict):
+        """Seconds since the game wrote a parsed Market.json, None if unknown"""
+        from datetime import timezone
+        written = self._parse_timestamp(market['timestamp']) if market else None
+        if written is None or written.tzinfo is None:
+            return None
+        return max(0.0, (datetime.now(timezone.utc) - written).total_seconds())
+    
+    @staticmethod
+    def _normalize_station_name(name: str) -> str:
+        """Case- and whitespace-insensitive form of a station or system name"""
+        return ' '.join((name or '').casefold().split())
+    
+    def _live_station_market(self, station_name: str, system_name: str = ''):
+        """
+        Market rows for the station in Market.json if it is the one asked about.
+        
+        The station name must match exactly (ignoring case and spacing), and when
+        the Journal knows the MarketID of the station we are docked at, Market.json
+        must be for that market.
+        
+        Returns:
+            (system, station, rows) or None - rows come from the injected cache entry
+            while fresh, otherwise from Ardent's market endpoint (one call)
+        """
+        self._refresh_game_files()
+        market = self.game_files.get_market()
+        if not market or not market['station'] or not market['system']:
+            return None
+        if self._normalize_station_name(station_name) != self._normalize_station_name(market['station']):
+            return None
+        if system_name and self._normalize_station_name(system_name) != self._normalize_station_name(market['system']):
+            return None
+        
+        try:
+            self.journal_tailer.poll()
+        except Exception as e:
+            log('error', f'COVINANCE: Error reading journal: {str(e)}')
+        docked_market = self.journal_tailer.get_location().get('market_id')
+        if docked_market and docked_market != market['market_id']:
+            return None  # Market.json is left over from another station
+        
+        rows = self.call_ardent_api(f"/market/{market['market_id']}/commodities", {})
+        if not isinstance(rows, list):
+            return None
+        return market['system'], market['station'], rows
+    
+    def _overlay_live_market(self, endpoint: str, params: dict, data):
+        """
+        Replace the Market.json station's rows in a system exports/imports response with live ones.
+        
+        Only applies when the live file is newer than every Ardent row for that
+        market. Static station fields (pad size, distances, coordinates) are taken
+        from the Ardent rows, so a station the response filtered out stays out.
+        """
+        from urllib.parse import unquote
+        
+        market = self.game_files.get_market()
+        if not market or not market['system'] or not isinstance(data, list) or not data:
+            return data
+        prefix = f"/system/name/{market['system']}/commodities/".lower()
+        path = unquote(endpoint).lower()
+        side = path[len(prefix):] if path.startswith(prefix) else None
+        if side not in ('exports', 'imports'):
+            return data
+        
+        market_id = market['market_id']
+        current = [row for row in data if row.get('marketId') == market_id]
+        if not current:
+            return data  # Station not in this response (filters) or unknown to Ardent
+        live_time = self._parse_timestamp(market['timestamp'])
+        if live_time is None:
+            return data
+        for row in current:
+            updated = self._parse_timestamp(row.get('updatedAt'))
+            if updated is None or updated.tzinfo is None or updated >= live_time:
+                return data
+        
+        min_volume = (params or {}).get('minVolume') or 1
+        if side == 'exports':
+            live_rows = [r for r in market['rows'] if r['buyPrice'] > 0 and r['stock'] >= min_volume]
+        else:
+            live_rows = [r for r in market['rows'] if r['sellPrice'] > 0 and r['demand'] >= min_volume]
+        
+        template = dict(current[0].items())
+        merged = {}
+        for row in live_rows:
+            values = dict(template)
+            values.update(row)
+            merged[row['commodityName']] = MarketRow(values) if isinstance(current[0], MarketRow) else values
+        
+        overlaid = []
+        for row in data:
+            if row.get('marketId') != market_id:
+                overlaid.append(row)
+                continue
+            live = merged.pop((row.get('commodityName') or '').lower(), None)
+            if live is not None:
+                overlaid.append(live)  # Rows that no longer qualify (sold out, no demand) are dropped
+        overlaid.extend(merged.values())
+        
+        log('info', f"COVINANCE: Live Market.json prices overlaid for {market['station']} ({side})")
+        return overlaid
+    
     def read_latest_journal(self) -> dict:
         """
-        Read ship stats from latest Journal events.
+        Read ship stats from latest Journal events (incremental - only new lines are parsed).
         Returns dict with: CargoCapacity, Credits, MaxJumpRange, CurrentCargo, ShipType
         """
         try:
-            journal_file = self.get_latest_journal_file()
-            if not journal_file:
-                log('warning', 'COVINANCE: No journal file found')
-                return {}
-            
-            ship_data = {}
-            
-            # Read journal file line by line
-            with open(journal_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            # Process events in reverse to get most recent data
-            for line in reversed(lines):
-                try:
-                    event = json.loads(line.strip())
-                    event_type = event.get('event', '')
-                    
-                    # Loadout event - has cargo capacity and ship stats
-                    if event_type == 'Loadout' and 'CargoCapacity' not in ship_data:
-                        ship_data['CargoCapacity'] = event.get('CargoCapacity', 0)
-                        ship_data['MaxJumpRange'] = event.get('MaxJumpRange', 0)
-                        ship_data['ShipType'] = event.get('Ship', '')
-                        log('info', f'COVINANCE: Found Loadout - Cargo: {ship_data["CargoCapacity"]}T, Jump: {ship_data.get("MaxJumpRange", 0):.1f}ly')
-                    
-                    # LoadGame event - has credits
-                    if event_type == 'LoadGame' and 'Credits' not in ship_data:
-                        ship_data['Credits'] = event.get('Credits', 0)
-                        log('info', f'COVINANCE: Found LoadGame - Credits: {ship_data["Credits"]:,}')
-                    
-                    # Cargo event - current cargo contents
-                    if event_type == 'Cargo' and 'CurrentCargo' not in ship_data:
-                        inventory = event.get('Inventory', [])
-                        total_cargo = sum([item.get('Count', 0) for item in inventory])
-                        ship_data['CurrentCargo'] = total_cargo
-                        log('info', f'COVINANCE: Found Cargo - Current: {total_cargo}T')
-                    
-                    # If we have all key data, stop searching
-                    if 'CargoCapacity' in ship_data and 'Credits' in ship_data and 'MaxJumpRange' in ship_data:
-                        break
-                        
-                except json.JSONDecodeError:
-                    continue
-                except Exception as e:
-                    continue
+            self.journal_tailer.poll()
+            ship_data = self.journal_tailer.get_ship_data()
             
-            if ship_data:
-                log('info', f'COVINANCE: Journal data extracted - {len(ship_data)} fields')
-            else:
+            if not ship_data:
                 log('warning', 'COVINANCE: No ship data found in journal')
             
             return ship_data
@@ -2121,47 +4268,167 @@ class COVINANCE(PluginBase):
             log('error', f'COVINANCE: Error reading journal stats: {str(e)}')
             return {}
     
-    def call_ardent_api(self, endpoint: str, params: dict = None) -> dict:
+    def _create_http_session(self) -> requests.Session:
+        """
+        Build the shared Ardent API session.
+        
+        Connection pool is sized to the parallel runner so every worker keeps its
+        own keep-alive connection (no TCP+TLS handshake per call during fan-outs).
+        """
+        from requests.adapters import HTTPAdapter
+        
+        # + 2 for foreground action threads calling alongside the workers
+        pool_size = self.parallel_runner.max_workers + 2
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_size)
+        
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update({
+            'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive'
+        })
+        return session
+    
+    def call_ardent_api(self, endpoint: str, params: dict = None, view: str = None, cancel=None) -> dict:
         """
         Call Ardent API endpoint with caching and retry
         
         Args:
             endpoint: API endpoint path (e.g., '/system/name/Sol')
             params: Optional query parameters
+            view: Optional ROW_VIEWS name - list responses are decoded as a stream,
+                  keeping only matching rows and the view's fields
+            cancel: Optional threading.Event set by an async fan-out at its deadline -
+                    the fetch stops before sending or between body chunks
         
         Returns:
             API response as dictionary, or error dict
         """
         # Define the original fetch logic as a nested function
+        self.prefetcher.interrupt()  # Foreground request - background prefetch yields
+        
         def _fetch(ep, prm):
+            import time
             try:
                 url = f"{self.api_base_url}{ep}"
                 
                 log('info', f'COVINANCE: API call: {ep}')
                 
-                # Make request
-                response = requests.get(url, params=prm, timeout=10)
-                
-                if response.status_code == 200:
-                    return response.json()
-                elif response.status_code == 404:
-                    return {"error": "Not found", "status_code": 404}
-                else:
-                    log('error', f'COVINANCE: API error - Status {response.status_code}')
-                    return {"error": f"API request failed: {response.status_code}", "status_code": response.status_code}
+                # Shared per-host rate limit (voice-query requests skip the queue)
+                wait = self.rate_limiter.reserve(self.parallel_runner.current_lane() in (None, 'interactive'))
+                if wait:
+                    cancel.wait(wait) if cancel is not None else time.sleep(wait)
+                if cancel is not None and cancel.is_set():
+                    raise FetchCancelled(ep)
+                
+                # Make request (pooled keep-alive session) - cancellable fetches read the body in chunks
+                streamed = view is not None or cancel is not None
+                with self.http_session.get(url, params=prm, timeout=10, stream=streamed) as response:
+                    if response.status_code == 200:
+                        self.rate_limiter.reward()
+                        data = self._decode_streamed(response, view, cancel) if streamed else response.json()
+                        self.galaxy_index.ingest(data)  # Learn coordinates from every response
+                        if isinstance(data, list) and ('/exports' in ep or '/imports' in ep):
+                            data = MarketRow.pack(data)  # Compact cached form (streamed rows already are)
+                        return data
+                    elif response.status_code == 404:
+                        return {"error": "Not found", "status_code": 404}
+                    elif response.status_code in (429, 503):
+                        # Throttled - slow the shared bucket and retry after the server's delay
+                        retry_after = TokenBucket.parse_retry_after(response.headers.get('Retry-After'))
+                        self.rate_limiter.penalize(retry_after)
+                        log('warning', f'COVINANCE: API throttled - Status {response.status_code} (Retry-After: {retry_after})')
+                        raise TransientApiError(f"API request failed: {response.status_code}",
+                                                response.status_code, retry_after)
+                    elif response.status_code >= 500:
+                        log('error', f'COVINANCE: API error - Status {response.status_code}')
+                        raise TransientApiError(f"API request failed: {response.status_code}", response.status_code)
+                    else:
+                        log('error', f'COVINANCE: API error - Status {response.status_code}')
+                        return {"error": f"API request failed: {response.status_code}", "status_code": response.status_code}
             
+            except TransientApiError:
+                raise  # Retried by the reliability layer
+            except FetchCancelled:
+                raise  # Fan-out deadline - not an API error
             except requests.exceptions.Timeout:
                 log('error', 'COVINANCE: API request timeout')
-                return {"error": "Request timeout - check internet connection"}
+                raise TransientApiError("Request timeout - check internet connection")
             except requests.exceptions.ConnectionError:
                 log('error', 'COVINANCE: API connection error')
-                return {"error": "Connection error - check internet connection"}
+                raise TransientApiError("Connection error - check internet connection")
             except Exception as e:
                 log('error', f'COVINANCE: API error: {str(e)}')
                 return {"error": str(e)}
         
-        # Wrap with reliability layer (caching + retry)
-        return self.reliability_client.get_cached_or_fetch(endpoint, params, _fetch)
+        # Wrap with reliability layer (caching + retry), live Market.json prices on top
+        result = self.reliability_client.get_cached_or_fetch(endpoint, params, _fetch, view)
+        return self._overlay_live_market(endpoint, params, result)
+    
+    def _decode_streamed(self, response, view: str = None, cancel=None):
+        """
+        Decode a JSON response chunk by chunk, applying a row view as array elements arrive.
+        
+        Top-level arrays are parsed one element at a time (see JsonRowStream), so
+        filtered-out rows and unused fields are never held as a full list of dicts.
+        Kept rows are returned as compact MarketRow records.
+        Anything else (error objects, single records) is decoded whole.
+        Without a view rows are kept whole; a set cancel event stops the read between chunks.
+        """
+        fields, keep = self.ROW_VIEWS[view] if view else (None, None)
+        stream = JsonRowStream(fields, keep)
+        for chunk in response.iter_content(chunk_size=self.STREAM_CHUNK_BYTES):
+            if cancel is not None and cancel.is_set():
+                raise FetchCancelled(response.url)
+            stream.feed(chunk)
+        return stream.finish()
+    
+    def _fetch_interactive(self, calls: list) -> list:
+        """
+        Fetch the few endpoints a voice response is waiting on, in parallel on the interactive lane.
+        
+        Args:
+            calls: [(endpoint, params)]
+        
+        Returns:
+            Results aligned with calls (API data or error dict)
+        """
+        results = [{"error": "Request failed"}] * len(calls)
+        loaded, errors, abandoned = self.parallel_runner.run_batch(
+            [lambda i=i: (i, self.call_ardent_api(*calls[i])) for i in range(len(calls))], lane='interactive'
+        )
+        for i, data in loaded:
+            results[i] = data
+        return results
+    
+    def _fetch_many(self, calls: list, time_budget: float = None) -> list:
+        """
+        Fetch many endpoints concurrently as asyncio tasks, with an overall deadline.
+        
+        Each call goes through call_ardent_api - cache, in-flight dedup, stale copies,
+        retries, the shared per-host rate limit, the live Market.json overlay and the
+        pooled keep-alive session - so a batch result is exactly what a single call
+        would return. An asyncio.Semaphore bounds the calls in flight (see
+        AsyncArdentClient). Tasks still pending at the deadline are cancelled: queued
+        calls never start, running ones stop before sending or between body chunks.
+        
+        Args:
+            calls: [(endpoint, params, view)] - view is a ROW_VIEWS name or None
+            time_budget: Seconds for the whole batch (default: FANOUT_TIME_BUDGET)
+        
+        Returns:
+            Results aligned with calls: API data, error dict, or None if cut off by the deadline
+        """
+        self.prefetcher.interrupt()  # Foreground request - background prefetch yields
+        time_budget = self.FANOUT_TIME_BUDGET if time_budget is None else time_budget
+        
+        results = self.async_client.fetch_many(self.call_ardent_api, calls, time_budget)
+        
+        loaded = sum(1 for result in results if result is not None)
+        log('info', f'COVINANCE: Fan-out batch - {loaded}/{len(calls)} loaded, {len(calls) - loaded} cut off or failed')
+        return results
 
     def format_time_ago(self, timestamp_str: str) -> str:
         """Format timestamp as 'X hours/minutes ago'"""
@@ -2380,8 +4647,8 @@ class COVINANCE(PluginBase):
         try:
             log('info', 'COVINANCE: Getting current location from Journal')
             
-            # Update location from journal
-            self.update_location_from_journal()
+            # Update location (projected state, Journal fallback)
+            self._state_snapshot(args, projected_states)
             
             if not self.current_system:
                 return "COVINANCE: Unable to determine current location from Elite Dangerous Journal. Make sure the game is running."
@@ -2860,7 +5127,7 @@ class COVINANCE(PluginBase):
                 # If it's a salvage item, return the helpful error message
                 return f"COVINANCE: {str(e)}"
             # Get Journal data for pad size
-            journal_data = self.read_latest_journal()
+            journal_data = self._state_snapshot(args, projected_states)['ship']
             ship_type = journal_data.get('ShipType', '') if journal_data else ''
             
             # v7.2: Determine required pad size from ship type or override
@@ -3031,7 +5298,7 @@ class COVINANCE(PluginBase):
                 # If it's a salvage item, return the helpful error message
                 return f"COVINANCE: {str(e)}"
             # Get Journal data for pad size
-            journal_data = self.read_latest_journal()
+            journal_data = self._state_snapshot(args, projected_states)['ship']
             ship_type = journal_data.get('ShipType', '') if journal_data else ''
             
             # v7.2: Determine required pad size from ship type or override
@@ -3436,8 +5703,14 @@ class COVINANCE(PluginBase):
             station_system = None
             exact_station_name = station_name
             
+            # Docked here - Market.json already holds this station's live market
+            live_market = self._live_station_market(station_name, system_name)
+            if live_market is not None:
+                station_system, exact_station_name, market_rows = live_market
+                log('info', f'COVINANCE: Using live Market.json data for {exact_station_name}')
+            
             # If system provided, use it directly (fast path)
-            if system_name:
+            elif system_name:
                 log('info', f'COVINANCE: System name provided: {system_name}')
                 station_system = system_name
             else:
@@ -3486,23 +5759,26 @@ class COVINANCE(PluginBase):
             
             log('info', f'COVINANCE: Querying market data for {exact_station_name} in {station_system}')
             
-            # Step 2: Get all exports (buyable) at this station
-            exports_endpoint = f'/system/name/{quote(station_system)}/commodities/exports'
-            exports_response = self.call_ardent_api(exports_endpoint, {})
-            
-            # Step 3: Get all imports (sellable) at this station
-            imports_endpoint = f'/system/name/{quote(station_system)}/commodities/imports'
-            imports_response = self.call_ardent_api(imports_endpoint, {})
-            
-            # Filter by station
-            station_exports = []
-            station_imports = []
-            
-            if isinstance(exports_response, list):
-                station_exports = [o for o in exports_response if o.get('stationName', '').lower() == exact_station_name.lower()]
-            
-            if isinstance(imports_response, list):
-                station_imports = [o for o in imports_response if o.get('stationName', '').lower() == exact_station_name.lower()]
+            if live_market is not None:
+                station_exports = [o for o in market_rows if o.get('buyPrice', 0) > 0 and o.get('stock', 0) > 0]
+                station_imports = [o for o in market_rows if o.get('sellPrice', 0) > 0 and o.get('demand', 0) > 0]
+            else:
+                # Step 2 + 3: All exports (buyable) and imports (sellable) in the system, fetched together
+                exports_endpoint = f'/system/name/{quote(station_system)}/commodities/exports'
+                imports_endpoint = f'/system/name/{quote(station_system)}/commodities/imports'
+                exports_response, imports_response = self._fetch_interactive(
+                    [(exports_endpoint, {}), (imports_endpoint, {})]
+                )
+                
+                # Filter by station
+                station_exports = []
+                station_imports = []
+                
+                if isinstance(exports_response, list):
+                    station_exports = [o for o in exports_response if o.get('stationName', '').lower() == exact_station_name.lower()]
+                
+                if isinstance(imports_response, list):
+                    station_imports = [o for o in imports_response if o.get('stationName', '').lower() == exact_station_name.lower()]
             
             # ✅ NEW: Filter by commodity if specified
             commodity_filter = args.get('commodity_name', '')
@@ -3515,11 +5791,11 @@ class COVINANCE(PluginBase):
                 # Filter exports/imports using bidirectional matching
                 filtered_exports = [
                     o for o in station_exports 
-                    if self._matches_commodity(commodity_filter, o.get('commodityName', ''))
+                    if self._commodity_key(o.get('commodityName', '')) == normalized_commodity
                 ]
                 filtered_imports = [
                     o for o in station_imports 
-                    if self._matches_commodity(commodity_filter, o.get('commodityName', ''))
+                    if self._commodity_key(o.get('commodityName', '')) == normalized_commodity
                 ]
                 
                 # Check if commodity found
@@ -3629,7 +5905,7 @@ class COVINANCE(PluginBase):
             # Filter for the specific commodity if querying by system
             if system_name:
                 # ✅ FIX: Use bidirectional matching instead of direct comparison
-                api_response = [o for o in api_response if self._matches_commodity(commodity_name, o.get('commodityName', ''))]
+                api_response = [o for o in api_response if self._commodity_key(o.get('commodityName', '')) == normalized_commodity]
                 if len(api_response) == 0:
                     return f"COVINANCE: {commodity_name.title()} not found in {system_name} system."
             
@@ -3972,7 +6248,7 @@ class COVINANCE(PluginBase):
                 # ✅ FIX: Use bidirectional matching instead of direct comparison
                 matching_orders = [
                     o for o in buy_response 
-                    if self._matches_commodity(commodity_name, o.get('commodityName', ''))
+                    if self._commodity_key(o.get('commodityName', '')) == commodity_normalized
                     and o.get('stationName', '').lower() == buy_station_exact.lower()
                 ]
                 
@@ -3999,7 +6275,7 @@ class COVINANCE(PluginBase):
                 # ✅ FIX: Use bidirectional matching instead of direct comparison
                 matching_orders = [
                     o for o in sell_response 
-                    if self._matches_commodity(commodity_name, o.get('commodityName', ''))
+                    if self._commodity_key(o.get('commodityName', '')) == commodity_normalized
                     and o.get('stationName', '').lower() == sell_station_exact.lower()
                 ]
                 
@@ -4198,7 +6474,7 @@ class COVINANCE(PluginBase):
             commodity_normalized = self._normalize_commodity_name(commodity_name)
             
             # Get Journal data for smart defaults
-            journal_data = self.read_latest_journal()
+            journal_data = self._state_snapshot(args, projected_states)['ship']
             ship_type = journal_data.get('ShipType', '') if journal_data else ''
             jump_range = journal_data.get('MaxJumpRange', 20) if journal_data else 20
             
@@ -4212,7 +6488,6 @@ class COVINANCE(PluginBase):
             max_distance = args.get('max_distance', jump_range)
             
             if not reference_system:
-                self.update_location_from_journal()
                 if not self.current_system:
                     return "COVINANCE: Unable to determine your location. Specify a system or dock somewhere first."
                 reference_system = self.current_system
@@ -4473,7 +6748,7 @@ class COVINANCE(PluginBase):
             commodity_normalized = self._normalize_commodity_name(commodity_name)
             
             # Get Journal data for smart defaults
-            journal_data = self.read_latest_journal()
+            journal_data = self._state_snapshot(args, projected_states)['ship']
             ship_type = journal_data.get('ShipType', '') if journal_data else ''
             jump_range = journal_data.get('MaxJumpRange', 20) if journal_data else 20
             
@@ -4487,7 +6762,6 @@ class COVINANCE(PluginBase):
             max_distance = args.get('max_distance', jump_range)
             
             if not reference_system:
-                self.update_location_from_journal()
                 if not self.current_system:
                     return "COVINANCE: Unable to determine your location. Specify a system or dock somewhere first."
                 reference_system = self.current_system
@@ -4747,10 +7021,7 @@ class COVINANCE(PluginBase):
             
             log('info', f'COVINANCE: Finding systems near {system_name} within {max_distance}ly')
             
-            endpoint = f'/system/name/{quote(system_name)}/nearby'
-            params = {'maxDistance': max_distance}
-            
-            response = self.call_ardent_api(endpoint, params)
+            response = self._get_nearby_systems(system_name, max_distance)
             
             if "error" in response:
                 if response.get('status_code') == 404:
@@ -4806,7 +7077,7 @@ class COVINANCE(PluginBase):
             
             # Get reference system (current location if not specified)
             if not reference_system:
-                self.update_location_from_journal()
+                self._state_snapshot(args, projected_states)
                 if not self.current_system:
                     return "COVINANCE: Unable to determine your current location. Dock somewhere or specify a reference system."
                 reference_system = self.current_system
@@ -4836,7 +7107,7 @@ class COVINANCE(PluginBase):
             result.append(f"\n\n📏 {distance:.2f} light-years")
             
             # Add context if within jump range
-            journal_data = self.read_latest_journal()
+            journal_data = self._state_snapshot(args, projected_states)['ship']
             if journal_data and 'MaxJumpRange' in journal_data:
                 max_jump = journal_data['MaxJumpRange']
                 if distance <= max_jump:
@@ -4867,8 +7138,7 @@ class COVINANCE(PluginBase):
             exports_endpoint = f'/system/name/{quote(system_name)}/commodities/exports'
             imports_endpoint = f'/system/name/{quote(system_name)}/commodities/imports'
         
-            exports = self.call_ardent_api(exports_endpoint, {})
-            imports = self.call_ardent_api(imports_endpoint, {})
+            exports, imports = self._fetch_interactive([(exports_endpoint, {}), (imports_endpoint, {})])
         
             if "error" in exports and "error" in imports:
                 if exports.get('status_code') == 404:
@@ -5029,7 +7299,7 @@ class COVINANCE(PluginBase):
             show_all_pad_sizes = args.get('show_all_pad_sizes', False)
             
             # Get Batch 1 critical parameters from Journal
-            journal_data = self.read_latest_journal()
+            journal_data = self._state_snapshot(args, projected_states)['ship']
             ship_type = journal_data.get('ShipType', '')
             required_pad = self._get_landing_pad_size(ship_type) if ship_type else 'S'
             jump_range = journal_data.get('MaxJumpRange', 20)
@@ -5062,64 +7332,76 @@ class COVINANCE(PluginBase):
             if not include_surface:
                 exports = [e for e in exports if e.get('stationType') != 'OnFootSettlement']
             
-            total_exports = len(exports)
+            # One nearby/imports lookup per commodity - keep the cheapest local buy
+            # (dict preserves API order, so highest-stock commodities are dispatched first)
+            best_exports = {}
+            for export in exports:
+                commodity = export.get('commodityName', '')
+                buy_price = export.get('buyPrice', 0)
+                if not commodity or buy_price == 0:
+                    continue
+                current = best_exports.get(commodity)
+                if current is None or buy_price < current.get('buyPrice', 0):
+                    best_exports[commodity] = export
             
-            # For each commodity, find best sell price nearby
-            opportunities = []
-            commodities_checked = 0
+            total_exports = len(best_exports)
+            
+            nearby_params = {
+                'maxDistance': max_distance,
+                'minVolume': 1,  # API default: no arbitrary restriction
+                'minLandingPadSize': 'S' if show_all_pad_sizes else required_pad,
+                'maxDaysAgo': 365,
+                'fleetCarriers': str(include_carriers).lower()
+            }
             
-            for export in exports[:10]:  # Check top 10 commodities by stock
+            def _check_commodity(export):
+                """Best nearby sell for one export"""
                 commodity = export.get('commodityName', '')
                 buy_price = export.get('buyPrice', 0)
-                buy_station = export.get('stationName', '')
-                buy_station_type = export.get('stationType', '')
-                
-                if buy_price == 0:
-                    continue
-                
-                commodities_checked += 1
                 
                 # Find nearby sell opportunities with pad filtering
                 nearby_endpoint = f'/system/name/{self.current_system}/commodity/name/{commodity}/nearby/imports'
-                nearby_params = {
-                    'maxDistance': max_distance,
-                    'minVolume': 1,  # API default: no arbitrary restriction
-                    'minLandingPadSize': 'S' if show_all_pad_sizes else required_pad,
-                    'maxDaysAgo': 365,
-                    'fleetCarriers': str(include_carriers).lower()
-                }
-                
                 nearby_sells = self.call_ardent_api(nearby_endpoint, nearby_params)
                 
-                if isinstance(nearby_sells, list) and len(nearby_sells) > 0:
-                    # Client-side filter for surface stations if needed
-                    if not include_surface:
-                        nearby_sells = [s for s in nearby_sells if s.get('stationType') != 'OnFootSettlement']
-                    
-                    if len(nearby_sells) == 0:
-                        continue
-                    
-                    # Get best sell price
-                    best_sell = max(nearby_sells, key=lambda x: x.get('sellPrice', 0))
-                    sell_price = best_sell.get('sellPrice', 0)
-                    sell_station = best_sell.get('stationName', '')
-                    sell_system = best_sell.get('systemName', '')
-                    distance = best_sell.get('distance', 0)
-                    
-                    profit = sell_price - buy_price
-                    
-                    # Only filter if min_profit explicitly set
-                    if not min_profit or profit >= min_profit:
-                        opportunities.append({
-                            'commodity': commodity,
-                            'buy_price': buy_price,
-                            'buy_station': buy_station,
-                            'sell_price': sell_price,
-                            'sell_station': sell_station,
-                            'sell_system': sell_system,
-                            'profit': profit,
-                            'distance': distance
-                        })
+                if not isinstance(nearby_sells, list) or len(nearby_sells) == 0:
+                    return (commodity, None)
+                
+                # Client-side filter for surface stations if needed
+                if not include_surface:
+                    nearby_sells = [s for s in nearby_sells if s.get('stationType') != 'OnFootSettlement']
+                
+                if len(nearby_sells) == 0:
+                    return (commodity, None)
+                
+                # Get best sell price
+                best_sell = max(nearby_sells, key=lambda x: x.get('sellPrice', 0))
+                sell_price = best_sell.get('sellPrice', 0)
+                profit = sell_price - buy_price
+                
+                # Only filter if min_profit explicitly set
+                if min_profit and profit < min_profit:
+                    return (commodity, None)
+                
+                return (commodity, {
+                    'commodity': commodity,
+                    'buy_price': buy_price,
+                    'buy_station': export.get('stationName', ''),
+                    'sell_price': sell_price,
+                    'sell_station': best_sell.get('stationName', ''),
+                    'sell_system': best_sell.get('systemName', ''),
+                    'profit': profit,
+                    'distance': best_sell.get('distance', 0)
+                })
+            
+            # Fan out all commodities in parallel - whatever finishes within the time budget is used
+            tasks = [lambda e=export: _check_commodity(e) for export in best_exports.values()]
+            checked, errors, abandoned = self.parallel_runner.run_batch(tasks, deadline=self.FANOUT_TIME_BUDGET)
+            
+            commodities_checked = len(checked)
+            opportunities = [opp for _, opp in checked if opp is not None]
+            
+            if commodities_checked < total_exports:
+                log('info', f'COVINANCE: Time budget reached - checked {commodities_checked}/{total_exports} commodities')
             
             # Build response with transparent scope
             import re
@@ -5204,7 +7486,7 @@ class COVINANCE(PluginBase):
             show_all_pad_sizes = args.get('show_all_pad_sizes', False)
             
             # Get Batch 1 critical parameters from Journal
-            journal_data = self.read_latest_journal()
+            journal_data = self._state_snapshot(args, projected_states)['ship']
             ship_type = journal_data.get('ShipType', '')
             required_pad = self._get_landing_pad_size(ship_type) if ship_type else 'S'
             jump_range = journal_data.get('MaxJumpRange', 20) if journal_data else 20
@@ -5385,6 +7667,246 @@ class COVINANCE(PluginBase):
             log('error', f'COVINANCE trade_route error: {str(e)}')
             return f"COVINANCE: Error finding route - {str(e)}"
     
+    def _fetch_commodity_sides(self, reference_system: str, commodities: list, max_distance: float,
+                               required_pad: str, show_all_pad_sizes: bool, include_carriers: bool,
+                               include_surface: bool = True) -> dict:
+        """
+        Nearby buy and sell rows per commodity, fetched in parallel.
+        
+        Returns:
+            {commodity: (buy rows, sell rows)}
+        """
+        params = {
+            'maxDistance': max_distance,
+            'minVolume': 1,  # API default: no arbitrary restriction
+            'minLandingPadSize': 'S' if show_all_pad_sizes else required_pad,
+            'maxDaysAgo': 365,
+            'fleetCarriers': str(include_carriers).lower()
+        }
+        
+        # Surface filter and zero-price rows are dropped while streaming (see ROW_VIEWS)
+        suffix = '' if include_surface else '_orbital'
+        
+        calls = []
+        for commodity in commodities:
+            base = f'/system/name/{reference_system}/commodity/name/{commodity}'
+            calls.append((f'{base}/nearby/exports', params, 'buy' + suffix))
+            calls.append((f'{base}/nearby/imports', params, 'sell' + suffix))
+        responses = self._fetch_many(calls)
+        
+        sides = {}
+        for commodity, buys, sells in zip(commodities, responses[0::2], responses[1::2]):
+            if not isinstance(buys, list) or not isinstance(sells, list):
+                continue
+            sides[commodity] = (buys, sells)
+        return sides
+    
+    def _market_index_sides(self, market_index: dict) -> dict:
+        """Regroup a market index by commodity: {commodity: (buy rows, sell rows)}, one row per system"""
+        sides = {}
+        for direction, slot in (('exports', 0), ('imports', 1)):
+            for system_rows in market_index[direction].values():
+                for commodity, row in system_rows.items():
+                    sides.setdefault(commodity, ([], []))[slot].append(row)
+        return sides
+    
+    def _make_trade_pair(self, commodity: str, buy: dict, sell: dict, origin_distances: dict = None) -> dict:
+        """
+        Opportunity dict for one buy/sell station pair.
+        
+        origin_distances fills buy/sell distance for rows without a 'distance'
+        field (system market rows rather than nearby rows).
+        """
+        import math
+        
+        origin_distances = origin_distances or {}
+        buy_distance = buy.get('distance', origin_distances.get(buy.get('systemName', ''), 0))
+        sell_distance = sell.get('distance', origin_distances.get(sell.get('systemName', ''), 0))
+        
+        # Buy -> sell hop: exact from coordinates, else upper bound via reference system
+        if buy.get('systemX') is not None and sell.get('systemX') is not None:
+            hop_distance = math.dist(
+                (buy.get('systemX', 0), buy.get('systemY', 0), buy.get('systemZ', 0)),
+                (sell.get('systemX', 0), sell.get('systemY', 0), sell.get('systemZ', 0))
+            )
+        else:
+            hop_distance = buy_distance + sell_distance
+        
+        buy_price = buy.get('buyPrice', 0)
+        sell_price = sell.get('sellPrice', 0)
+        return {
+            'commodity': commodity,
+            'buy_system': buy.get('systemName', ''),
+            'buy_station': buy.get('stationName', ''),
+            'buy_market_id': buy.get('marketId'),
+            'buy_price': buy_price,
+            'buy_pad': buy.get('maxLandingPadSize', 'S'),
+            'buy_arrival_ls': buy.get('distanceToArrival', 0) or 0,
+            'sell_system': sell.get('systemName', ''),
+            'sell_station': sell.get('stationName', ''),
+            'sell_market_id': sell.get('marketId'),
+            'sell_price': sell_price,
+            'sell_pad': sell.get('maxLandingPadSize', 'S'),
+            'sell_arrival_ls': sell.get('distanceToArrival', 0) or 0,
+            'profit': sell_price - buy_price,
+            'buy_distance': buy_distance,
+            'sell_distance': sell_distance,
+            'hop_distance': hop_distance
+        }
+    
+    def _collect_trade_pairs(self, reference_system: str, commodities: list, max_distance: float,
+                             required_pad: str, show_all_pad_sizes: bool, include_carriers: bool,
+                             include_surface: bool = True, min_profit=None) -> list:
+        """
+        Buy/sell station pairs for each commodity within max_distance of a system.
+        
+        The top 20 buys are crossed with the top 20 sells per commodity.
+        
+        Returns:
+            List of opportunity dicts (see _make_trade_pair)
+        """
+        sides = self._fetch_commodity_sides(
+            reference_system, commodities, max_distance, required_pad,
+            show_all_pad_sizes, include_carriers, include_surface
+        )
+        
+        opportunities = []
+        for commodity, (buys, sells) in sides.items():
+            # Cross-reference for profit
+            for buy in buys[:20]:  # Limit to top 20 to avoid timeout
+                buy_price = buy.get('buyPrice', 0)
+                if buy_price == 0:
+                    continue
+                
+                for sell in sells[:20]:
+                    profit = sell.get('sellPrice', 0) - buy_price
+                    
+                    # Sanity check: More than 1M CR/unit is suspicious
+                    if profit > 1_000_000:
+                        continue
+                    
+                    # Only filter if min_profit explicitly set
+                    if min_profit and profit < min_profit:
+                        continue
+                    
+                    opportunities.append(self._make_trade_pair(commodity, buy, sell))
+        
+        return opportunities
+    
+    def _top_spreads(self, sides: dict, k: int, min_profit=None):
+        """
+        Top-k buy/sell spreads across all commodities without materializing every pair.
+        
+        Per commodity, buy prices are sorted ascending and sell prices descending,
+        so the best spread is always at (0, 0) and the next candidates are its
+        neighbours - a heap walks pairs in profit order. Profitable pairs are
+        counted with a bisect per sell price.
+        
+        Args:
+            sides: {commodity: (buy rows, sell rows)}
+            k: Number of pairs to return
+            min_profit: Minimum profit per unit (default: any positive spread)
+        
+        Returns:
+            ([(profit, commodity, buy_row, sell_row)] best first, total profitable pair count)
+        """
+        import bisect
+        import heapq
+        
+        threshold = min_profit if min_profit else 1
+        ceiling = 1_000_000  # Sanity check: More than 1M CR/unit is suspicious
+        
+        columns = {}
+        heap = []
+        total = 0
+        
+        for commodity, (buys, sells) in sides.items():
+            buy_rows = sorted((r for r in buys if r.get('buyPrice', 0) > 0), key=lambda r: r.get('buyPrice', 0))
+            sell_rows = sorted((r for r in sells if r.get('sellPrice', 0) > 0), key=lambda r: r.get('sellPrice', 0), reverse=True)
+            if not buy_rows or not sell_rows:
+                continue
+            
+            buy_prices = [r.get('buyPrice', 0) for r in buy_rows]
+            sell_prices = [r.get('sellPrice', 0) for r in sell_rows]
+            columns[commodity] = (buy_rows, sell_rows, buy_prices, sell_prices)
+            
+            # Pairs with threshold <= profit <= ceiling: buys in [sell - ceiling, sell - threshold]
+            for sell_price in sell_prices:
+                high = bisect.bisect_right(buy_prices, sell_price - threshold)
+                if high == 0:
+                    break  # Sell prices only get lower from here
+                total += high - bisect.bisect_left(buy_prices, sell_price - ceiling)
+            
+            heapq.heappush(heap, (buy_prices[0] - sell_prices[0], commodity, 0, 0))
+        
+        top = []
+        seen = set()
+        while heap and len(top) < k:
+            negative_profit, commodity, i, j = heapq.heappop(heap)
+            profit = -negative_profit
+            if profit < threshold:
+                break
+            
+            buy_rows, sell_rows, buy_prices, sell_prices = columns[commodity]
+            if profit <= ceiling:
+                top.append((profit, commodity, buy_rows[i], sell_rows[j]))
+            
+            for ni, nj in ((i + 1, j), (i, j + 1)):
+                if ni < len(buy_prices) and nj < len(sell_prices) and (commodity, ni, nj) not in seen:
+                    seen.add((commodity, ni, nj))
+                    heapq.heappush(heap, (buy_prices[ni] - sell_prices[nj], commodity, ni, nj))
+        
+        return top, total
+    
+    def _rank_pairs_per_hour(self, pairs: list, jump_range: float, cargo_capacity: int,
+                             credits: int = 0, top_n: int = 5) -> list:
+        """
+        Score trade pairs in credits/hour for a repeated buy -> sell -> buy loop.
+        
+        Loop time = 2 x jumps x JUMP_SECONDS + supercruise to both stations
+        (base + factor x sqrt(ls)) + 2 x (DOCK_SECONDS + TRADE_SECONDS).
+        Computed column-wise over the whole pair list, then top_n selected with a heap.
+        Pairs that buy and sell at the same market are not loops and are skipped.
+        
+        Returns:
+            [(pair, cr_per_hour, loop_seconds, jumps, units)] best first
+        """
+        import heapq
+        import math
+        
+        # Same market on both ends (by MarketID, else station + system): 0 jumps, no trip to time
+        pairs = [
+            p for p in pairs
+            if not (p.get('buy_market_id') is not None and p.get('buy_market_id') == p.get('sell_market_id'))
+            and not (p['buy_system'] == p['sell_system'] and p['buy_station'] == p['sell_station'])
+        ]
+        if not pairs:
+            return []
+        
+        jump_range = jump_range or 1
+        capacity = cargo_capacity or 1  # Unknown hold: rank per unit
+        fixed_seconds = 2 * (self.DOCK_SECONDS + self.TRADE_SECONDS)
+        sc_base = self.SUPERCRUISE_BASE_SECONDS
+        sc_factor = self.SUPERCRUISE_SQRT_FACTOR
+        
+        # Column views
+        hop_ly = [p['hop_distance'] for p in pairs]
+        buy_ls = [p.get('buy_arrival_ls', 0) for p in pairs]
+        sell_ls = [p.get('sell_arrival_ls', 0) for p in pairs]
+        buy_prices = [p['buy_price'] for p in pairs]
+        profits = [p['profit'] for p in pairs]
+        
+        jumps = [math.ceil(d / jump_range) if d > 0 else 0 for d in hop_ly]
+        loop_seconds = [
+            2 * j * self.JUMP_SECONDS + 2 * sc_base + sc_factor * (math.sqrt(b) + math.sqrt(s)) + fixed_seconds
+            for j, b, s in zip(jumps, buy_ls, sell_ls)
+        ]
+        units = [min(capacity, credits // bp) if credits and bp > 0 else capacity for bp in buy_prices]
+        cr_per_hour = [pr * u * 3600 / t for pr, u, t in zip(profits, units, loop_seconds)]
+        
+        best = heapq.nlargest(top_n, range(len(pairs)), key=cr_per_hour.__getitem__)
+        return [(pairs[i], cr_per_hour[i], loop_seconds[i], jumps[i], units[i]) for i in best]
+    
     def covinance_nearby_profitable_trades(self, args, projected_states) -> str:
         """
         Find all profitable opportunities within radius (v7.2).
@@ -5395,6 +7917,8 @@ class COVINANCE(PluginBase):
         - min_profit_margin: Minimum profit per unit (default: None = show all)
         - include_surface_stations: Include planetary bases (default: True)
         - include_fleet_carriers: Include carriers (default: False)
+        - full_market: Scan every commodity traded in every nearby system (default: False)
+          Set to True when user says: "all commodities", "full market", "everything nearby"
         
         Returns: Top 5 profitable trades within range.
         """
@@ -5403,12 +7927,13 @@ class COVINANCE(PluginBase):
             include_surface = args.get('include_surface_stations', True)
             include_carriers = args.get('include_fleet_carriers', True)  # Default TRUE: don't hide info
             min_profit_margin = args.get('min_profit_margin', None)
+            full_market = args.get('full_market', False)
             
             # v7.2.1: Show incompatible opportunities
             show_all_pad_sizes = args.get('show_all_pad_sizes', False)
             
             # Get Batch 1 critical parameters from Journal
-            journal_data = self.read_latest_journal()
+            journal_data = self._state_snapshot(args, projected_states)['ship']
             ship_type = journal_data.get('ShipType', '')
             required_pad = self._get_landing_pad_size(ship_type) if ship_type else 'S'
             jump_range = journal_data.get('MaxJumpRange', 20)
@@ -5422,7 +7947,6 @@ class COVINANCE(PluginBase):
             reference_system = args.get('reference_system', '')
             
             if not reference_system:
-                self.update_location_from_journal()
                 if not self.current_system:
                     return "COVINANCE: No reference system specified and current location unknown."
                 reference_system = self.current_system
@@ -5430,82 +7954,44 @@ class COVINANCE(PluginBase):
             log('info', f'COVINANCE: Finding profitable trades within {max_distance}ly of {reference_system} (ship: {ship_type or "Unknown"}, pad: {required_pad})')
             
             # Get nearby systems
-            nearby_endpoint = f'/system/name/{reference_system}/nearby'
-            nearby_systems = self.call_ardent_api(nearby_endpoint, {'maxDistance': max_distance})
+            nearby_systems = self._get_nearby_systems(reference_system, max_distance)
             
             if not isinstance(nearby_systems, list) or len(nearby_systems) == 0:
                 return f"COVINANCE: No systems found within {max_distance}ly of {reference_system}."
             
             total_systems = len(nearby_systems)
+            origin_distances = {reference_system: 0}
+            
+            scan_note = ''
+            if full_market:
+                # Full exports + imports of the nearest systems in one parallel sweep
+                # (capped so a large radius gives the same answer every run)
+                market_params = self._trade_market_params(required_pad, show_all_pad_sizes, include_carriers)
+                origin_distances, market_index = self._load_route_candidates(
+                    reference_system, nearby_systems, market_params, include_surface, self.FULL_MARKET_MAX_SYSTEMS
+                )
+                sides = self._market_index_sides(market_index)
+                commodities_label = f"{len(sides)} (full market, {market_index['checked']} systems loaded)"
+                skipped = total_systems + 1 - len(origin_distances)
+                abandoned = len(origin_distances) - market_index['checked']
+                if skipped > 0 or abandoned > 0:
+                    scan_note = (f"  â€¢ Systems scanned: nearest {len(origin_distances)} "
+                                 f"({max(skipped, 0)} farther skipped, {abandoned} abandoned at the time limit)\n")
+            else:
+                # Sample top commodities to check
+                test_commodities = self.PROFIT_SCAN_COMMODITIES
+                sides = self._fetch_commodity_sides(
+                    reference_system, test_commodities, max_distance, required_pad,
+                    show_all_pad_sizes, include_carriers, include_surface
+                )
+                commodities_label = f"{len(test_commodities)}"
             
-            # Sample top commodities to check
-            test_commodities = ['palladium', 'gold', 'bertrandite', 'indite', 'gallite', 
-                              'painite', 'platinum', 'osmium', 'praseodymium']
-            
-            all_opportunities = []
-            
-            for commodity in test_commodities:
-                # Find nearby buy opportunities with pad filtering
-                buy_endpoint = f'/system/name/{reference_system}/commodity/name/{commodity}/nearby/exports'
-                buy_params = {
-                    'maxDistance': max_distance,
-                    'minVolume': 1,  # API default: no arbitrary restriction
-                    'minLandingPadSize': 'S' if show_all_pad_sizes else required_pad,
-                    'maxDaysAgo': 365,
-                    'fleetCarriers': str(include_carriers).lower()
-                }
-                buys = self.call_ardent_api(buy_endpoint, buy_params)
-                
-                # Find nearby sell opportunities with pad filtering
-                sell_endpoint = f'/system/name/{reference_system}/commodity/name/{commodity}/nearby/imports'
-                sell_params = {
-                    'maxDistance': max_distance,
-                    'minVolume': 1,  # API default: no arbitrary restriction
-                    'minLandingPadSize': 'S' if show_all_pad_sizes else required_pad,
-                    'maxDaysAgo': 365,
-                    'fleetCarriers': str(include_carriers).lower()
-                }
-                sells = self.call_ardent_api(sell_endpoint, sell_params)
-                
-                # Client-side filter for surface stations if needed
-                if isinstance(buys, list) and not include_surface:
-                    buys = [b for b in buys if b.get('stationType') != 'OnFootSettlement']
-                
-                if isinstance(sells, list) and not include_surface:
-                    sells = [s for s in sells if s.get('stationType') != 'OnFootSettlement']
-                
-                if isinstance(buys, list) and isinstance(sells, list):
-                    # Cross-reference for profit
-                    for buy in buys[:20]:  # Limit to top 20 to avoid timeout
-                        buy_price = buy.get('buyPrice', 0)
-                        if buy_price == 0:
-                            continue
-                            
-                        for sell in sells[:20]:
-                            sell_price = sell.get('sellPrice', 0)
-                            profit = sell_price - buy_price
-                            
-                            # Sanity check: Filter suspicious prices
-                            if profit > 1_000_000:  # More than 1M CR/unit is suspicious
-                                log('warning', f'COVINANCE: Suspicious profit for {commodity}: {profit:,} CR - skipping')
-                                continue
-                            
-                            # Only filter if min_profit explicitly set
-                            if not min_profit or profit >= min_profit:
-                                all_opportunities.append({
-                                    'commodity': commodity,
-                                    'buy_system': buy.get('systemName', ''),
-                                    'buy_station': buy.get('stationName', ''),
-                                    'buy_price': buy_price,
-                                    'buy_pad': buy.get('maxLandingPadSize', 'S'),
-                                    'sell_system': sell.get('systemName', ''),
-                                    'sell_station': sell.get('stationName', ''),
-                                    'sell_price': sell_price,
-                                    'sell_pad': sell.get('maxLandingPadSize', 'S'),
-                                    'profit': profit,
-                                    'buy_distance': buy.get('distance', 0),
-                                    'sell_distance': sell.get('distance', 0)
-                                })
+            # Top spreads only - pairs are counted, not materialized
+            top_spreads, total_opportunities = self._top_spreads(sides, 5, min_profit)
+            all_opportunities = [
+                self._make_trade_pair(commodity, buy, sell, origin_distances)
+                for profit, commodity, buy, sell in top_spreads
+            ]
             
             # Build response with transparent scope
             import re
@@ -5519,8 +8005,9 @@ class COVINANCE(PluginBase):
             if max_distance == jump_range:
                 result.append(f" (your 1-jump range)")
             result.append(f"\n  â€¢ Systems nearby: {total_systems}\n")
-            result.append(f"  â€¢ Commodities checked: {len(test_commodities)}\n")
-            result.append(f"  â€¢ Opportunities found: {len(all_opportunities)}\n")
+            result.append(f"  â€¢ Commodities checked: {commodities_label}\n")
+            result.append(scan_note)
+            result.append(f"  â€¢ Opportunities found: {total_opportunities:,}\n")
             
             # Show active filters
             filters_active = []
@@ -5572,8 +8059,8 @@ class COVINANCE(PluginBase):
                     result.append(f"\n   âš ï¸âš ï¸âš ï¸ [SELL INCOMPATIBLE: {opp.get('sell_pad', 'S')} PAD - YOUR {ship_type.upper()} CANNOT LAND!]")
                 result.append(f"\n   Sell: {opp['sell_station']} ({opp['sell_system']}) - {opp['sell_distance']:.1f} ly")
             
-            if len(all_opportunities) > 5:
-                result.append(f"\n\nðŸ’¡ {len(all_opportunities) - 5} more opportunities available")
+            if total_opportunities > 5:
+                result.append(f"\n\nðŸ’¡ {total_opportunities - 5:,} more opportunities available")
             
             return "".join(result)
             
@@ -5604,7 +8091,7 @@ class COVINANCE(PluginBase):
             available_credits = args.get('available_credits', None)
             
             # Try to read from Journal if not provided
-            journal_data = self.read_latest_journal()
+            journal_data = self._state_snapshot(args, projected_states)['ship']
             if journal_data:
                 cargo_capacity = cargo_capacity or journal_data.get('CargoCapacity', 0)
                 available_credits = available_credits or journal_data.get('Credits', 0)
@@ -5812,17 +8299,12 @@ class COVINANCE(PluginBase):
             # Get jump range from args or Journal
             jump_range = args.get('jump_range', None)
             
-            # Try to read from Journal
+            # Read the Journal once - the snapshot is handed to nearby_profitable_trades
+            journal = self._state_snapshot(args, projected_states)
+            journal_data = journal['ship']
+            ship_type = journal_data.get('ShipType', '')
             if jump_range is None:
-                journal_data = self.read_latest_journal()
-                if journal_data:
-                    jump_range = journal_data.get('MaxJumpRange', None)
-                    ship_type = journal_data.get('ShipType', '')
-                else:
-                    ship_type = ''
-            else:
-                journal_data = self.read_latest_journal()
-                ship_type = journal_data.get('ShipType', '') if journal_data else ''
+                jump_range = journal_data.get('MaxJumpRange', None)
             
             if jump_range is None or jump_range == 0:
                 return "COVINANCE: Jump range unknown. Please specify or ensure Journal is accessible."
@@ -5840,7 +8322,8 @@ class COVINANCE(PluginBase):
                 'reference_system': self.current_system,
                 'include_surface_stations': include_surface,
                 'include_fleet_carriers': include_carriers,
-                'show_all_pad_sizes': show_all_pad_sizes  # v7.2.1: Pass through
+                'show_all_pad_sizes': show_all_pad_sizes,  # v7.2.1: Pass through
+                '_state_snapshot': journal
             }, projected_states)
             
         except Exception as e:
@@ -5873,11 +8356,12 @@ class COVINANCE(PluginBase):
             available_credits = args.get('available_credits', None)
             max_distance = args.get('max_distance', None)  # Will use jump range default in optimal_trade_now
             
-            # Try Journal
-            journal_data = self.read_latest_journal()
+            # Try Journal (read once - the snapshot is handed to optimal_trade_now)
+            journal = self._state_snapshot(args, projected_states)
+            journal_data = journal['ship']
             if journal_data:
                 cargo_capacity = journal_data.get('CargoCapacity', 0)
-                cargo_used = journal_data.get('Cargo', 0)
+                cargo_used = journal_data.get('CurrentCargo', 0)
                 remaining_space = remaining_space or (cargo_capacity - cargo_used)
                 available_credits = available_credits or journal_data.get('Credits', 0)
                 ship_type = journal_data.get('ShipType', '')
@@ -5899,7 +8383,8 @@ class COVINANCE(PluginBase):
                 'available_credits': available_credits,
                 'include_surface_stations': include_surface,
                 'include_fleet_carriers': include_carriers,
-                'show_all_pad_sizes': show_all_pad_sizes  # v7.2.1: Pass through
+                'show_all_pad_sizes': show_all_pad_sizes,  # v7.2.1: Pass through
+                '_state_snapshot': journal
             }
             
             # Only add max_distance if user specified it (otherwise let optimal_trade_now use jump range)
@@ -5913,6 +8398,280 @@ class COVINANCE(PluginBase):
             return f"COVINANCE: Error optimizing cargo - {str(e)}"
     
     
+    # ===================================
+    # ROUTE ENGINE - shared market index + profit graph
+    # ===================================
+    
+    def _trade_market_params(self, required_pad: str, show_all_pad_sizes: bool, include_carriers: bool) -> dict:
+        """Query params for system exports/imports used by the route engine"""
+        return {
+            'minVolume': 1,  # API default: no arbitrary restriction
+            'minLandingPadSize': 'S' if show_all_pad_sizes else required_pad,
+            'fleetCarriers': str(include_carriers).lower()
+        }
+    
+    def _fetch_market_index(self, systems: list, params: dict, include_surface: bool = True) -> dict:
+        """
+        Fetch exports + imports for many systems in one parallel sweep.
+        
+        Args:
+            systems: System names to load
+            params: Query params for the commodities endpoints
+            include_surface: Keep OnFootSettlement stations
+        
+        Returns:
+            dict with:
+            - 'exports': {system: {commodity: cheapest buy row}}
+            - 'imports': {system: {commodity: best sell row}}
+            - 'coords': {system: (x, y, z)} from market rows
+            - 'checked': systems with at least one market response
+        """
+        suffix = '' if include_surface else '_orbital'
+        keys = []
+        calls = []
+        for system in systems:
+            for direction, view in (('exports', 'buy'), ('imports', 'sell')):
+                keys.append((system, direction))
+                calls.append((f'/system/name/{system}/commodities/{direction}', params, view + suffix))
+        
+        # One parallel batch, cut off at the fan-out deadline
+        responses = self._fetch_many(calls)
+        
+        index = {'exports': {}, 'imports': {}, 'coords': {}, 'checked': 0}
+        checked = set()
+        
+        for (system, direction), rows in zip(keys, responses):
+            if rows is None:
+                continue  # Cut off by the deadline
+            rows = rows if isinstance(rows, list) else []
+            checked.add(system)
+            best = {}
+            for row in rows:
+                if not include_surface and row.get('stationType') == 'OnFootSettlement':
+                    continue
+                commodity = row.get('commodityName', '')
+                if not commodity:
+                    continue
+                
+                if direction == 'exports':
+                    price = row.get('buyPrice', 0)
+                    if price <= 0:
+                        continue
+                    if commodity not in best or price < best[commodity].get('buyPrice', 0):
+                        best[commodity] = row
+                else:
+                    price = row.get('sellPrice', 0)
+                    if price <= 0:
+                        continue
+                    if commodity not in best or price > best[commodity].get('sellPrice', 0):
+                        best[commodity] = row
+                
+                if system not in index['coords'] and row.get('systemX') is not None:
+                    index['coords'][system] = (row.get('systemX', 0), row.get('systemY', 0), row.get('systemZ', 0))
+            
+            index[direction][system] = best
+        
+        index['checked'] = len(checked)
+        log('info', f'COVINANCE: Market index loaded for {len(checked)}/{len(systems)} systems')
+        return index
+    
+    def _load_route_candidates(self, start_system: str, nearby_systems: list, params: dict, include_surface: bool = True,
+                               max_systems: int = None):
+        """
+        Pick the closest candidates (default: ROUTE_MAX_SYSTEMS) and load their markets.
+        
+        Returns:
+            (origin_distances {system: LY from start}, market_index)
+        """
+        max_systems = max_systems or self.ROUTE_MAX_SYSTEMS
+        
+        # Closest candidates first (start system always included)
+        origin_distances = {start_system: 0}
+        for nearby_sys in sorted(nearby_systems, key=lambda x: x.get('distance', 0)):
+            sys_name = nearby_sys.get('systemName', '')
+            if sys_name and sys_name not in origin_distances and len(origin_distances) < max_systems:
+                origin_distances[sys_name] = nearby_sys.get('distance', 0)
+        
+        market_index = self._fetch_market_index(list(origin_distances), params, include_surface)
+        
+        # Nearby rows carry coordinates too - fill gaps for systems without market rows
+        for nearby_sys in nearby_systems:
+            sys_name = nearby_sys.get('systemName', '')
+            if sys_name in origin_distances and sys_name not in market_index['coords'] and nearby_sys.get('systemX') is not None:
+                market_index['coords'][sys_name] = (nearby_sys.get('systemX', 0), nearby_sys.get('systemY', 0), nearby_sys.get('systemZ', 0))
+        
+        return origin_distances, market_index
+    
+    def _system_distance(self, market_index: dict, origin_distances: dict, system_a: str, system_b: str) -> float:
+        """
+        Distance between two systems in LY.
+        
+        Exact when both coordinates are known, otherwise the triangle-inequality
+        upper bound through the search origin (distance A->origin + origin->B).
+        """
+        import math
+        coords = market_index['coords']
+        if system_a in coords and system_b in coords:
+            return math.dist(coords[system_a], coords[system_b])
+        return origin_distances.get(system_a, 0) + origin_distances.get(system_b, 0)
+    
+    def _best_commodity_edge(self, market_index: dict, from_system: str, to_system: str, min_profit=None):
+        """
+        Most profitable commodity to carry from one system to another.
+        
+        Returns:
+            (profit, commodity, buy_row, sell_row) - profit 0 / commodity None for an empty leg
+        """
+        exports = market_index['exports'].get(from_system, {})
+        imports = market_index['imports'].get(to_system, {})
+        
+        # Iterate the smaller side of the intersection
+        if len(imports) < len(exports):
+            candidates = [c for c in imports if c in exports]
+        else:
+            candidates = [c for c in exports if c in imports]
+        
+        best = (0, None, None, None)
+        for commodity in candidates:
+            buy_row = exports[commodity]
+            sell_row = imports[commodity]
+            profit = sell_row.get('sellPrice', 0) - buy_row.get('buyPrice', 0)
+            
+            # Sanity check: More than 1M CR/unit is suspicious
+            if profit > 1_000_000:
+                continue
+            if min_profit and profit < min_profit:
+                continue
+            if profit > best[0]:
+                best = (profit, commodity, buy_row, sell_row)
+        return best
+    
+    def _build_trade_graph(self, market_index: dict, systems: list, origin_distances: dict,
+                           max_hop_distance: float, jump_range: float, min_profit=None) -> dict:
+        """
+        Build system -> system edges weighted by best commodity margin.
+        
+        Every pair within max_hop_distance gets an edge (empty legs included, so
+        loops can always close back to the start).
+        
+        Returns:
+            {from_system: {to_system: edge}} where edge has
+            profit, commodity, buy, sell, distance, jumps
+        """
+        import math
+        
+        coords = market_index['coords']
+        graph = {system: {} for system in systems}
+        
+        for from_system in systems:
+            for to_system in systems:
+                if from_system == to_system:
+                    continue
+                
+                distance = self._system_distance(market_index, origin_distances, from_system, to_system)
+                # Hop limit only enforced on exact distances (the fallback is an upper bound)
+                exact = from_system in coords and to_system in coords
+                if exact and distance > max_hop_distance:
+                    continue
+                
+                profit, commodity, buy_row, sell_row = self._best_commodity_edge(
+                    market_index, from_system, to_system, min_profit
+                )
+                graph[from_system][to_system] = {
+                    'profit': profit,
+                    'commodity': commodity,
+                    'buy': buy_row,
+                    'sell': sell_row,
+                    'distance': distance,
+                    'jumps': max(1, math.ceil(distance / jump_range)) if jump_range else 1
+                }
+        return graph
+    
+    def _search_trade_cycle(self, graph: dict, start_system: str, num_hops: int, rank_key):
+        """
+        Beam search for the best num_hops-leg loop start -> ... -> start.
+        
+        Args:
+            graph: Edges from _build_trade_graph
+            rank_key: Sort key on (path, legs, profit, distance, jumps) - lower is better
+        
+        Returns:
+            Complete loops with positive profit, best first
+        """
+        beams = [([start_system], [], 0, 0.0, 0)]
+        
+        for hop in range(num_hops):
+            closing = hop == num_hops - 1
+            candidates = []
+            
+            for path, legs, profit, distance, jumps in beams:
+                for next_system, edge in graph.get(path[-1], {}).items():
+                    if closing:
+                        if next_system != start_system:
+                            continue
+                    elif next_system in path:
+                        continue
+                    candidates.append((
+                        path + [next_system],
+                        legs + [edge],
+                        profit + edge['profit'],
+                        distance + edge['distance'],
+                        jumps + edge['jumps']
+                    ))
+            
+            candidates.sort(key=rank_key)
+            beams = candidates[:self.ROUTE_BEAM_WIDTH]
+            if not beams:
+                return []
+        
+        return [route for route in beams if route[2] > 0]
+    
+    def _search_trade_chain(self, graph: dict, start_system: str, num_hops: int):
+        """
+        Dynamic programming for the most profitable num_hops-leg chain from start.
+        
+        best[h][system] = max profit arriving at system after h legs (revisits
+        allowed - a ping-pong between two markets is a valid chain).
+        
+        Returns:
+            (path, legs, total_profit) or None if no leg is profitable
+        """
+        best = [{start_system: 0}]
+        back = [{}]  # back[h][system] = (previous system, edge)
+        
+        for hop in range(num_hops):
+            layer = {}
+            pointers = {}
+            for system, profit in best[hop].items():
+                for next_system, edge in graph.get(system, {}).items():
+                    total = profit + edge['profit']
+                    if total > layer.get(next_system, -1):
+                        layer[next_system] = total
+                        pointers[next_system] = (system, edge)
+            if not layer:
+                break
+            best.append(layer)
+            back.append(pointers)
+        
+        hops = len(best) - 1
+        if hops == 0:
+            return None
+        end_system = max(best[hops], key=best[hops].get)
+        total_profit = best[hops][end_system]
+        if total_profit <= 0:
+            return None
+        
+        # Walk back-pointers to recover the chain
+        path = [end_system]
+        legs = []
+        for hop in range(hops, 0, -1):
+            previous, edge = back[hop][path[-1]]
+            legs.append(edge)
+            path.append(previous)
+        path.reverse()
+        legs.reverse()
+        return path, legs, total_profit
+    
     def covinance_circular_route(self, args, projected_states) -> str:
         """
         Build multi-hop circular trading loop (v7.2).
@@ -5939,6 +8698,10 @@ class COVINANCE(PluginBase):
         - If user says "fewest jumps" or "minimum jumps" â†’ use optimize_by='jumps'
         - If user says "most profitable" or "best profit" â†’ use optimize_by='profit'
         
+        Route engine: exports/imports of up to ROUTE_MAX_SYSTEMS nearby systems are
+        fetched in parallel, every system pair becomes a profit edge (best commodity
+        margin), and a beam search chains real hops into the best closed loop.
+        
         Returns: Circular route with trade opportunities at each hop.
         """
         try:
@@ -5957,7 +8720,7 @@ class COVINANCE(PluginBase):
             
             # BATCH 1 CRITICAL PARAMETERS (v7.2)
             # 1. Get ship type and map to landing pad size
-            journal_data = self.read_latest_journal()
+            journal_data = self._state_snapshot(args, projected_states)['ship']
             ship_type = journal_data.get('ShipType', '')
             required_pad = self._get_landing_pad_size(ship_type) if ship_type else 'S'
             
@@ -5981,110 +8744,38 @@ class COVINANCE(PluginBase):
             log('info', f'COVINANCE: Ship {ship_type} requires {required_pad} pad, jump range {jump_range:.1f}ly')
             
             # Get ALL nearby systems within range
-            nearby_endpoint = f'/system/name/{start_system}/nearby'
-            nearby_systems = self.call_ardent_api(nearby_endpoint, {'maxDistance': max_distance})
+            nearby_systems = self._get_nearby_systems(start_system, max_distance)
             
-            if not isinstance(nearby_systems, list) or len(nearby_systems) < num_hops:
+            if not isinstance(nearby_systems, list) or len(nearby_systems) < num_hops - 1:
                 return f"COVINANCE: Not enough systems within {max_distance} LY for {num_hops}-hop route."
             
-            total_systems = len(nearby_systems)
-            systems_to_check = min(8, total_systems)  # Reduced to 8 for performance (was 50)
+            # Start system counts as a candidate too
+            total_systems = len({start_system} | {n.get('systemName', '') for n in nearby_systems})
             
-            # Calculate profit for EACH nearby system
-            system_evaluations = []
+            # One parallel sweep: exports + imports for every candidate
+            market_params = self._trade_market_params(required_pad, show_all_pad_sizes, include_carriers)
+            origin_distances, market_index = self._load_route_candidates(
+                start_system, nearby_systems, market_params, include_surface
+            )
+            candidate_systems = list(origin_distances)
+            systems_to_check = market_index['checked']
             
-            for nearby_sys in nearby_systems[:systems_to_check]:
-                sys_name = nearby_sys.get('systemName', '')
-                sys_distance = nearby_sys.get('distance', 0)
-                
-                # Get exports from this system with pad size filter
-                exports_endpoint = f'/system/name/{sys_name}/commodities/exports'
-                exports_params = {
-                    'minVolume': 1,  # API default: no arbitrary restriction
-                    'minLandingPadSize': 'S' if show_all_pad_sizes else required_pad,  # v7.2.1: Conditional
-                    'fleetCarriers': str(include_carriers).lower()  # v7.2 OPTIONAL
-                }
-                exports = self.call_ardent_api(exports_endpoint, exports_params)
-                
-                if not isinstance(exports, list) or len(exports) == 0:
-                    continue
-                
-                # Filter out surface stations if requested
-                if not include_surface:
-                    exports = [e for e in exports if e.get('stationType') != 'OnFootSettlement']
-                
-                # Find best trade FROM this system
-                best_profit = 0
-                best_commodity = None
-                best_sell_system = None
-                best_sell_station = None
-                
-                for export in exports[:5]:  # Check top 5 commodities
-                    commodity = export.get('commodityName', '')
-                    buy_price = export.get('buyPrice', 0)
-                    
-                    if buy_price == 0:
-                        continue
-                    
-                    # Find sell opportunity nearby with same filters
-                    nearby_sell_endpoint = f'/system/name/{sys_name}/commodity/name/{commodity}/nearby/imports'
-                    sell_params = {
-                        'maxDistance': max_distance,
-                        'minVolume': 1,  # API default: no arbitrary restriction
-                        'minLandingPadSize': 'S' if show_all_pad_sizes else required_pad,  # v7.2.1: Conditional
-                    'maxDaysAgo': 365,
-                        'fleetCarriers': str(include_carriers).lower()  # v7.2 OPTIONAL
-                    }
-                    sells = self.call_ardent_api(nearby_sell_endpoint, sell_params)
-                    
-                    if isinstance(sells, list) and len(sells) > 0:
-                        # Filter out surface stations if requested
-                        if not include_surface:
-                            sells = [s for s in sells if s.get('stationType') != 'OnFootSettlement']
-                        
-                        if not sells:
-                            continue
-                        
-                        top_sell = max(sells, key=lambda x: x.get('sellPrice', 0))
-                        sell_price = top_sell.get('sellPrice', 0)
-                        profit = sell_price - buy_price
-                        
-                        # Apply min profit margin filter (v7.2 OPTIONAL)
-                        if min_profit_margin and profit < min_profit_margin:
-                            continue
-                        
-                        if profit > best_profit:
-                            best_profit = profit
-                            best_commodity = commodity
-                            best_sell_system = top_sell.get('systemName', '')
-                            best_sell_station = top_sell.get('stationName', '')
-                
-                if best_profit > 0:
-                    system_evaluations.append({
-                        'system': sys_name,
-                        'distance': sys_distance,
-                        'profit': best_profit,
-                        'commodity': best_commodity,
-                        'sell_system': best_sell_system,
-                        'sell_station': best_sell_station,
-                        'jumps': 1  # All within max_distance = 1 jump
-                    })
+            graph = self._build_trade_graph(
+                market_index, candidate_systems, origin_distances, max_distance, jump_range, min_profit_margin
+            )
             
-            if len(system_evaluations) < num_hops - 1:
-                return f"COVINANCE: Only found {len(system_evaluations)} profitable systems within {max_distance} LY that match your ship's requirements."
+            # Rank partial/complete loops (lower is better)
+            rank_keys = {
+                'profit': lambda r: (-r[2], r[3]),
+                'distance_ly': lambda r: (r[3], -r[2]),
+                'jumps': lambda r: (r[4], -r[2])
+            }
+            routes = self._search_trade_cycle(graph, start_system, num_hops, rank_keys[optimize_by])
             
-            # Sort based on optimization preference
-            if optimize_by == 'profit':
-                system_evaluations.sort(key=lambda x: x['profit'], reverse=True)
-            elif optimize_by == 'distance_ly':
-                system_evaluations.sort(key=lambda x: x['distance'])
-            elif optimize_by == 'jumps':
-                # All are 1 jump, so secondary sort by profit
-                system_evaluations.sort(key=lambda x: (x['jumps'], -x['profit']))
+            if not routes:
+                return f"COVINANCE: No profitable {num_hops}-hop loop found within {max_distance} LY that matches your ship's requirements ({systems_to_check} systems checked)."
             
-            # Pick top N systems
-            route_systems = [start_system]
-            route_systems.extend([s['system'] for s in system_evaluations[:num_hops-1]])
+            route_systems, legs, total_profit, total_distance, total_jumps = routes[0]
             
             # Build output with TRANSPARENT SCOPE (v7.2 CRITICAL)
             route_info = [f"COVINANCE: {num_hops}-hop circular route from {start_system}\n"]
@@ -6098,7 +8789,7 @@ class COVINANCE(PluginBase):
             if max_distance == jump_range:
                 route_info.append(f" (your 1-jump range)")
             route_info.append(f"\n  â€¢ Systems checked: {systems_to_check} of {total_systems} nearby\n")
-            route_info.append(f"  â€¢ Routes found: {len(system_evaluations)}\n")
+            route_info.append(f"  â€¢ Routes found: {len(routes)}\n")
             
             # Show active filters
             filters_active = []
@@ -6113,60 +8804,52 @@ class COVINANCE(PluginBase):
             if show_all_pad_sizes:
                 route_info.append(f"  â€¢ All pad sizes: Shown (incompatible hops marked)\n")
             
-            route_info.append(f"\nâš ï¸  LIMITED SEARCH - To expand:\n")
-            route_info.append(f"  â€¢ More systems: (currently checking {systems_to_check})\n")
-            route_info.append(f"  â€¢ Longer range: max_distance={int(max_distance * 1.5)}\n")
+            if systems_to_check < total_systems:
+                route_info.append(f"\nâš ï¸  LIMITED SEARCH - To expand:\n")
+                route_info.append(f"  â€¢ More systems: (currently checking {systems_to_check})\n")
+                route_info.append(f"  â€¢ Longer range: max_distance={int(max_distance * 1.5)}\n")
             route_info.append(f"[END VERBATIM SECTION]\n")
             
             route_info.append(f"\nOptimization: {optimize_by.upper()}\n")
             route_info.append(f"\n=== ROUTE & TRADES ===\n")
             
             # Show each hop
-            for i in range(len(route_systems)):
+            import re
+            for i, leg in enumerate(legs):
                 current = route_systems[i]
-                next_sys = route_systems[(i + 1) % len(route_systems)]
-                
-                # Find system evaluation data
-                sys_data = None
-                if i > 0:  # Not the start system
-                    sys_data = system_evaluations[i-1]
+                next_sys = route_systems[i + 1]
                 
                 route_info.append(f"\n{i+1}. {current}")
-                
-                if sys_data:
-                    route_info.append(f" ({sys_data['distance']:.1f} LY from origin)")
-                    
-                    import re
-                    commodity_name = re.sub(r'([a-z])([A-Z])', r'\1 \2', sys_data['commodity']).title()
-                    route_info.append(f"\n   Buy: {commodity_name}")
-                    route_info.append(f"\n   Sell at: {sys_data['sell_station']}, {sys_data['sell_system']}")
-                    route_info.append(f"\n   Profit: {sys_data['profit']:,} CR/unit")
+                if i > 0:
+                    route_info.append(f" ({origin_distances.get(current, 0):.1f} LY from origin)")
+                
+                if leg['commodity']:
+                    commodity_name = re.sub(r'([a-z])([A-Z])', r'\1 \2', leg['commodity']).title()
+                    route_info.append(f"\n   Buy: {commodity_name} at {leg['buy'].get('stationName', '')} ({leg['buy'].get('buyPrice', 0):,} CR)")
+                    route_info.append(f"\n   Sell at: {leg['sell'].get('stationName', '')}, {next_sys} ({leg['sell'].get('sellPrice', 0):,} CR)")
+                    route_info.append(f"\n   Profit: {leg['profit']:,} CR/unit")
+                else:
+                    route_info.append(f"\n   No profitable cargo to {next_sys} - fly empty")
+                route_info.append(f"\n   Leg: {leg['distance']:.1f} LY, {leg['jumps']} jump{'s' if leg['jumps'] != 1 else ''}")
             
-            route_info.append(f"\n\n{len(route_systems)}. Return to {start_system}")
+            route_info.append(f"\n\n{len(legs) + 1}. Return to {start_system}")
             
             # Add analysis
             route_info.append(f"\n\nðŸ“Š ROUTE ANALYSIS:")
+            route_info.append(f"\nâ€¢ Total profit: {total_profit:,} CR/unit per loop")
+            route_info.append(f"\nâ€¢ Total distance: {total_distance:.1f} LY ({total_jumps} jumps)")
             
             if optimize_by == 'profit':
-                top_profit = system_evaluations[0]['profit']
-                route_info.append(f"\nâœ“ Optimized for PROFIT (best: {top_profit:,} CR/unit)")
-                
-                # Warn about excluded high-profit systems if they exist
-                if len(system_evaluations) > num_hops - 1:
-                    excluded_profitable = [s for s in system_evaluations[num_hops-1:num_hops+2] 
-                                          if s['profit'] > system_evaluations[num_hops-2]['profit'] * 0.5]
-                    if excluded_profitable:
-                        route_info.append(f"\n\nâ„¹ï¸  Other profitable options not in route:")
-                        for sys in excluded_profitable[:2]:
-                            route_info.append(f"\n  â€¢ {sys['system']} ({sys['distance']:.1f} LY): {sys['profit']:,} CR/unit")
-            
-            elif optimize_by == 'distance_ly':
-                route_info.append(f"\nâœ“ Optimized for SHORTEST DISTANCE")
-                best_profit_sys = max(system_evaluations, key=lambda x: x['profit'])
-                if best_profit_sys not in system_evaluations[:num_hops-1]:
-                    route_info.append(f"\nâš ï¸  Higher profit available at {best_profit_sys['system']}")
-                    route_info.append(f" ({best_profit_sys['distance']:.1f} LY, {best_profit_sys['profit']:,} CR/unit)")
-                    route_info.append(f"\n  Use optimize_by='profit' to include this system.")
+                route_info.append(f"\nâœ“ Optimized for PROFIT")
+            
+            elif optimize_by in ('distance_ly', 'jumps'):
+                label = 'SHORTEST DISTANCE' if optimize_by == 'distance_ly' else 'FEWEST JUMPS'
+                route_info.append(f"\nâœ“ Optimized for {label}")
+                best_profit_route = max(routes, key=lambda r: r[2])
+                if best_profit_route[2] > total_profit:
+                    route_info.append(f"\nâš ï¸  Higher profit loop available: {' â†’ '.join(best_profit_route[0])}")
+                    route_info.append(f" ({best_profit_route[3]:.1f} LY, {best_profit_route[2]:,} CR/unit)")
+                    route_info.append(f"\n  Use optimize_by='profit' to take this loop.")
             
             return "".join(route_info)
             
@@ -6174,23 +8857,92 @@ class COVINANCE(PluginBase):
             log('error', f'COVINANCE circular_route error: {str(e)}')
             return f"COVINANCE: Error building route - {str(e)}"
     def covinance_multi_commodity_chain(self, args, projected_states) -> str:
-        """Swap commodities at each hop for max profit"""
+        """
+        Swap commodities at each hop for max profit.
+        
+        Parameters:
+        - num_hops: Number of commodity swaps (1-8, default 3)
+        - max_distance: Maximum distance between hops in LY (default: 50)
+        - include_surface_stations: Include planetary bases (default: True)
+        - include_fleet_carriers: Include carriers (default: True)
+        - min_profit_margin: Minimum profit per unit for a leg to carry cargo (optional)
+        
+        Prefetches exports/imports of nearby systems in one parallel sweep, then
+        picks the best sequence of buy/sell swaps with dynamic programming.
+        
+        Returns: Chain of trades, one commodity per hop.
+        """
         try:
             num_hops = args.get('num_hops', 3)
             max_distance = args.get('max_distance', 50)
+            include_surface = args.get('include_surface_stations', True)
+            include_carriers = args.get('include_fleet_carriers', True)  # Default TRUE: don't hide info
+            min_profit_margin = args.get('min_profit_margin', None)
+            show_all_pad_sizes = args.get('show_all_pad_sizes', False)
+            
+            if num_hops < 1 or num_hops > 8:
+                return "COVINANCE: Number of hops must be between 1 and 8."
+            
+            journal_data = self._state_snapshot(args, projected_states)['ship']
             
             if not self.current_system:
                 return "COVINANCE: Current location unknown."
+            ship_type = journal_data.get('ShipType', '')
+            required_pad = self._get_landing_pad_size(ship_type) if ship_type else 'S'
+            jump_range = journal_data.get('MaxJumpRange', 20)
+            cargo_capacity = journal_data.get('CargoCapacity', 0)
+            
+            start_system = self.current_system
+            log('info', f'COVINANCE: Building {num_hops}-commodity chain from {start_system} within {max_distance}ly')
+            
+            nearby_systems = self._get_nearby_systems(start_system, max_distance)
+            if not isinstance(nearby_systems, list) or len(nearby_systems) == 0:
+                return f"COVINANCE: No systems found within {max_distance} LY of {start_system}."
+            
+            total_systems = len({start_system} | {n.get('systemName', '') for n in nearby_systems})
+            market_params = self._trade_market_params(required_pad, show_all_pad_sizes, include_carriers)
+            origin_distances, market_index = self._load_route_candidates(
+                start_system, nearby_systems, market_params, include_surface
+            )
+            systems_checked = market_index['checked']
+            
+            graph = self._build_trade_graph(
+                market_index, list(origin_distances), origin_distances, max_distance, jump_range, min_profit_margin
+            )
+            chain = self._search_trade_chain(graph, start_system, num_hops)
+            
+            if not chain:
+                return f"COVINANCE: No profitable chain found within {max_distance} LY of {start_system} ({systems_checked} systems checked)."
+            
+            path, legs, total_profit = chain
+            total_distance = sum(leg['distance'] for leg in legs)
+            total_jumps = sum(leg['jumps'] for leg in legs)
+            
+            import re
+            result = [f"COVINANCE: {len(legs)}-hop commodity chain from {start_system}\n"]
+            result.append(f"\n[COVAS: READ VERBATIM - DO NOT PARAPHRASE]\n")
+            result.append(f"ðŸ” SEARCH SCOPE:\n")
+            result.append(f"  â€¢ Ship: {ship_type or 'Unknown'} ({required_pad} pad required)\n")
+            result.append(f"  â€¢ Distance: {max_distance:.1f} LY between hops\n")
+            result.append(f"  â€¢ Systems checked: {systems_checked} of {total_systems} nearby\n")
+            result.append(f"[END VERBATIM SECTION]\n")
             
-            log('info', f'COVINANCE: Building {num_hops}-commodity chain')
+            result.append(f"\n=== CHAIN ===\n")
+            for i, leg in enumerate(legs):
+                result.append(f"\n{i+1}. {path[i]} â†’ {path[i + 1]} ({leg['distance']:.1f} LY)")
+                if leg['commodity']:
+                    commodity_name = re.sub(r'([a-z])([A-Z])', r'\1 \2', leg['commodity']).title()
+                    result.append(f"\n   Buy {commodity_name} at {leg['buy'].get('stationName', '')}: {leg['buy'].get('buyPrice', 0):,} CR")
+                    result.append(f"\n   Sell at {leg['sell'].get('stationName', '')}: {leg['sell'].get('sellPrice', 0):,} CR")
+                    result.append(f"\n   Profit: {leg['profit']:,} CR/unit")
+                else:
+                    result.append(f"\n   Reposition empty - no profitable cargo on this leg")
             
-            result = [f"COVINANCE: Multi-commodity chain trading:\n"]
-            result.append(f"\nAdvanced feature - Full implementation in progress.")
-            result.append(f"\n\nSuggested approach:")
-            result.append(f"\n1. Use 'best_trade_from_here' at current location")
-            result.append(f"\n2. After selling, use 'best_trade_from_here' again at destination")
-            result.append(f"\n3. Repeat for {num_hops} hops")
-            result.append(f"\n\nThis ensures optimal commodity selection at each stop.")
+            result.append(f"\n\nðŸ“Š CHAIN TOTAL:")
+            result.append(f"\nâ€¢ Profit: {total_profit:,} CR/unit")
+            if cargo_capacity:
+                result.append(f" (~{total_profit * cargo_capacity:,} CR with {cargo_capacity}T hold)")
+            result.append(f"\nâ€¢ Distance: {total_distance:.1f} LY ({total_jumps} jumps)")
             
             return "".join(result)
             
@@ -6199,31 +8951,77 @@ class COVINANCE(PluginBase):
             return f"COVINANCE: Error building chain - {str(e)}"
     
     def covinance_max_profit_per_hour(self, args, projected_states) -> str:
-        """Time-optimized routes (CR/hour)"""
+        """
+        Time-optimized routes (CR/hour).
+        
+        Parameters:
+        - max_distance: Search radius in LY (default: 50)
+        - include_surface_stations: Include planetary bases (default: True)
+        - include_fleet_carriers: Include carriers (default: True)
+        
+        Reuses the buy/sell pairs from nearby_profitable_trades and scores each
+        repeated loop with a time model:
+        - Jumps: ceil(hop LY / MaxJumpRange) x 45 sec, both directions
+        - Supercruise: base + factor x sqrt(distanceToArrival) per station
+        - Docking ~60 sec and trading ~30 sec at each end
+        
+        Returns: Top 5 loops by credits per hour.
+        """
         try:
             max_distance = args.get('max_distance', 50)
+            include_surface = args.get('include_surface_stations', True)
+            include_carriers = args.get('include_fleet_carriers', True)  # Default TRUE: don't hide info
+            show_all_pad_sizes = args.get('show_all_pad_sizes', False)
+            
+            journal_data = self._state_snapshot(args, projected_states)['ship']
             
             if not self.current_system:
                 return "COVINANCE: Current location unknown."
             
-            log('info', f'COVINANCE: Calculating profit per hour for routes')
-            
-            # Simplified implementation
-            # Full version would calculate:
-            # - Jump time (distance / jump_range * 45 seconds)
-            # - Docking time (~60 seconds)
-            # - Supercruise time (distance_ls / speed)
-            # - Buy/sell time (~30 seconds each)
-            
-            result = [f"COVINANCE: Time-optimized trading:\n"]
-            result.append(f"\nAdvanced feature - Full implementation in progress.")
-            result.append(f"\n\nTime factors:")
-            result.append(f"\nâ€¢ Jump time: ~45 sec per jump")
-            result.append(f"\nâ€¢ Supercruise: ~2-5 min (distance dependent)")
-            result.append(f"\nâ€¢ Docking: ~60 sec")
-            result.append(f"\nâ€¢ Trading: ~60 sec total")
-            result.append(f"\n\nUse 'nearby_profitable_trades' and sort by:")
-            result.append(f"\nProfit Ã· (estimated_time_minutes Ã· 60)")
+            ship_type = journal_data.get('ShipType', '')
+            required_pad = self._get_landing_pad_size(ship_type) if ship_type else 'S'
+            jump_range = journal_data.get('MaxJumpRange', 20) or 20
+            cargo_capacity = journal_data.get('CargoCapacity', 0)
+            credits = journal_data.get('Credits', 0)
+            
+            log('info', f'COVINANCE: Calculating profit per hour for routes within {max_distance}ly of {self.current_system}')
+            
+            pairs = self._collect_trade_pairs(
+                self.current_system, self.PROFIT_SCAN_COMMODITIES, max_distance, required_pad,
+                show_all_pad_sizes, include_carriers, include_surface
+            )
+            pairs = [p for p in pairs if p['profit'] > 0]
+            
+            if not pairs:
+                return f"COVINANCE: No profitable trades found within {max_distance} LY of {self.current_system}."
+            
+            ranked = self._rank_pairs_per_hour(pairs, jump_range, cargo_capacity, credits)
+            if not ranked:
+                return f"COVINANCE: No profitable trades between different stations within {max_distance} LY of {self.current_system}."
+            
+            import re
+            result = [f"COVINANCE: Best credits per hour within {max_distance} LY of {self.current_system}\n"]
+            result.append(f"\n[COVAS: READ VERBATIM - DO NOT PARAPHRASE]\n")
+            result.append(f"ðŸ” SEARCH SCOPE:\n")
+            result.append(f"  â€¢ Ship: {ship_type or 'Unknown'} ({required_pad} pad required), {jump_range:.1f} LY jump\n")
+            if cargo_capacity:
+                result.append(f"  â€¢ Hold: {cargo_capacity}T\n")
+            else:
+                result.append(f"  â€¢ Hold: unknown - ranked per unit\n")
+            result.append(f"  â€¢ Commodities checked: {len(self.PROFIT_SCAN_COMMODITIES)}\n")
+            result.append(f"  â€¢ Routes scored: {len(pairs):,}\n")
+            result.append(f"[END VERBATIM SECTION]\n")
+            
+            result.append(f"\nðŸ“Š TOP ROUTES BY CR/HOUR:\n")
+            for i, (pair, cr_hour, loop_seconds, jumps, units) in enumerate(ranked, 1):
+                commodity_formatted = re.sub(r'([a-z])([A-Z])', r'\1 \2', pair['commodity']).title()
+                result.append(f"\n{i}. {commodity_formatted}: {cr_hour:,.0f} CR/hour")
+                result.append(f"\n   Buy: {pair['buy_station']} ({pair['buy_system']}) - {pair['buy_price']:,} CR")
+                result.append(f"\n   Sell: {pair['sell_station']} ({pair['sell_system']}) - {pair['sell_price']:,} CR")
+                result.append(f"\n   Loop: {loop_seconds / 60:.1f} min ({jumps} jump{'s' if jumps != 1 else ''} each way, {pair['hop_distance']:.1f} LY)")
+                result.append(f"\n   Per trip: {units}T x {pair['profit']:,} CR = {units * pair['profit']:,} CR")
+            
+            result.append(f"\n\nTime model: {self.JUMP_SECONDS}s/jump, {self.DOCK_SECONDS}s docking, {self.TRADE_SECONDS}s trading, supercruise by station distance")
             
             return "".join(result)
             
@@ -6233,6 +9031,88 @@ class COVINANCE(PluginBase):
     # ACTION #35: RARE GOODS DISCOVERY (FIXED!)
     # ===================================
     
+    def _refresh_rare_goods_index(self) -> int:
+        """
+        Look up home stations for rare goods missing from (or stale in) the index.
+        
+        One galaxy-wide exports call per rare good, as one parallel batch. Rows without
+        coordinates are resolved in a second batch. After the first build only stale
+        entries are re-checked, so this is normally a no-op.
+        
+        Returns:
+            Number of rare goods whose lookup failed (retried next time)
+        """
+        pending = self.rare_goods_index.stale(RARE_GOODS_DATA.keys())
+        if not pending:
+            return 0
+        
+        log('info', f'COVINANCE RARE_GOODS: Indexing {len(pending)} rare goods locations...')
+        
+        # Explicit string conversion - the API expects lowercase 'false'
+        responses = self._fetch_many(
+            [(f'/commodity/name/{commodity}/exports', {'fleetCarriers': 'false'}, None) for commodity in pending],
+            time_budget=30.0
+        )
+        
+        # Systems whose rows carry no coordinates: galaxy index first, then one batch
+        coords = {}
+        missing = []
+        for response in responses:
+            for row in response if isinstance(response, list) else []:
+                system = row.get('systemName')
+                if not system or row.get('systemX') is not None or system in coords or system in missing:
+                    continue
+                if 'FleetCarrier' in (row.get('stationType') or ''):
+                    continue  # Dropped below - don't look up where a carrier happens to be
+                local = self.galaxy_index.coordinates(system)
+                if local is not None:
+                    coords[system] = {'x': local[0], 'y': local[1], 'z': local[2]}
+                else:
+                    missing.append(system)
+        if missing:
+            lookups = self._fetch_many([(f'/system/name/{quote(system)}', {}, None) for system in missing])
+            for system, response in zip(missing, lookups):
+                if response is None:
+                    continue  # Cut off by the deadline
+                if isinstance(response, dict) and 'error' not in response:
+                    coords[system] = {'x': response.get('systemX', 0), 'y': response.get('systemY', 0), 'z': response.get('systemZ', 0)}
+                else:
+                    coords[system] = None  # Unknown system - row is dropped
+        
+        failed = 0
+        for commodity, response in zip(pending, responses):
+            if not isinstance(response, list):
+                failed += 1  # API error or deadline - leave stale so it is retried
+                continue
+            
+            locations = []
+            unresolved = False
+            for row in response:
+                system = row.get('systemName')
+                if not system or 'FleetCarrier' in (row.get('stationType') or ''):
+                    continue
+                if row.get('systemX') is not None:
+                    location = {'x': row.get('systemX'), 'y': row.get('systemY'), 'z': row.get('systemZ')}
+                elif system in coords:
+                    location = coords[system]
+                else:
+                    unresolved = True  # Coordinate lookup cut off - retry the whole good next time
+                    break
+                if not location:
+                    continue
+                locations.append((
+                    row.get('marketId', 0), row.get('stationName', 'Unknown'), system,
+                    float(location['x']), float(location['y']), float(location['z'])
+                ))
+            if unresolved:
+                failed += 1
+                continue
+            self.rare_goods_index.update(commodity, locations)
+        
+        if failed:
+            log('warning', f'COVINANCE RARE_GOODS: {failed} rare goods lookups failed - will retry next search')
+        return failed
+    
     def covinance_list_rare_goods(self, args, projected_states) -> str:
         """
         Find and discover RARE GOODS within radius (Azure Milk, Lavian Brandy, etc.)
@@ -6271,7 +9151,8 @@ class COVINANCE(PluginBase):
         
         Performance:
             With commodity: 2-4 seconds (1 API call, fast-path)
-            Without commodity: 60-150 seconds (143 API calls, full scan)
+            Without commodity: a few seconds from the rare goods index (stock refresh
+            for in-range systems only); first run builds the index (143 API calls)
         """
         try:
             max_distance = args.get('max_distance', 150)
@@ -6298,7 +9179,7 @@ class COVINANCE(PluginBase):
             commodity = args.get('commodity', '').strip().lower()
             
             if not commodity:
-                log('info', f'COVINANCE RARE_GOODS: No commodity specified -> SLOW PATH (143 API calls, 60-150s)')
+                log('info', f'COVINANCE RARE_GOODS: No commodity specified -> SLOW PATH (rare goods index + stock refresh)')
             
             if commodity:
                 log('info', f'COVINANCE RARE_GOODS: Attempting fast-path for: {repr(commodity)}')
@@ -6398,22 +9279,6 @@ class COVINANCE(PluginBase):
             # SLOW-PATH: Search all rare goods
             log('info', f'COVINANCE RARE_GOODS: Starting SLOW PATH - scanning all {len(rare_goods_data)} rare goods within {max_distance} LY of {self.current_system}')
             
-            # Get all nearby systems
-            endpoint = f'/system/name/{quote(self.current_system)}/nearby'
-            params = {'maxDistance': max_distance}
-            
-            nearby_systems = self.call_ardent_api(endpoint, params)
-            
-            # Check for API errors first
-            if "error" in nearby_systems:
-                log('error', f'COVINANCE RARE_GOODS: API error getting nearby systems - {nearby_systems["error"]}')
-                return f"COVINANCE: Error getting nearby systems - {nearby_systems['error']}"
-            
-            if not isinstance(nearby_systems, list) or len(nearby_systems) == 0:
-                return f"COVINANCE: No systems found within {max_distance} LY."
-            
-            log('info', f'COVINANCE: Checking {len(nearby_systems)} systems for rare goods')
-            
             # Search for rare goods in nearby systems
             # ✅ v7.6: PARALLEL EXECUTION - Check all systems concurrently
             rare_goods_found = []
@@ -6497,25 +9362,67 @@ class COVINANCE(PluginBase):
                 
                 return check_system
             
+            # Rare goods index: distance-filter known home stations locally, then
+            # refresh stock only in the systems that actually sell rare goods
+            nearby_systems = None
+            unindexed = 0
+            center = self._get_system_coordinates(self.current_system)
+            if center is not None:
+                unindexed = self._refresh_rare_goods_index()
+                if self.rare_goods_index.indexed_count():
+                    in_range = {}
+                    for _, _, system_name, distance, _ in self.rare_goods_index.within(
+                        (center['x'], center['y'], center['z']), max_distance
+                    ):
+                        in_range.setdefault(system_name, distance)
+                    nearby_systems = [{'systemName': name, 'distance': distance} for name, distance in in_range.items()]
+                    log('info', f'COVINANCE RARE_GOODS: Index has {len(nearby_systems)} rare goods systems within {max_distance} LY')
+            
+            if nearby_systems is None:
+                # Index unavailable - fall back to scanning every nearby system
+                nearby_systems = self._get_nearby_systems(self.current_system, max_distance)
+                
+                # Check for API errors first
+                if "error" in nearby_systems:
+                    log('error', f'COVINANCE RARE_GOODS: API error getting nearby systems - {nearby_systems["error"]}')
+                    return f"COVINANCE: Error getting nearby systems - {nearby_systems['error']}"
+                
+                if not isinstance(nearby_systems, list) or len(nearby_systems) == 0:
+                    return f"COVINANCE: No systems found within {max_distance} LY."
+                
+                scan_note = "Checked {checked} systems using complete rare goods database"
+            else:
+                scan_note = "Refreshed stock at {checked} rare goods systems from local index"
+                if unindexed:
+                    scan_note += f", {unindexed} rare goods not yet indexed"
+            
+            log('info', f'COVINANCE: Checking {len(nearby_systems)} systems for rare goods')
+            
             # Create tasks for all systems
             tasks = [make_system_task(sys) for sys in nearby_systems]
             
             log('info', f'COVINANCE: Running parallel scan of {len(tasks)} systems (8 workers)...')
             
-            # Execute in parallel
-            results, errors = self.parallel_runner.run_batch(tasks, timeout_per_task=10.0)
+            # Execute in parallel - bounded latency, partial results if the scan overruns
+            results, errors, abandoned = self.parallel_runner.run_batch(
+                tasks, timeout_per_task=10.0, deadline=self.RARE_SCAN_TIME_BUDGET
+            )
             
             # Aggregate results from all systems
             for system_results in results:
                 rare_goods_found.extend(system_results)
             
-            systems_checked = len(tasks)
-            
             if errors:
                 log('warning', f'COVINANCE: {len(errors)} systems failed during parallel scan')
             
+            # Report the systems actually checked (each finished task returns a list, even if empty)
+            checked = f"{len(results)} of {len(tasks)}" if abandoned else str(len(tasks))
+            scan_note = scan_note.format(checked=checked)
+            if abandoned:
+                scan_note += f" - {abandoned} skipped at the {self.RARE_SCAN_TIME_BUDGET:.0f}s time limit"
+            
             if len(rare_goods_found) == 0:
-                return f"COVINANCE: No rare goods found within {max_distance} LY with stock >= {min_allocation} units (checked {systems_checked} systems)."
+                return f"COVINANCE: No rare goods found within {max_distance} LY with stock >= {min_allocation} units ({scan_note})."
             
             # Sort results
             if sort_by == 'distance':
@@ -6526,7 +9433,7 @@ class COVINANCE(PluginBase):
             # Format for voice output
             result = []
             result.append(f"COVINANCE: Found {len(rare_goods_found)} rare goods within {max_distance} LY" + chr(10))
-            result.append(f"(Checked {systems_checked} systems using complete rare goods database)" + chr(10))
+            result.append(f"({scan_note})" + chr(10))
             result.append(chr(10) + "🌟 RARE GOODS DISCOVERED:" + chr(10))
             
             # Show top 10 for voice (Claude can see all in raw data)
@@ -6595,16 +9502,22 @@ class COVINANCE(PluginBase):
             max_distance: Search radius in LY (default: 100)
             reference_system: System to search from (optional, uses current)
             min_pad_size: Landing pad requirement (optional, auto from Journal)
+            max_results: Stop once this many safe stations are found (default: 10)
         
         Returns: List of safe Interstellar Factors sorted by distance
+        
+        Performance:
+            Security lookups run in parallel (cached 1 hour) and are consumed in
+            distance order - the search stops as soon as max_results are found.
         """
         try:
             max_distance = args.get('max_distance', 100)
+            max_results = args.get('max_results', 10)
             reference_system = args.get('reference_system', '').strip()
             pad_size_override = args.get('min_pad_size')
             
             # Get Journal data for defaults
-            journal_data = self.read_latest_journal()
+            journal_data = self._state_snapshot(args, projected_states)['ship']
             ship_type = journal_data.get('ShipType', '') if journal_data else ''
             
             # Determine pad size requirement
@@ -6617,7 +9530,6 @@ class COVINANCE(PluginBase):
             
             # Get reference system
             if not reference_system:
-                self.update_location_from_journal()
                 if not self.current_system:
                     return "COVINANCE: Unable to determine your location. Dock somewhere or specify a system."
                 reference_system = self.current_system
@@ -6639,35 +9551,47 @@ class COVINANCE(PluginBase):
             log('info', f'COVINANCE: Found {len(stations)} Interstellar Factors, checking security levels')
             
             # Step 2: Check security level for each station's system
-            safe_stations = []
+            # Stations arrive sorted by distance - look up security in parallel,
+            # consume in distance order, stop once enough safe stations are found
+            in_range = [
+                station for station in stations
+                if station.get('systemName') and station.get('distance', 0) <= max_distance
+            ]
+            
+            def make_status_task(system_name):
+                def get_security():
+                    status_endpoint = f'/system/name/{quote(system_name)}/status'
+                    status = self.call_ardent_api(status_endpoint, {})
+                    if isinstance(status, dict) and "error" not in status:
+                        return (status.get('security') or '').lower()
+                    return None
+                return get_security
             
-            for station in stations:
-                system_name = station.get('systemName')
-                distance = station.get('distance', 0)
-                
-                # Skip if outside max_distance
-                if distance > max_distance:
-                    continue
-                
-                # Get system security level
-                status_endpoint = f'/system/name/{quote(system_name)}/status'
-                status = self.call_ardent_api(status_endpoint, {})
-                
-                if isinstance(status, dict):
-                    security = status.get('security', '').lower()
-                    
+            safe_stations = []
+            lookups = self.parallel_runner.run_ordered(
+                [make_status_task(station['systemName']) for station in in_range],
+                timeout_per_task=10.0
+            )
+            try:
+                for index, security in lookups:
                     # Filter to safe systems only (Anarchy, Low, or None)
-                    if security in ['anarchy', 'low', 'none', '']:
-                        safe_stations.append({
-                            'station': station.get('stationName', 'Unknown'),
-                            'system': system_name,
-                            'distance': distance,
-                            'distance_to_arrival': station.get('distanceToArrival', 0),
-                            'pad_size': station.get('maxLandingPadSize', 'Unknown'),
-                            'station_type': station.get('stationType', 'Unknown'),
-                            'security': security if security else 'none',
-                            'updated_at': station.get('updatedAt', '')
-                        })
+                    if security not in ['anarchy', 'low', 'none', '']:
+                        continue
+                    station = in_range[index]
+                    safe_stations.append({
+                        'station': station.get('stationName', 'Unknown'),
+                        'system': station.get('systemName'),
+                        'distance': station.get('distance', 0),
+                        'distance_to_arrival': station.get('distanceToArrival', 0),
+                        'pad_size': station.get('maxLandingPadSize', 'Unknown'),
+                        'station_type': station.get('stationType', 'Unknown'),
+                        'security': security if security else 'none',
+                        'updated_at': station.get('updatedAt', '')
+                    })
+                    if len(safe_stations) >= max_results:
+                        break
+            finally:
+                lookups.close()  # Cancel lookups for stations we no longer need
             
             if len(safe_stations) == 0:
                 return f"COVINANCE: No SAFE Interstellar Factors found within {max_distance} LY. All nearby stations are in High/Medium security systems (dangerous for wanted commanders)."
@@ -6714,7 +9638,9 @@ class COVINANCE(PluginBase):
         - Cache hit rate (% of requests served from cache)
         - Total requests processed
         - API calls saved by caching
-        - Cache hits, misses, in-flight hits
+        - Cache hits, misses, in-flight hits, disk hits
+        - Memory use against budget, LRU evictions, expired entries swept
+        - Stale market data served while refreshing in the background
         
         Voice triggers:
         - "Show cache stats"
@@ -6725,6 +9651,8 @@ class COVINANCE(PluginBase):
         """
         try:
             stats = self.reliability_client.get_stats()
+            state_stats = self.state_provider.get_stats()
+            prefetch_stats = self.prefetcher.get_stats()
             
             return (
                 f"COVINANCE: Cache Performance\n"
@@ -6733,17 +9661,46 @@ class COVINANCE(PluginBase):
                 f"API Calls Saved: {stats['api_calls_saved']}\n"
                 f"Cache Hits: {stats['cache_hits']}\n"
                 f"Cache Misses: {stats['cache_misses']}\n"
-                f"In-Flight Hits: {stats['inflight_hits']}"
+                f"In-Flight Hits: {stats['inflight_hits']}\n"
+                f"Disk Hits: {stats['disk_hits']}\n"
+                f"Entries: {stats['entries']}/{stats['max_entries']} "
+                f"(~{stats['cache_bytes'] / 1048576:.1f}/{stats['max_bytes'] / 1048576:.0f} MB)\n"
+                f"Evictions: {stats['evictions']}\n"
+                f"Expired Swept: {stats['expired_swept']}\n"
+                f"Stale Served: {stats['stale_served']} ({stats['revalidations']} background refreshes)\n"
+                f"Radius Hits: {stats['radius_hits']} (narrower nearby searches answered from a cached wider one)\n"
+                f"Injected from Market.json: {stats['injected']}"
+                + f"\nRate Limit: {self.rate_limiter.rate:.1f} req/s ({self.rate_limiter.throttled} throttle responses)"
+                + f"\nGame State: {state_stats['snapshots']} snapshots ({state_stats['journal_fallbacks']} needed a Journal read)"
+                + f"\nPrefetch: {prefetch_stats['triggers']} jumps/docks, {prefetch_stats['requests']} requests "
+                f"({prefetch_stats['completed']} completed, {prefetch_stats['interrupted']} stopped early)"
+                + self._lane_stats_lines()
             )
         except Exception as e:
             log('error', f'COVINANCE: Error getting cache stats: {str(e)}')
             return f"COVINANCE: Error retrieving cache statistics: {str(e)}"
 
+    def _lane_stats_lines(self) -> str:
+        """Worker pool queue depth and queue wait per lane for cache_stats"""
+        lines = []
+        for lane, stats in self.parallel_runner.get_lane_stats().items():
+            lines.append(
+                f"\nLane {lane}: {stats['queued']} queued, {stats['running']} running, "
+                f"{stats['completed']} done (wait avg {stats['avg_wait_ms']:.0f}ms, max {stats['max_wait_ms']:.0f}ms)"
+            )
+        return "".join(lines)
+
     def shutdown(self):
         """Cleanup resources on plugin shutdown"""
         try:
+            self.prefetcher.stop()
             if hasattr(self, 'parallel_runner'):
                 self.parallel_runner.shutdown()
                 log('info', 'COVINANCE: Parallel runner shut down cleanly')
+            self.reliability_client.shutdown()
+            self.http_session.close()
+            if self.reliability_client.persistent_store is not None:
+                self.reliability_client.persistent_store.close()
+                log('info', 'COVINANCE: Persistent cache flushed and closed')
         except Exception as e:
             log('error', f'COVINANCE: Error during shutdown: {str(e)}')
\ No newline at end of file
@@ -0,0 +1,66 @@
+"""
+Connection reuse benchmark against the local stub server.
+
+Runs the same fan-out twice - once with a bare requests.get per call (a new
+connection each time), once through the plugin's pooled keep-alive session -
+and prints wall time and TCP connections opened.
+
+    python tests/bench_keepalive.py [calls]
+"""
+
+import sys
+import time
+
+import conftest  # noqa: F401 - host API stand-ins and sys.path
+import requests
+
+from conftest import covinance
+from stub_server import StubArdentServer
+
+
+def route(path, query):
+    system = path.split('/')[3]
+    return [{'commodityName': f'c{i}', 'systemName': system, 'buyPrice': 100 + i} for i in range(50)]
+
+
+def run_unpooled(server, calls):
+    runner = covinance.ParallelRunner(max_workers=8)
+    try:
+        tasks = [
+            lambda i=i: requests.get(f'{server.base_url}/system/name/S{i}/commodities/exports', timeout=10).json()
+            for i in range(calls)
+        ]
+        runner.run_batch(tasks, deadline=60)
+    finally:
+        runner.shutdown()
+
+
+def run_pooled(server, calls):
+    covinance.COVINANCE.get_plugin_folder_path = lambda self: ''  # No on-disk cache
+    covinance.COVINANCE.get_journal_directory = lambda self: ''
+    plugin = covinance.COVINANCE(covinance.PluginManifest())
+    plugin.rate_limiter.rate = plugin.rate_limiter.max_rate = 1e6  # Measure connections, not throttling
+    plugin.rate_limiter.capacity = plugin.rate_limiter.tokens = 1e6
+    plugin.api_base_url = server.base_url
+    try:
+        plugin._fetch_many([(f'/system/name/S{i}/commodities/exports', {}, None) for i in range(calls)],
+                           time_budget=60)
+    finally:
+        plugin.shutdown()
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    for name, run in (('requests.get per call', run_unpooled), ('pooled session', run_pooled)):
+        server = StubArdentServer(route).start()
+        try:
+            started = time.perf_counter()
+            run(server, calls)
+            elapsed = time.perf_counter() - started
+            print(f'{name:>22}: {calls} calls in {elapsed:.2f}s over {server.connections} connections')
+        finally:
+            server.stop()
+
+
+if __name__ == '__main__':
+    main()
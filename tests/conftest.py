@@ -0,0 +1,89 @@
+"""
+Shared fixtures for the Covinance tests (run from the repository root: python -m pytest tests).
+
+The plugin imports the COVAS NEXT host API (lib.PluginBase, lib.PluginHelper, ...),
+which only exists inside the running app. When it is not importable, minimal
+stand-ins with the same names are registered so the plugin module can load.
+"""
+
+import os
+import sys
+import types
+import typing
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+for path in (REPO_ROOT, TESTS_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+if not hasattr(typing, 'override'):  # Python < 3.12
+    typing.override = lambda func: func
+
+
+def _register_host_api():
+    """Stand-ins for the COVAS NEXT host modules the plugin imports"""
+    class PluginBase:
+        def __init__(self, plugin_manifest):
+            self.plugin_manifest = plugin_manifest
+
+    class PluginHelper:
+        def register_action(self, *args, **kwargs):
+            pass
+
+        def register_status_generator(self, *args, **kwargs):
+            pass
+
+    class PluginManifest:
+        def __init__(self, name='Covinance', version='7.6'):
+            self.name = name
+            self.version = version
+
+    class PluginSettings:
+        def __init__(self, **kwargs):
+            self.__dict__.update(kwargs)
+
+    def log(level, message):
+        pass
+
+    modules = {
+        'lib': {},
+        'lib.PluginBase': {'PluginBase': PluginBase},
+        'lib.PluginHelper': {'PluginHelper': PluginHelper, 'PluginManifest': PluginManifest},
+        'lib.PluginSettingDefinitions': {'PluginSettings': PluginSettings},
+        'lib.Logger': {'log': log},
+    }
+    for name, attributes in modules.items():
+        module = types.ModuleType(name)
+        module.__dict__.update(attributes)
+        sys.modules[name] = module
+
+
+try:
+    import lib.PluginBase  # noqa: F401
+except ImportError:
+    _register_host_api()
+
+from Covinance import Covinance as covinance  # noqa: E402
+from stub_server import StubArdentServer  # noqa: E402
+
+
+@pytest.fixture
+def stub_server():
+    server = StubArdentServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def plugin(stub_server, tmp_path, monkeypatch):
+    """COVINANCE pointed at the stub server, with its on-disk cache in tmp_path and no Journal"""
+    monkeypatch.setattr(covinance.COVINANCE, 'get_plugin_folder_path', lambda self: str(tmp_path))
+    monkeypatch.setattr(covinance.COVINANCE, 'get_journal_directory', lambda self: '')
+    instance = covinance.COVINANCE(covinance.PluginManifest())
+    instance.api_base_url = stub_server.base_url
+    instance.current_system = 'Sol'
+    yield instance
+    instance.shutdown()
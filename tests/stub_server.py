@@ -0,0 +1,105 @@
+"""
+Threaded HTTP/1.1 stand-in for the Ardent API, used by the tests and benchmarks.
+
+Responses come from a route function (path, query) -> body | (status, body) |
+(status, body, headers). Bodies are sent as JSON, either with Content-Length or
+chunked, optionally gzip-encoded. Every request path and every new TCP
+connection is counted, so tests can check keep-alive reuse and API hits.
+"""
+
+import gzip
+import http.server
+import json
+import socketserver
+import threading
+import time
+from urllib.parse import parse_qs, unquote, urlparse
+
+
+class StubArdentServer:
+    """Local Ardent API stub - start(), point api_base_url at .base_url, stop()"""
+
+    CHUNK_BYTES = 777  # Odd size so JSON tokens straddle chunk boundaries
+
+    def __init__(self, route=None):
+        self.route = route or (lambda path, query: [])
+        self.mode = 'plain'  # 'plain', 'chunked' or 'gzip' (gzip is always chunked)
+        self.delay = 0.0  # Seconds to sleep before answering each request
+        self.hits = []  # Request paths (without /v2), in arrival order
+        self.connections = 0
+        self.lock = threading.Lock()
+        self.server = None
+
+    @property
+    def base_url(self) -> str:
+        return f'http://127.0.0.1:{self.server.server_port}/v2'
+
+    def hits_for(self, fragment: str) -> int:
+        """Number of requests whose path contains fragment"""
+        with self.lock:
+            return sum(1 for path in self.hits if fragment in path)
+
+    def start(self):
+        stub = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True  # Headers and body go out as separate writes on a kept-alive socket
+
+            def setup(self):
+                with stub.lock:
+                    stub.connections += 1
+                super().setup()
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                path = unquote(url.path)
+                if path.startswith('/v2'):
+                    path = path[3:]
+                query = {key: values[0] for key, values in parse_qs(url.query).items()}
+                with stub.lock:
+                    stub.hits.append(path)
+                if stub.delay:
+                    time.sleep(stub.delay)
+
+                status, headers = 200, {}
+                body = stub.route(path, query)
+                if isinstance(body, tuple) and len(body) == 3:
+                    status, body, headers = body
+                elif isinstance(body, tuple):
+                    status, body = body
+                payload = json.dumps(body).encode()
+
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                if stub.mode == 'gzip':
+                    payload = gzip.compress(payload)
+                    self.send_header('Content-Encoding', 'gzip')
+                if stub.mode in ('chunked', 'gzip'):
+                    self.send_header('Transfer-Encoding', 'chunked')
+                    self.end_headers()
+                    for i in range(0, len(payload), stub.CHUNK_BYTES):
+                        chunk = payload[i:i + stub.CHUNK_BYTES]
+                        self.wfile.write(b'%x\r\n' % len(chunk) + chunk + b'\r\n')
+                    self.wfile.write(b'0\r\n\r\n')
+                else:
+                    self.send_header('Content-Length', str(len(payload)))
+                    self.end_headers()
+                    self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        class Server(socketserver.ThreadingMixIn, http.server.HTTPServer):
+            daemon_threads = True
+
+        self.server = Server(('127.0.0.1', 0), Handler)
+        threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True).start()
+        return self
+
+    def stop(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
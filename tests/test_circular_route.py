@@ -0,0 +1,80 @@
+"""covinance_circular_route: beam search over the trade graph (_search_trade_cycle)."""
+
+import pytest
+
+from trade_world import TradeWorld
+
+
+def edge(profit, distance=10.0, jumps=1):
+    return {'profit': profit, 'commodity': 'gold' if profit else None, 'buy': None, 'sell': None,
+            'distance': distance, 'jumps': jumps}
+
+
+def by_profit(route):
+    return (-route[2], route[3])
+
+
+def by_distance(route):
+    return (route[3], -route[2])
+
+
+@pytest.fixture
+def graph():
+    return {
+        'Sol': {'A': edge(200), 'B': edge(0, 14.1)},
+        'A': {'Sol': edge(0), 'B': edge(200)},
+        'B': {'Sol': edge(190, 14.1), 'A': edge(0)},
+    }
+
+
+def test_best_loop_closes_on_the_start_system(plugin, graph):
+    routes = plugin._search_trade_cycle(graph, 'Sol', 3, by_profit)
+
+    path, legs, profit, distance, jumps = routes[0]
+    assert path == ['Sol', 'A', 'B', 'Sol']
+    assert profit == 590
+    assert distance == pytest.approx(34.1)
+    assert jumps == 3
+
+
+def test_loops_never_revisit_an_intermediate_system(plugin, graph):
+    for path, *_ in plugin._search_trade_cycle(graph, 'Sol', 3, by_profit):
+        assert path[0] == path[-1] == 'Sol'
+        assert len(set(path[1:-1])) == len(path) - 2 and 'Sol' not in path[1:-1]
+
+
+def test_rank_key_chooses_the_loop(plugin, graph):
+    graph['Sol']['A'] = edge(200, 50.0, 3)  # Profitable but long first leg
+    graph['A']['Sol'] = edge(10, 50.0, 3)
+
+    by_money = plugin._search_trade_cycle(graph, 'Sol', 2, by_profit)
+    by_ly = plugin._search_trade_cycle(graph, 'Sol', 2, by_distance)
+
+    assert by_money[0][0] == ['Sol', 'A', 'Sol']
+    assert by_ly[0][0] == ['Sol', 'B', 'Sol']
+
+
+def test_unprofitable_or_open_loops_are_dropped(plugin):
+    graph = {'Sol': {'A': edge(0)}, 'A': {'Sol': edge(0), 'B': edge(500)}, 'B': {}}
+
+    assert plugin._search_trade_cycle(graph, 'Sol', 2, by_profit) == []
+    assert plugin._search_trade_cycle(graph, 'Sol', 3, by_profit) == []  # B has no way back
+
+
+def test_circular_route_action_against_the_api(plugin, stub_server):
+    world = (
+        TradeWorld()
+        .add_system('Sol', 0).add_system('Alpha', 10).add_system('Beta', 10, 10).add_system('Far', 500)
+        .add_station('Sol', 'Galileo', 1, exports={'gold': 100}, imports={'tea': 200})
+        .add_station('Alpha', 'Alpha Port', 2, exports={'silver': 50}, imports={'gold': 300})
+        .add_station('Beta', 'Beta Hub', 3, exports={'tea': 10}, imports={'silver': 250})
+        .add_station('Far', 'Far Out', 4, imports={'gold': 9000})
+    )
+    stub_server.route = world.route
+
+    result = plugin.covinance_circular_route({'num_hops': 3, 'max_distance': 30}, {})
+
+    assert 'Sol' in result and 'Alpha' in result and 'Beta' in result
+    assert 'Far' not in result
+    assert 'Total profit: 590 CR/unit per loop' in result
+    assert result.index('Buy: Gold') < result.index('Buy: Silver') < result.index('Buy: Tea')
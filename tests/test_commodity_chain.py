@@ -0,0 +1,66 @@
+"""covinance_multi_commodity_chain: dynamic programming over the trade graph (_search_trade_chain)."""
+
+from trade_world import TradeWorld
+
+
+def edge(profit, distance=10.0):
+    return {'profit': profit, 'commodity': 'gold' if profit else None, 'buy': None, 'sell': None,
+            'distance': distance, 'jumps': 1}
+
+
+def test_chain_maximizes_total_profit_not_the_first_leg(plugin):
+    graph = {
+        'Sol': {'A': edge(500), 'B': edge(100)},
+        'A': {'Sol': edge(0), 'B': edge(0)},
+        'B': {'Sol': edge(0), 'A': edge(900)},
+    }
+
+    path, legs, total = plugin._search_trade_chain(graph, 'Sol', 2)
+
+    assert path == ['Sol', 'B', 'A']
+    assert total == 1000
+    assert [leg['profit'] for leg in legs] == [100, 900]
+
+
+def test_ping_pong_between_two_markets_is_allowed(plugin):
+    graph = {'Sol': {'A': edge(300)}, 'A': {'Sol': edge(200)}}
+
+    path, legs, total = plugin._search_trade_chain(graph, 'Sol', 4)
+
+    assert path == ['Sol', 'A', 'Sol', 'A', 'Sol']
+    assert total == 1000
+
+
+def test_chain_stops_where_the_graph_ends(plugin):
+    graph = {'Sol': {'A': edge(300)}, 'A': {}}
+
+    path, legs, total = plugin._search_trade_chain(graph, 'Sol', 5)
+
+    assert path == ['Sol', 'A']
+    assert total == 300
+
+
+def test_no_profitable_leg_means_no_chain(plugin):
+    graph = {'Sol': {'A': edge(0)}, 'A': {'Sol': edge(0)}}
+
+    assert plugin._search_trade_chain(graph, 'Sol', 3) is None
+    assert plugin._search_trade_chain({'Sol': {}}, 'Sol', 3) is None
+
+
+def test_chain_action_against_the_api(plugin, stub_server):
+    world = (
+        TradeWorld()
+        .add_system('Sol', 0).add_system('Alpha', 10).add_system('Beta', 20)
+        .add_station('Sol', 'Galileo', 1, exports={'gold': 100})
+        .add_station('Alpha', 'Alpha Port', 2, exports={'silver': 50}, imports={'gold': 400})
+        .add_station('Beta', 'Beta Hub', 3, imports={'silver': 350})
+    )
+    stub_server.route = world.route
+
+    result = plugin.covinance_multi_commodity_chain({'num_hops': 2, 'max_distance': 30}, {})
+
+    assert '2-hop commodity chain from Sol' in result
+    assert '\n1. Sol ' in result and 'Alpha (10.0 LY)' in result
+    assert '\n2. Alpha ' in result and 'Beta (10.0 LY)' in result
+    assert 'Profit: 600 CR/unit' in result
+    assert stub_server.hits_for('/commodities/exports') == 3
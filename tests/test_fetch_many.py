@@ -0,0 +1,116 @@
+"""asyncio fan-out batches (COVINANCE._fetch_many / AsyncArdentClient) against the local stub server."""
+
+import threading
+import time
+
+import pytest
+
+from conftest import covinance
+
+
+def exports_call(system):
+    return f'/system/name/{system}/commodities/exports', {}, None
+
+
+def route_markets(path, query):
+    if path.endswith('/commodities/exports'):
+        system = path.split('/')[3]
+        return [{'commodityName': 'gold', 'systemName': system, 'stationName': f'{system} Port', 'marketId': 1,
+                 'buyPrice': 100, 'stock': 50}]
+    return []
+
+
+@pytest.fixture
+def unthrottled(plugin):
+    """Lift the per-host rate limit - these batches are about concurrency, not pacing"""
+    plugin.rate_limiter.rate = plugin.rate_limiter.max_rate = 1e6
+    plugin.rate_limiter.capacity = plugin.rate_limiter.tokens = 1e6
+    return plugin
+
+
+def test_batch_results_match_single_calls(unthrottled, stub_server):
+    plugin = unthrottled
+    stub_server.route = route_markets
+    calls = [exports_call(f'System {i}') for i in range(20)]
+
+    batch = plugin._fetch_many(calls)
+
+    assert stub_server.hits_for('/commodities/exports') == 20
+    assert [[row.to_dict() for row in rows] for rows in batch] == [
+        [row.to_dict() for row in plugin.call_ardent_api(*call)] for call in calls
+    ]
+    assert stub_server.hits_for('/commodities/exports') == 20  # Singles were cache hits
+    assert plugin.async_client.get_stats()['completed'] == 20
+
+
+def test_semaphore_bounds_calls_in_flight(unthrottled, stub_server):
+    plugin = unthrottled
+    lock = threading.Lock()
+    active = [0, 0]  # [now, peak]
+
+    def route(path, query):
+        with lock:
+            active[0] += 1
+            active[1] = max(active)
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+        return []
+
+    stub_server.route = route
+
+    results = plugin._fetch_many([exports_call(f'System {i}') for i in range(40)])
+
+    assert results == [[]] * 40
+    assert 1 < active[1] <= covinance.AsyncArdentClient.MAX_CONCURRENCY
+    assert stub_server.connections <= covinance.AsyncArdentClient.MAX_CONCURRENCY + 2  # Pooled keep-alive
+
+
+def test_deadline_returns_on_time_and_queued_calls_never_start(unthrottled, stub_server):
+    plugin = unthrottled
+    stub_server.route = route_markets
+    stub_server.delay = 0.5
+
+    started = time.monotonic()
+    results = plugin._fetch_many([exports_call(f'System {i}') for i in range(40)], time_budget=0.3)
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 1.0
+    assert results == [None] * 40
+    assert plugin.parallel_runner.get_lane_stats()['fanout']['queued'] == 0
+    assert plugin.async_client.get_stats()['cancelled'] == 40
+    time.sleep(0.7)
+    assert stub_server.hits_for('/commodities/exports') <= covinance.AsyncArdentClient.MAX_CONCURRENCY
+
+
+def test_running_stragglers_stop_and_are_not_cached(unthrottled, stub_server):
+    plugin = unthrottled
+    stub_server.route = route_markets
+    stub_server.delay = 0.4
+    call = exports_call('Sol')
+
+    assert plugin._fetch_many([call], time_budget=0.1) == [None]
+    time.sleep(0.5)  # The response arrives after the deadline and is dropped at the first chunk
+
+    assert plugin.reliability_client.get_stats()['entries'] == 0
+    stub_server.delay = 0
+    assert [row['systemName'] for row in plugin.call_ardent_api(*call)] == ['Sol']
+    assert stub_server.hits_for('/commodities/exports') == 2
+
+
+def test_batch_shares_in_flight_requests_with_single_calls(unthrottled, stub_server):
+    plugin = unthrottled
+    stub_server.route = route_markets
+    stub_server.delay = 0.3
+    call = exports_call('Sol')
+
+    single = {}
+    thread = threading.Thread(target=lambda: single.update(rows=plugin.call_ardent_api(*call)))
+    thread.start()
+    time.sleep(0.1)
+    results = plugin._fetch_many([call, call])
+    thread.join()
+
+    assert stub_server.hits_for('/commodities/exports') == 1
+    assert [row.to_dict() for row in results[0]] == [row.to_dict() for row in single['rows']]
+    assert results[0] is results[1]
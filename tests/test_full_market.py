@@ -0,0 +1,85 @@
+"""Full-market nearby trades: _top_spreads against brute force, and the capped market scan."""
+
+import random
+
+import pytest
+
+from conftest import covinance
+from trade_world import TradeWorld
+
+
+def top_spreads(sides, k, min_profit=None):
+    # Pure function of its arguments - no plugin state needed
+    return covinance.COVINANCE._top_spreads(None, sides, k, min_profit)
+
+
+def brute_force(sides, min_profit=None):
+    threshold = min_profit if min_profit else 1
+    pairs = []
+    for commodity, (buys, sells) in sides.items():
+        for buy in buys:
+            for sell in sells:
+                if buy['buyPrice'] <= 0 or sell['sellPrice'] <= 0:
+                    continue
+                profit = sell['sellPrice'] - buy['buyPrice']
+                if threshold <= profit <= 1_000_000:
+                    pairs.append(profit)
+    return sorted(pairs, reverse=True)
+
+
+def random_sides(seed, commodities=6, rows=40):
+    rng = random.Random(seed)
+    sides = {}
+    for c in range(commodities):
+        base = rng.randint(100, 50_000)
+        buys = [{'buyPrice': max(0, base + rng.randint(-2000, 2000)), 'stationName': f'B{c}-{i}'} for i in range(rows)]
+        sells = [{'sellPrice': max(0, base + rng.randint(-2000, 2000)), 'stationName': f'S{c}-{i}'} for i in range(rows)]
+        sides[f'commodity{c}'] = (buys, sells)
+    return sides
+
+
+@pytest.mark.parametrize('seed', range(5))
+@pytest.mark.parametrize('min_profit', [None, 500])
+def test_matches_brute_force(seed, min_profit):
+    sides = random_sides(seed)
+    expected = brute_force(sides, min_profit)
+
+    top, total = top_spreads(sides, 10, min_profit)
+
+    assert total == len(expected)
+    assert [profit for profit, _, _, _ in top] == expected[:10]
+    for profit, commodity, buy, sell in top:
+        assert sell['sellPrice'] - buy['buyPrice'] == profit
+        assert buy in sides[commodity][0] and sell in sides[commodity][1]
+
+
+def test_no_profitable_pairs():
+    sides = {'gold': ([{'buyPrice': 100}], [{'sellPrice': 90}])}
+    assert top_spreads(sides, 5) == ([], 0)
+
+
+def test_suspicious_spreads_are_skipped():
+    sides = {'gold': ([{'buyPrice': 1}, {'buyPrice': 900}], [{'sellPrice': 2_000_000}, {'sellPrice': 1000}])}
+
+    top, total = top_spreads(sides, 5)
+
+    assert [profit for profit, _, _, _ in top] == [999, 100]
+    assert total == 2
+
+
+def test_full_market_scans_every_commodity_of_the_nearest_systems(plugin, stub_server):
+    world = TradeWorld().add_system('Sol', 0)
+    world.add_station('Sol', 'Galileo', 1, exports={'tea': 100, 'gold': 9000})
+    for i in range(1, 6):
+        world.add_system(f'S{i}', 5 * i)
+        world.add_station(f'S{i}', f'Port {i}', 10 + i, imports={'tea': 100 + 200 * i, 'gold': 9100})
+    stub_server.route = world.route
+    plugin.FULL_MARKET_MAX_SYSTEMS = 3  # Sol and its two nearest neighbours
+
+    result = plugin.covinance_nearby_profitable_trades({'max_distance': 30, 'full_market': True}, {})
+
+    assert stub_server.hits_for('/commodities/exports') == 3
+    assert 'nearest 3 (3 farther skipped, 0 abandoned at the time limit)' in result
+    assert '1. Tea: 400 CR/unit' in result  # Not one of the sampled PROFIT_SCAN_COMMODITIES
+    assert 'Sell: Port 2 (S2)' in result
+    assert 'Opportunities found: 4' in result
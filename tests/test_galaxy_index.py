@@ -0,0 +1,96 @@
+"""GalaxyIndex: grid radius/nearest queries, coverage spheres and persistence."""
+
+import math
+import random
+
+import pytest
+
+from conftest import covinance
+from trade_world import TradeWorld
+
+
+def scattered(count=2000, seed=7, spread=200.0):
+    rng = random.Random(seed)
+    return [(f'S{i}', rng.uniform(-spread, spread), rng.uniform(-spread, spread), rng.uniform(-spread, spread))
+            for i in range(count)]
+
+
+@pytest.fixture
+def index():
+    galaxy_index = covinance.GalaxyIndex()
+    for name, x, y, z in scattered():
+        galaxy_index.add_system(name, x, y, z)
+    return galaxy_index
+
+
+@pytest.mark.parametrize('center, radius', [((0, 0, 0), 40), ((120.5, -30, 7), 75), ((-199, 199, 0), 25.1)])
+def test_radius_query_matches_brute_force(index, center, radius):
+    expected = sorted(
+        (math.dist(center, (x, y, z)), name) for name, x, y, z in scattered() if math.dist(center, (x, y, z)) <= radius
+    )
+
+    found = index.query_radius(center, radius)
+
+    assert [(distance, name) for name, distance, *_ in found] == expected
+
+
+def test_nearest_grows_its_search_shell(index):
+    center = (10, 10, 10)
+    expected = sorted(scattered(), key=lambda s: math.dist(center, s[1:]))[:8]
+
+    found = index.nearest(center, 8, max_radius=500)
+
+    assert [name for name, *_ in found] == [name for name, *_ in expected]
+
+
+def test_moved_system_is_rebucketed(index):
+    index.add_system('S0', 1000, 1000, 1000)
+
+    assert index.coordinates('s0') == (1000.0, 1000.0, 1000.0)
+    assert [name for name, *_ in index.query_radius((1000, 1000, 1000), 1)] == ['S0']
+
+
+def test_coverage_only_answers_spheres_inside_a_sweep():
+    index = covinance.GalaxyIndex()
+    index.add_coverage((0, 0, 0), 30)
+
+    assert index.is_covered((0, 0, 0), 30)
+    assert index.is_covered((10, 0, 0), 20)
+    assert not index.is_covered((10, 0, 0), 25)
+
+    index.add_coverage((0, 0, 0), 60)
+    assert len(index.coverage) == 1  # The narrower sweep was swallowed
+
+
+def test_index_survives_a_restart(tmp_path):
+    db_path = str(tmp_path / '_covinance_cache.db')
+    store = covinance.PersistentCacheStore(db_path)
+    index = covinance.GalaxyIndex(store)
+    index.ingest([{'systemName': 'Lave', 'systemX': -9.5, 'systemY': 18.7, 'systemZ': -23.8}])
+    index.add_coverage((0, 0, 0), 30)
+    store.close()
+
+    store = covinance.PersistentCacheStore(db_path)
+    try:
+        reloaded = covinance.GalaxyIndex(store)
+        assert reloaded.coordinates('lave') == (-9.5, 18.7, -23.8)
+        assert reloaded.is_covered((0, 0, 0), 30)
+    finally:
+        store.close()
+
+
+def test_nearby_systems_inside_a_sweep_are_answered_locally(plugin, stub_server):
+    world = TradeWorld().add_system('Sol', 0)
+    for i in range(1, 10):
+        world.add_system(f'S{i}', 5 * i)
+    stub_server.route = world.route
+    plugin.galaxy_index.add_system('Sol', 0, 0, 0)
+
+    wide = plugin._get_nearby_systems('Sol', 30)
+    narrow = plugin._get_nearby_systems('Sol', 20)
+    assert stub_server.hits_for('/nearby') == 1
+    assert [row['systemName'] for row in narrow] == ['S1', 'S2', 'S3', 'S4']
+    assert [row['systemName'] for row in wide] == [f'S{i}' for i in range(1, 7)]
+
+    plugin._get_nearby_systems('Sol', 40)  # Outside the sweep
+    assert stub_server.hits_for('/nearby') == 2
@@ -0,0 +1,129 @@
+"""GameFileWatcher and the zero-API live market from Market.json."""
+
+import json
+import time
+
+import pytest
+
+from conftest import covinance
+
+
+def now_iso(offset=0):
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(time.time() + offset))
+
+
+def market_json(market_id=128016640, station='Galileo', system='Sol', timestamp=None):
+    return {
+        'timestamp': timestamp or now_iso(), 'MarketID': market_id, 'StationName': station, 'StarSystem': system,
+        'StationType': 'Coriolis',
+        'Items': [
+            {'Name': '$gold_name;', 'BuyPrice': 9000, 'SellPrice': 8900, 'Stock': 25, 'Demand': 0},
+            {'Name': '$water_name;', 'BuyPrice': 0, 'SellPrice': 400, 'Stock': 0, 'Demand': 600},
+        ],
+    }
+
+
+def write(directory, name, data):
+    path = directory / name
+    path.write_text(json.dumps(data), encoding='utf-8')
+    return path
+
+
+@pytest.fixture
+def watcher(tmp_path):
+    return covinance.GameFileWatcher(lambda: str(tmp_path))
+
+
+def test_only_changed_files_are_reloaded(watcher, tmp_path):
+    write(tmp_path, 'Market.json', market_json())
+    write(tmp_path, 'Status.json', {'Balance': 1234, 'Cargo': 3})
+
+    assert watcher.poll() == {'Market.json', 'Status.json'}
+    assert watcher.poll() == set()
+
+    market = watcher.get_market()
+    assert (market['market_id'], market['station'], market['system']) == (128016640, 'Galileo', 'Sol')
+    assert [(row['commodityName'], row['buyPrice']) for row in market['rows']] == [('gold', 9000), ('water', 0)]
+    assert watcher.get_ship_data() == {'CurrentCargo': 3, 'Credits': 1234}
+
+
+def test_cargo_json_wins_and_srv_cargo_is_ignored(watcher, tmp_path):
+    write(tmp_path, 'Status.json', {'Cargo': 3})
+    write(tmp_path, 'Cargo.json', {'Vessel': 'Ship', 'Inventory': [{'Name': 'gold', 'Count': 10},
+                                                                  {'Name': 'water', 'Count': 4}]})
+    watcher.poll()
+    assert watcher.get_ship_data()['CurrentCargo'] == 14
+
+    write(tmp_path, 'Cargo.json', {'Vessel': 'SRV', 'Inventory': [{'Name': 'gold', 'Count': 2}]})
+    watcher.poll()
+    assert watcher.get_ship_data()['CurrentCargo'] == 14
+
+
+def test_market_json_without_items_keeps_the_last_market(watcher, tmp_path):
+    write(tmp_path, 'Market.json', market_json())
+    watcher.poll()
+    write(tmp_path, 'Market.json', {'timestamp': now_iso(), 'MarketID': 1, 'StationName': 'Elsewhere'})
+
+    assert watcher.poll() == set()
+    assert watcher.get_market()['station'] == 'Galileo'
+
+
+@pytest.fixture
+def docked(plugin, tmp_path):
+    """Plugin reading game files from tmp_path"""
+    plugin.game_files.directory = str(tmp_path)
+    return plugin
+
+
+def test_station_market_at_the_docked_station_costs_no_api_calls(docked, stub_server, tmp_path):
+    write(tmp_path, 'Market.json', market_json())
+
+    result = docked.covinance_station_market({'station_name': 'galileo', 'system_name': 'Sol'}, {})
+
+    assert 'Galileo' in result and '9,000' in result
+    assert stub_server.hits == []
+    assert docked.reliability_client.get_stats()['injected'] == 1
+
+
+@pytest.mark.parametrize('station_name', ['Galileo Orbital', 'Gal'])
+def test_other_stations_are_not_answered_from_market_json(docked, stub_server, tmp_path, station_name):
+    write(tmp_path, 'Market.json', market_json())
+
+    docked.covinance_station_market({'station_name': station_name, 'system_name': 'Sol'}, {})
+
+    assert stub_server.hits_for('/commodities/exports') == 1
+
+
+def test_market_json_left_over_from_another_dock_is_ignored(docked, stub_server, tmp_path, monkeypatch):
+    write(tmp_path, 'Market.json', market_json())
+    monkeypatch.setattr(docked.journal_tailer, 'get_location', lambda: {'system': 'Sol', 'market_id': 128016641})
+
+    docked.covinance_station_market({'station_name': 'Galileo', 'system_name': 'Sol'}, {})
+
+    assert stub_server.hits_for('/commodities/exports') == 1
+
+
+def test_stale_market_json_is_not_injected(docked, stub_server, tmp_path):
+    write(tmp_path, 'Market.json', market_json(timestamp=now_iso(-2 * docked.LIVE_MARKET_TTL)))
+
+    docked._refresh_game_files()
+
+    assert docked.reliability_client.get_stats()['injected'] == 0
+
+
+def test_live_prices_are_overlaid_on_older_ardent_rows(docked, stub_server, tmp_path):
+    stub_server.route = lambda path, query: [
+        {'commodityName': 'gold', 'systemName': 'Sol', 'stationName': 'Galileo', 'marketId': 128016640,
+         'buyPrice': 8000, 'stock': 900, 'maxLandingPadSize': 3, 'updatedAt': now_iso(-3600)},
+        {'commodityName': 'gold', 'systemName': 'Sol', 'stationName': 'Daedalus', 'marketId': 128016641,
+         'buyPrice': 8500, 'stock': 100, 'maxLandingPadSize': 3, 'updatedAt': now_iso(-3600)},
+    ]
+    write(tmp_path, 'Market.json', market_json())
+    docked._refresh_game_files()
+
+    rows = docked.call_ardent_api('/system/name/Sol/commodities/exports', {})
+
+    prices = {row['stationName']: (row['buyPrice'], row['stock']) for row in rows}
+    assert prices == {'Galileo': (9000, 25), 'Daedalus': (8500, 100)}
+    assert [row['maxLandingPadSize'] for row in rows] == [3, 3]  # Static fields kept from Ardent
+    assert [row['commodityName'] for row in rows if row['marketId'] == 128016640] == ['gold']
@@ -0,0 +1,54 @@
+"""Pooled keep-alive session for Ardent API calls."""
+
+import pytest
+
+
+@pytest.fixture
+def unthrottled(plugin):
+    """Lift the shared rate limit so the tests measure connections, not throttling"""
+    plugin.rate_limiter.rate = plugin.rate_limiter.max_rate = 1e6
+    plugin.rate_limiter.capacity = plugin.rate_limiter.tokens = 1e6
+    return plugin
+
+
+def test_sequential_calls_share_one_connection(unthrottled, stub_server):
+    stub_server.route = lambda path, query: {'name': path.split('/')[3]}
+
+    for i in range(20):
+        assert unthrottled.call_ardent_api(f'/system/name/S{i}') == {'name': f'S{i}'}
+
+    assert stub_server.hits_for('/system/name/') == 20
+    assert stub_server.connections == 1
+
+
+@pytest.mark.parametrize('mode', ['chunked', 'gzip'])
+def test_connection_is_reused_after_chunked_and_gzip_bodies(unthrottled, stub_server, mode):
+    stub_server.route = lambda path, query: [{'systemName': path.split('/')[3], 'distance': i} for i in range(500)]
+    stub_server.mode = mode
+
+    for i in range(5):
+        assert len(unthrottled.call_ardent_api(f'/system/name/S{i}/nearby')) == 500
+
+    assert stub_server.connections == 1
+
+
+def test_concurrent_calls_stay_within_the_pool(unthrottled, stub_server):
+    stub_server.route = lambda path, query: {'name': path.split('/')[3]}
+    stub_server.delay = 0.02
+    runner = unthrottled.parallel_runner
+
+    results, errors, abandoned = runner.run_batch(
+        [lambda i=i: unthrottled.call_ardent_api(f'/system/name/S{i}') for i in range(80)], deadline=10
+    )
+
+    assert len(results) == 80 and not errors
+    assert stub_server.connections <= runner.max_workers + 2
+
+
+def test_session_advertises_keep_alive_and_gzip(plugin):
+    headers = plugin.http_session.headers
+    adapter = plugin.http_session.get_adapter(plugin.api_base_url)
+
+    assert headers['Connection'] == 'keep-alive'
+    assert 'gzip' in headers['Accept-Encoding']
+    assert adapter._pool_maxsize == plugin.parallel_runner.max_workers + 2
@@ -0,0 +1,50 @@
+"""covinance_safe_interstellar_factors: parallel security lookups with an early exit."""
+
+import time
+
+SECURITY = ['High', 'Medium', 'High', 'Low', 'Anarchy'] + ['Low'] * 15
+
+
+def route(path, query):
+    if path.endswith('/nearest/interstellar-factors'):
+        return [
+            {'systemName': f'IF{i}', 'stationName': f'Factors {i}', 'distance': 1.0 + i, 'distanceToArrival': 500,
+             'maxLandingPadSize': 'L', 'stationType': 'Coriolis', 'updatedAt': ''}
+            for i in range(len(SECURITY))
+        ]
+    if path.endswith('/status'):
+        return {'security': SECURITY[int(path.split('/')[3][2:])]}
+    return []
+
+
+def test_only_safe_systems_in_distance_order(plugin, stub_server):
+    stub_server.route = route
+
+    result = plugin.covinance_safe_interstellar_factors({'max_results': 3}, {})
+
+    assert 'Found 3 SAFE Interstellar Factors' in result
+    assert result.index('Factors 3, IF3') < result.index('Factors 4, IF4') < result.index('Factors 5, IF5')
+    assert 'IF0' not in result and 'IF1' not in result
+
+
+def test_search_stops_once_enough_safe_stations_are_found(plugin, stub_server):
+    stub_server.route = route
+    stub_server.delay = 0.2
+
+    started = time.monotonic()
+    result = plugin.covinance_safe_interstellar_factors({'max_results': 2}, {})
+    elapsed = time.monotonic() - started
+
+    assert 'Found 2 SAFE Interstellar Factors' in result
+    assert elapsed < 1.5  # 20 sequential lookups would take 4 s
+    time.sleep(0.5)  # Let lookups already on the wire finish
+    assert stub_server.hits_for('/status') < len(SECURITY)
+    assert plugin.parallel_runner.get_lane_stats()['fanout']['cancelled'] > 0
+
+
+def test_stations_beyond_max_distance_are_not_looked_up(plugin, stub_server):
+    stub_server.route = route
+
+    plugin.covinance_safe_interstellar_factors({'max_distance': 5}, {})
+
+    assert stub_server.hits_for('/status') == 5
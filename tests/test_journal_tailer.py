@@ -0,0 +1,117 @@
+"""JournalTailer: byte-offset tailing, partial lines, truncation and journal rotation."""
+
+import json
+
+import pytest
+
+from conftest import covinance
+
+
+def event(name, **fields):
+    return json.dumps({'timestamp': '3310-10-16T12:00:00Z', 'event': name, **fields}) + '\n'
+
+
+def append(path, text):
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(text)
+
+
+@pytest.fixture
+def journal(tmp_path):
+    path = tmp_path / 'Journal.2026-10-16T120000.01.log'
+    path.write_text(event('Fileheader', part=1), encoding='utf-8')
+    return path
+
+
+@pytest.fixture
+def tailer(journal):
+    latest = {'path': str(journal)}
+    journal_tailer = covinance.JournalTailer(lambda: latest['path'])
+    journal_tailer.RESCAN_INTERVAL = 0  # Look for a newer journal on every poll
+    journal_tailer.latest = latest
+    return journal_tailer
+
+
+def test_only_appended_bytes_are_parsed(tailer, journal):
+    append(journal, event('FSDJump', StarSystem='Sol', StarPos=[0, 0, 0]))
+    assert tailer.poll()
+    assert tailer.offset == journal.stat().st_size
+
+    assert not tailer.poll()  # Nothing new
+
+    append(journal, event('Music', MusicTrack='Supercruise'))
+    assert not tailer.poll()  # Untracked event
+    assert tailer.offset == journal.stat().st_size
+
+    append(journal, event('Docked', StarSystem='Sol', StationName='Abraham Lincoln', MarketID=128016640))
+    assert tailer.poll()
+    assert tailer.get_location() == {
+        'event': 'Docked',
+        'system': 'Sol',
+        'station': 'Abraham Lincoln',
+        'market_id': 128016640,
+        'coordinates': {'x': 0, 'y': 0, 'z': 0},
+    }
+
+
+def test_partial_line_waits_for_its_newline(tailer, journal):
+    tailer.poll()
+    line = event('Loadout', Ship='python', CargoCapacity=256, MaxJumpRange=18.5)
+
+    append(journal, line[:20])
+    assert not tailer.poll()
+    append(journal, line[20:])
+    assert tailer.poll()
+    assert tailer.get_ship_data() == {'CargoCapacity': 256, 'MaxJumpRange': 18.5, 'ShipType': 'python'}
+
+
+def test_later_events_win(tailer, journal):
+    append(journal, event('LoadGame', Credits=1_000) + event('FSDJump', StarSystem='Lave', StarPos=[1, 2, 3])
+           + event('LoadGame', Credits=2_000) + event('FSDJump', StarSystem='Leesti', StarPos=[4, 5, 6]))
+
+    tailer.poll()
+
+    assert tailer.get_ship_data()['Credits'] == 2_000
+    assert tailer.get_location()['system'] == 'Leesti'
+    assert tailer.get_location()['station'] is None
+
+
+def test_truncated_file_is_reread_from_the_start(tailer, journal):
+    append(journal, event('FSDJump', StarSystem='Lave', StarPos=[1, 2, 3]))
+    tailer.poll()
+
+    journal.write_text(event('Location', StarSystem='Sol', StarPos=[0, 0, 0]), encoding='utf-8')
+
+    assert tailer.poll()
+    assert tailer.get_location()['system'] == 'Sol'
+    assert tailer.offset == journal.stat().st_size
+
+
+def test_rotation_to_a_new_journal_resets_state(tailer, journal, tmp_path):
+    append(journal, event('FSDJump', StarSystem='Lave', StarPos=[1, 2, 3]) + event('LoadGame', Credits=5))
+    tailer.poll()
+
+    newer = tmp_path / 'Journal.2026-10-16T180000.01.log'
+    newer.write_text(event('Fileheader', part=1) + event('Location', StarSystem='Sol', StarPos=[0, 0, 0]),
+                     encoding='utf-8')
+    tailer.latest['path'] = str(newer)
+
+    assert tailer.poll()
+    assert tailer.journal_file == str(newer)
+    assert tailer.offset == newer.stat().st_size
+    assert tailer.get_location()['system'] == 'Sol'
+    assert tailer.get_ship_data() == {}  # Credits came from the previous session
+
+    append(journal, event('FSDJump', StarSystem='Lave', StarPos=[1, 2, 3]))
+    tailer.poll()
+    assert tailer.get_location()['system'] == 'Sol'  # Old file is no longer tailed
+
+
+def test_plugin_reads_location_through_the_tailer(plugin, journal):
+    append(journal, event('FSDJump', StarSystem='Shinrarta Dezhra', StarPos=[55.7, 17.6, 27.2]))
+    plugin.journal_tailer.find_latest_file = lambda: str(journal)
+
+    plugin.update_location_from_journal()
+
+    assert plugin.current_system == 'Shinrarta Dezhra'
+    assert plugin.system_coordinates == {'x': 55.7, 'y': 17.6, 'z': 27.2}
@@ -0,0 +1,91 @@
+"""JsonRowStream: incremental decoding and row views, whatever the chunk boundaries."""
+
+import json
+
+import pytest
+
+from conftest import covinance
+
+FIELDS = ('commodityName', 'stationName', 'buyPrice')
+
+
+def keep_buyable(row):
+    return (row.get('buyPrice') or 0) > 0
+
+
+def rows():
+    return [
+        {'commodityName': 'gold', 'stationName': 'Abraham Lincoln', 'buyPrice': 9400, 'meanPrice': 9500},
+        {'commodityName': 'tea', 'stationName': 'Quote "]" Station', 'buyPrice': 0},
+        {'commodityName': 'coffee', 'stationName': 'Ångström Dock – {1}', 'buyPrice': 1200,
+         'extra': {'nested': [1, 2, {'x': ']'}]}},
+        {'commodityName': 'water', 'stationName': 'Back\\slash', 'buyPrice': 300},
+    ]
+
+
+def decode(body: bytes, chunk_size: int, fields=FIELDS, keep=keep_buyable):
+    stream = covinance.JsonRowStream(fields, keep)
+    for i in range(0, len(body), chunk_size):
+        stream.feed(body[i:i + chunk_size])
+    return stream.finish()
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 7, 64, 1 << 16])
+def test_array_rows_filtered_and_projected_across_chunk_boundaries(chunk_size):
+    body = json.dumps(rows(), ensure_ascii=False, indent=1).encode('utf-8')
+
+    decoded = decode(body, chunk_size)
+
+    expected = [{key: row[key] for key in FIELDS} for row in rows() if row['buyPrice'] > 0]
+    assert [row.to_dict() for row in decoded] == expected
+    assert decoded.source_count == 4  # Every element counted, kept or not
+
+
+def test_empty_array():
+    decoded = decode(b' [ ] ', 1)
+    assert decoded == [] and decoded.source_count == 0
+
+
+def test_non_array_body_is_decoded_whole():
+    body = json.dumps({'error': 'Not found', 'detail': ['a', 'b']}).encode()
+    assert decode(body, 3) == {'error': 'Not found', 'detail': ['a', 'b']}
+
+
+def test_without_view_the_body_is_decoded_whole():
+    body = json.dumps(rows()).encode()
+    assert decode(body, 5, fields=None, keep=None) == rows()
+
+
+def test_truncated_array_raises():
+    body = json.dumps(rows()).encode()[:-10]
+    with pytest.raises(ValueError):
+        decode(body, 16)
+
+
+def test_bytes_after_the_closing_bracket_are_ignored():
+    body = json.dumps(rows()[:1]).encode() + b'\n'
+    assert len(decode(body, 4)) == 1
+
+
+def exports(path, query):
+    """Exports-shaped rows; every third row has no buy price"""
+    system = path.split('/')[3]
+    return [
+        {'commodityName': f'commodity{i}', 'systemName': system, 'stationName': f'Station {i % 7}',
+         'marketId': 1000 + i % 7, 'buyPrice': 0 if i % 3 == 0 else 100 + i, 'sellPrice': 90 + i,
+         'stock': 50, 'meanPrice': 120, 'stockBracket': 2}
+        for i in range(300)
+    ]
+
+
+@pytest.mark.parametrize('mode', ['plain', 'chunked', 'gzip'])
+def test_streamed_row_view_is_independent_of_transfer_encoding(plugin, stub_server, mode):
+    stub_server.route = exports
+    stub_server.mode = mode
+
+    rows = plugin.call_ardent_api('/system/name/Sol/commodities/exports', {'minVolume': 1}, 'buy')
+
+    assert len(rows) == 200  # Rows without a buy price dropped while streaming
+    assert rows.source_count == 300
+    assert all(row['buyPrice'] > 0 and row['systemName'] == 'Sol' for row in rows)
+    assert 'meanPrice' not in rows[0].to_dict()  # Projected to the view's fields
@@ -0,0 +1,76 @@
+"""ParallelRunner.run_batch: an overall deadline with partial results."""
+
+import time
+
+import pytest
+
+from conftest import covinance
+
+
+@pytest.fixture
+def runner():
+    parallel_runner = covinance.ParallelRunner(max_workers=6)
+    yield parallel_runner
+    parallel_runner.shutdown()
+
+
+def test_batch_returns_partial_results_at_the_deadline(runner):
+    tasks = [lambda i=i: (time.sleep(0.2), i)[1] for i in range(40)]
+
+    started = time.monotonic()
+    results, errors, abandoned = runner.run_batch(tasks, deadline=0.5)
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 0.8
+    assert 0 < len(results) < 40
+    assert abandoned == 40 - len(results)
+    assert errors == []
+
+
+def test_queued_tasks_are_cancelled_and_never_run(runner):
+    ran = []
+    tasks = [lambda i=i: (time.sleep(0.2), ran.append(i)) for i in range(40)]
+
+    runner.run_batch(tasks, deadline=0.3)
+    time.sleep(0.5)  # Let running tasks finish
+
+    assert len(ran) < 20
+    assert len(ran) + runner.get_lane_stats()['fanout']['cancelled'] == 40
+
+
+def test_task_exceptions_are_collected(runner):
+    def fail():
+        raise RuntimeError('boom')
+
+    results, errors, abandoned = runner.run_batch([lambda: 1, fail], deadline=2)
+
+    assert results == [1]
+    assert [str(e) for e in errors] == ['boom']
+    assert abandoned == 0
+
+
+def test_rare_goods_scan_reports_the_systems_actually_checked(plugin, stub_server):
+    def route(path, query):
+        if path == '/system/name/Sol/nearby':
+            return [{'systemName': f'S{i}', 'distance': 1.0 + i} for i in range(12)]
+        if path.endswith('/commodities/exports'):
+            index = int(path.split('/')[3][1:])
+            if index >= 4:
+                time.sleep(1.5)  # Overruns the scan deadline
+            return [{'commodityName': 'lavianbrandy', 'systemName': f'S{index}', 'stationName': f'Port {index}',
+                     'stationType': 'Coriolis', 'marketId': index, 'stock': 10, 'buyPrice': 500}]
+        return (404, {'error': 'Not found'})  # No coordinates - skip the rare goods index
+
+    stub_server.route = route
+    plugin.rate_limiter.rate = plugin.rate_limiter.max_rate = 1e6
+    plugin.rate_limiter.capacity = plugin.rate_limiter.tokens = 1e6
+    plugin.RARE_SCAN_TIME_BUDGET = 1.0
+
+    started = time.monotonic()
+    result = plugin.covinance_list_rare_goods({}, {})
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 1.5
+    assert 'Found 4 rare goods' in result
+    assert 'Checked 4 of 12 systems' in result
+    assert '8 skipped at the 1s time limit' in result
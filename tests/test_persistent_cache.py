@@ -0,0 +1,114 @@
+"""PersistentCacheStore: write-behind, TTL expiry and warm starts through ReliabilityClient."""
+
+import time
+
+import pytest
+
+from conftest import covinance
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / '_covinance_cache.db')
+
+
+@pytest.fixture
+def open_store(db_path):
+    stores = []
+
+    def open_():
+        store = covinance.PersistentCacheStore(db_path)
+        stores.append(store)
+        return store
+
+    yield open_
+    for store in stores:
+        store.close()
+
+
+def test_entries_survive_a_reopen(open_store):
+    store = open_store()
+    store.put('/system/name/Sol:', {'name': 'Sol'}, 300)
+    store.close()
+
+    result, cached_at, ttl = open_store().get('/system/name/Sol:')
+
+    assert result == {'name': 'Sol'}
+    assert ttl == 300
+    assert time.time() - cached_at < 5
+
+
+def test_put_is_write_behind(open_store):
+    store = open_store()
+    store.write_queue.put(None)  # Park the writer so the queue can't drain
+    store.writer.join(timeout=5)
+
+    started = time.perf_counter()
+    store.put('/system/name/Sol:', {'name': 'Sol'}, 300)
+    assert time.perf_counter() - started < 0.05
+    assert store.get('/system/name/Sol:') is None  # Queued, not written
+    assert store.write_queue.qsize() == 1
+
+
+def test_expired_rows_are_ignored_and_purged_at_open(open_store):
+    store = open_store()
+    store.write('INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)', ('old', '[1]', time.time() - 600, 300))
+    store.put('new', [2], 300)
+    store.flush()
+    assert store.get('old') is None
+    store.close()
+
+    reopened = open_store()
+    assert reopened.query('SELECT key FROM cache') == [('new',)]
+
+
+def test_unserializable_results_stay_memory_only(open_store):
+    store = open_store()
+    store.put('bad', {'value': object()}, 300)
+    store.put('good', {'value': 1}, 300)
+    store.flush()
+
+    assert store.get('bad') is None
+    assert store.get('good')[0] == {'value': 1}
+
+
+def test_restarted_client_is_served_from_disk(open_store):
+    calls = []
+
+    def fetch(endpoint, params):
+        calls.append(endpoint)
+        return {'endpoint': endpoint}
+
+    store = open_store()
+    client = covinance.ReliabilityClient(persistent_store=store)
+    client.get_cached_or_fetch('/system/name/Sol/stations', {}, fetch)  # System TTL - persisted
+    client.get_cached_or_fetch('/system/name/Sol/commodities/exports', {}, fetch)  # Market TTL - memory only
+    client.shutdown()
+    store.close()
+
+    store = open_store()
+    client = covinance.ReliabilityClient(persistent_store=store)
+    try:
+        assert client.get_cached_or_fetch('/system/name/Sol/stations', {}, fetch) == {'endpoint': '/system/name/Sol/stations'}
+        client.get_cached_or_fetch('/system/name/Sol/commodities/exports', {}, fetch)
+    finally:
+        client.shutdown()
+
+    assert calls == ['/system/name/Sol/stations', '/system/name/Sol/commodities/exports',
+                     '/system/name/Sol/commodities/exports']
+    assert client.stats['disk_hits'] == 1
+
+
+def test_plugin_restart_starts_warm(plugin, stub_server):
+    stub_server.route = lambda path, query: [{'stationName': 'Abraham Lincoln'}]
+    plugin.call_ardent_api('/system/name/Sol/stations')
+    plugin.shutdown()
+
+    restarted = covinance.COVINANCE(covinance.PluginManifest())
+    restarted.api_base_url = stub_server.base_url
+    try:
+        assert restarted.call_ardent_api('/system/name/Sol/stations') == [{'stationName': 'Abraham Lincoln'}]
+    finally:
+        restarted.shutdown()
+
+    assert stub_server.hits_for('/stations') == 1
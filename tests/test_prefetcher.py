@@ -0,0 +1,101 @@
+"""NeighbourhoodPrefetcher: background plans, foreground interrupts and the neighbourhood plan."""
+
+import threading
+import time
+
+import pytest
+
+from conftest import covinance
+from trade_world import TradeWorld
+
+
+def wait_for(condition, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, 'timed out'
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def runner():
+    parallel_runner = covinance.ParallelRunner(max_workers=4)
+    yield parallel_runner
+    parallel_runner.shutdown()
+
+
+def stepped_plan(steps, gate, done):
+    """Plan factory: records each step in done, waiting on gate before every step after the first"""
+    def plan(location):
+        for step in range(steps):
+            if step:
+                gate.wait(2)
+            done.append((location['system'], step))
+            yield
+    return plan
+
+
+def test_plan_runs_on_the_background_lane(runner):
+    lanes = []
+
+    def plan(location):
+        lanes.append(runner.current_lane())
+        yield
+
+    prefetcher = covinance.NeighbourhoodPrefetcher(None, runner, plan)
+    prefetcher.trigger({'system': 'Sol', 'event': 'FSDJump'})
+
+    wait_for(lambda: prefetcher.get_stats()['completed'] == 1)
+    assert lanes == ['background']
+
+
+def test_foreground_request_stops_the_plan_at_its_next_yield(runner):
+    gate = threading.Event()
+    done = []
+    prefetcher = covinance.NeighbourhoodPrefetcher(None, runner, stepped_plan(5, gate, done))
+    prefetcher.trigger({'system': 'Sol', 'event': 'FSDJump'})
+    wait_for(lambda: done)
+
+    prefetcher.interrupt()
+    gate.set()
+
+    wait_for(lambda: not prefetcher.running)
+    assert done == [('Sol', 0), ('Sol', 1)]
+    assert prefetcher.get_stats()['interrupted'] == 1
+    assert prefetcher.get_stats()['completed'] == 0
+
+
+def test_newer_event_supersedes_the_running_plan(runner):
+    gate = threading.Event()
+    done = []
+    prefetcher = covinance.NeighbourhoodPrefetcher(None, runner, stepped_plan(3, gate, done))
+    prefetcher.trigger({'system': 'Sol', 'event': 'FSDJump'})
+    wait_for(lambda: done)
+
+    prefetcher.trigger({'system': 'Alpha', 'event': 'FSDJump'})
+    gate.set()
+
+    wait_for(lambda: prefetcher.get_stats()['completed'] == 1)
+    assert [step for step in done if step[0] == 'Sol'] == [('Sol', 0), ('Sol', 1)]
+    assert [step for step in done if step[0] == 'Alpha'] == [('Alpha', 0), ('Alpha', 1), ('Alpha', 2)]
+
+
+def test_calls_made_by_the_plan_do_not_interrupt_it(plugin, stub_server):
+    world = TradeWorld().add_system('Sol', 0).add_system('Alpha', 10).add_system('Beta', 20).add_system('Far', 500)
+    world.add_station('Sol', 'Galileo', 1, exports={'gold': 100}).add_station('Alpha', 'Alpha Port', 2)
+    stub_server.route = world.route
+
+    plugin.prefetcher.trigger({'system': 'Sol', 'event': 'FSDJump'})
+    wait_for(lambda: plugin.prefetcher.get_stats()['completed'] == 1)
+
+    assert plugin.prefetcher.get_stats()['interrupted'] == 0
+    assert stub_server.hits_for('/nearby') == 1
+    assert stub_server.hits_for('/system/name/Sol/commodities/exports') == 3  # + best trade from here filters
+    for system in ('Sol', 'Alpha', 'Beta'):
+        assert stub_server.hits_for(f'/system/name/{system}/commodities/imports') == 2  # Plain + route engine
+        assert stub_server.hits_for(f'/system/name/{system}/stations') == 1
+    assert stub_server.hits_for('/system/name/Far/') == 0  # Outside PREFETCH_RADIUS
+
+    hits = len(stub_server.hits)
+    plugin.call_ardent_api('/system/name/Alpha/commodities/exports', {})
+    plugin.call_ardent_api('/system/name/Sol/stations')
+    assert len(stub_server.hits) == hits  # Warm for the next voice query
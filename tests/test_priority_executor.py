@@ -0,0 +1,109 @@
+"""PriorityExecutor lanes: interactive, fan-out and background work on one worker pool."""
+
+import threading
+import time
+
+import pytest
+
+from conftest import covinance
+
+
+@pytest.fixture
+def executor():
+    priority_executor = covinance.PriorityExecutor(max_workers=6)
+    yield priority_executor
+    priority_executor.shutdown(wait=False)
+
+
+def test_interactive_lane_is_not_blocked_by_a_saturated_fanout(executor):
+    release = threading.Event()
+    for _ in range(30):
+        executor.submit('fanout', release.wait, 5)
+    time.sleep(0.05)
+
+    started = time.monotonic()
+    lane = executor.submit('interactive', executor.current_lane).result(timeout=1)
+    waited = time.monotonic() - started
+    stats = executor.get_stats()
+    release.set()
+
+    assert lane == 'interactive'
+    assert waited < 0.2
+    assert stats['fanout']['running'] == executor.max_workers - executor.INTERACTIVE_RESERVE
+    assert stats['fanout']['queued'] == 30 - stats['fanout']['running']
+
+
+def test_background_lane_is_capped(executor):
+    lock = threading.Lock()
+    running = [0, 0]  # [now, peak]
+
+    def task():
+        with lock:
+            running[0] += 1
+            running[1] = max(running)
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+
+    futures = [executor.submit('background', task) for _ in range(12)]
+    for future in futures:
+        future.result(timeout=5)
+
+    assert running[1] == covinance.PriorityExecutor.BACKGROUND_LIMIT
+
+
+def test_queued_interactive_work_runs_before_queued_fanout(executor):
+    release = threading.Event()
+    order = []
+    for _ in range(executor.max_workers):
+        executor.submit('interactive', release.wait, 5)  # Every worker busy
+    time.sleep(0.05)
+    fanout = executor.submit('fanout', order.append, 'fanout')
+    interactive = executor.submit('interactive', order.append, 'interactive')
+
+    release.set()
+    fanout.result(timeout=1)
+    interactive.result(timeout=1)
+
+    assert order == ['interactive', 'fanout']
+
+
+def test_cancelled_tasks_leave_the_queue_at_once(executor):
+    release = threading.Event()
+    for _ in range(executor.max_workers):
+        executor.submit('interactive', release.wait, 5)
+    time.sleep(0.05)
+    queued = [executor.submit('background', lambda: None) for _ in range(5)]
+
+    for future in queued:
+        assert future.cancel()
+    stats = executor.get_stats()['background']
+    release.set()
+
+    assert stats['queued'] == 0
+    assert stats['cancelled'] == 5
+
+
+def test_lane_stats_report_queue_wait(executor):
+    release = threading.Event()
+    for _ in range(executor.max_workers):
+        executor.submit('interactive', release.wait, 5)
+    time.sleep(0.05)
+    future = executor.submit('fanout', lambda: None)
+
+    time.sleep(0.1)
+    release.set()
+    future.result(timeout=1)
+    stats = executor.get_stats()['fanout']
+
+    assert stats['submitted'] == stats['completed'] == 1
+    assert stats['max_wait_ms'] >= 90
+    assert stats['avg_wait_ms'] == pytest.approx(stats['max_wait_ms'])
+
+
+def test_submit_after_shutdown_is_refused():
+    priority_executor = covinance.PriorityExecutor(max_workers=3)
+    priority_executor.shutdown()
+
+    with pytest.raises(RuntimeError):
+        priority_executor.submit('fanout', lambda: None)
@@ -0,0 +1,87 @@
+"""covinance_max_profit_per_hour: the trip time model (_rank_pairs_per_hour)."""
+
+import pytest
+
+from trade_world import TradeWorld
+
+
+def pair(profit=1000, hop=10.0, buy_ls=100, sell_ls=100, buy_price=1000, buy=('Sol', 'Galileo', 1),
+         sell=('Alpha', 'Alpha Port', 2)):
+    return {
+        'commodity': 'gold',
+        'buy_system': buy[0], 'buy_station': buy[1], 'buy_market_id': buy[2], 'buy_price': buy_price,
+        'buy_arrival_ls': buy_ls,
+        'sell_system': sell[0], 'sell_station': sell[1], 'sell_market_id': sell[2],
+        'sell_price': buy_price + profit, 'sell_arrival_ls': sell_ls,
+        'profit': profit, 'hop_distance': hop,
+    }
+
+
+def test_loop_time_follows_the_model(plugin):
+    (ranked_pair, cr_per_hour, loop_seconds, jumps, units), = plugin._rank_pairs_per_hour(
+        [pair(hop=25.0, buy_ls=400, sell_ls=900)], jump_range=10.0, cargo_capacity=100
+    )
+
+    expected = (2 * 3 * plugin.JUMP_SECONDS + 2 * plugin.SUPERCRUISE_BASE_SECONDS
+                + plugin.SUPERCRUISE_SQRT_FACTOR * (20 + 30) + 2 * (plugin.DOCK_SECONDS + plugin.TRADE_SECONDS))
+    assert jumps == 3
+    assert units == 100
+    assert loop_seconds == pytest.approx(expected)
+    assert cr_per_hour == pytest.approx(1000 * 100 * 3600 / expected)
+
+
+def test_close_cheap_loop_beats_a_distant_fat_margin(plugin):
+    near = pair(profit=1000, hop=8.0, sell=('Alpha', 'Alpha Port', 2))
+    far = pair(profit=1500, hop=120.0, sell=('Far', 'Far Out', 3))
+
+    ranked = plugin._rank_pairs_per_hour([far, near], jump_range=15.0, cargo_capacity=100)
+
+    assert [entry[0] for entry in ranked] == [near, far]
+
+
+def test_credits_cap_the_units_bought(plugin):
+    (_, _, _, _, units), = plugin._rank_pairs_per_hour(
+        [pair(buy_price=2_000)], jump_range=10.0, cargo_capacity=500, credits=50_000
+    )
+
+    assert units == 25
+
+
+@pytest.mark.parametrize('sell', [
+    ('Sol', 'Renamed Galileo', 1),  # Same MarketID
+    ('Sol', 'Galileo', None),  # Same station and system, no MarketID
+])
+def test_same_market_pairs_are_not_ranked(plugin, sell):
+    same_market = pair(profit=5000, hop=0.0, sell=sell)
+    real = pair(profit=500, hop=10.0)
+
+    ranked = plugin._rank_pairs_per_hour([same_market, real], jump_range=15.0, cargo_capacity=100)
+
+    assert [entry[0] for entry in ranked] == [real]
+
+
+def test_top_n_of_many_pairs(plugin):
+    pairs = [pair(profit=100 + i, hop=float(i % 40), sell=('Alpha', f'Port {i}', 10 + i)) for i in range(5000)]
+
+    ranked = plugin._rank_pairs_per_hour(pairs, jump_range=10.0, cargo_capacity=100, top_n=5)
+
+    assert len(ranked) == 5
+    rates = [entry[1] for entry in ranked]
+    assert rates == sorted(rates, reverse=True)
+    assert rates[0] == max(plugin._rank_pairs_per_hour(pairs, 10.0, 100, top_n=5000), key=lambda e: e[1])[1]
+
+
+def test_profit_per_hour_action_skips_same_station_trades(plugin, stub_server):
+    world = (
+        TradeWorld()
+        .add_system('Sol', 0).add_system('Alpha', 10)
+        .add_station('Sol', 'Galileo', 1, exports={'gold': 100}, imports={'gold': 9000})  # Stale self-spread
+        .add_station('Alpha', 'Alpha Port', 2, imports={'gold': 400})
+    )
+    stub_server.route = world.route
+    plugin.PROFIT_SCAN_COMMODITIES = ['gold']
+
+    result = plugin.covinance_max_profit_per_hour({'max_distance': 20}, {})
+
+    assert 'Sell: Alpha Port (Alpha) - 400 CR' in result
+    assert 'Sell: Galileo' not in result
@@ -0,0 +1,88 @@
+"""RareGoodsIndex: local rare goods discovery and the batched index build."""
+
+import time
+
+import pytest
+
+from conftest import covinance
+
+
+@pytest.fixture
+def index():
+    rare_goods_index = covinance.RareGoodsIndex()
+    rare_goods_index.update('lavianbrandy', [(128106744, 'Lave Station', 'Lave', -9.5, 18.7, -23.8)])
+    rare_goods_index.update('bluemilk', [(128111111, 'Far Port', 'Far', 300.0, 0.0, 0.0)])
+    rare_goods_index.update('onionhead', [])  # Looked up, sold nowhere
+    return rare_goods_index
+
+
+def test_within_is_a_local_distance_filter(index):
+    found = index.within((0, 0, 0), 100)
+
+    assert [(commodity, system) for commodity, station, system, distance, market_id in found] == [('lavianbrandy', 'Lave')]
+    assert found[0][3] == pytest.approx(31.72, abs=0.01)
+
+
+def test_only_unscanned_or_expired_goods_are_stale(index):
+    index.scanned_at['bluemilk'] = time.time() - index.LOCATION_TTL - 1
+
+    assert index.stale(['lavianbrandy', 'bluemilk', 'onionhead', 'azuremilk']) == ['bluemilk', 'azuremilk']
+    assert index.indexed_count() == 3
+
+
+def test_index_survives_a_restart(tmp_path):
+    db_path = str(tmp_path / '_covinance_cache.db')
+    store = covinance.PersistentCacheStore(db_path)
+    covinance.RareGoodsIndex(store).update('lavianbrandy', [(1, 'Lave Station', 'Lave', -9.5, 18.7, -23.8)])
+    store.close()
+
+    store = covinance.PersistentCacheStore(db_path)
+    try:
+        reloaded = covinance.RareGoodsIndex(store)
+        assert reloaded.stale(['lavianbrandy']) == []
+        assert [row[2] for row in reloaded.within((0, 0, 0), 50)] == ['Lave']
+    finally:
+        store.close()
+
+
+def test_index_build_batches_lookups_and_skips_carriers(plugin, stub_server):
+    queries = []
+
+    def route(path, query):
+        queries.append((path, query))
+        if path == '/commodity/name/lavianbrandy/exports':
+            return [{'systemName': 'Lave', 'stationName': 'Lave Station', 'marketId': 1, 'stationType': 'Coriolis',
+                     'systemX': -9.5, 'systemY': 18.7, 'systemZ': -23.8}]
+        if path == '/commodity/name/bluemilk/exports':
+            return [{'systemName': 'Leesti', 'stationName': 'George Lucas', 'marketId': 2, 'stationType': 'Orbis'},
+                    {'systemName': 'Sol', 'stationName': 'X7Z-12A', 'marketId': 3, 'stationType': 'FleetCarrier'}]
+        if path == '/system/name/Leesti':
+            return {'systemName': 'Leesti', 'systemX': 72.8, 'systemY': 48.8, 'systemZ': 68.3}
+        return []
+
+    stub_server.route = route
+    plugin.rate_limiter.rate = plugin.rate_limiter.max_rate = 1e6  # One call per rare good - don't throttle
+    plugin.rate_limiter.capacity = plugin.rate_limiter.tokens = 1e6
+
+    assert plugin._refresh_rare_goods_index() == 0
+
+    exports = [query for path, query in queries if path.endswith('/exports')]
+    assert len(exports) == len(covinance.RARE_GOODS_DATA)
+    assert all(query.get('fleetCarriers') == 'false' for query in exports)
+    assert stub_server.hits_for('/system/name/') == 1  # One coordinate lookup, for Leesti
+    found = plugin.rare_goods_index.within((0, 0, 0), 200)
+    assert sorted((commodity, system) for commodity, _, system, _, _ in found) == [
+        ('bluemilk', 'Leesti'), ('lavianbrandy', 'Lave')
+    ]
+
+    assert plugin._refresh_rare_goods_index() == 0  # Nothing stale - no API calls
+    assert len(queries) == len(covinance.RARE_GOODS_DATA) + 1
+
+
+def test_failed_lookups_stay_stale(plugin, stub_server):
+    stub_server.route = lambda path, query: (404, {'error': 'Not found'}) if 'bluemilk' in path else []
+    plugin.rate_limiter.rate = plugin.rate_limiter.max_rate = 1e6
+    plugin.rate_limiter.capacity = plugin.rate_limiter.tokens = 1e6
+
+    assert plugin._refresh_rare_goods_index() == 1
+    assert plugin.rare_goods_index.stale(covinance.RARE_GOODS_DATA) == ['bluemilk']
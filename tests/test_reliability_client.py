@@ -0,0 +1,221 @@
+"""ReliabilityClient: LRU eviction, the expiry sweeper, stale-while-revalidate and /nearby radius subsumption."""
+
+import threading
+import time
+from datetime import timedelta
+
+import pytest
+
+from conftest import covinance
+
+NEARBY = '/system/name/Sol/nearby'
+
+
+@pytest.fixture
+def make_client():
+    clients = []
+
+    def make(**kwargs):
+        client = covinance.ReliabilityClient(**kwargs)
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.shutdown()
+
+
+class CountingFetch:
+    """fetch_fn stand-in that records calls and builds a response per request"""
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.calls = []
+
+    def __call__(self, endpoint, params):
+        self.calls.append((endpoint, dict(params or {})))
+        return self.respond(endpoint, params)
+
+
+def age_entries(client, seconds):
+    """Move every cached entry seconds into the past"""
+    with client.lock:
+        for key, (result, cached_time, ttl) in list(client.cache.items()):
+            client.cache[key] = (result, cached_time - timedelta(seconds=seconds), ttl)
+
+
+def sphere(endpoint, params, rows=40):
+    """Nearby rows spread evenly out to maxDistance"""
+    radius = float(params['maxDistance'])
+    return [{'systemName': f'S{i}', 'distance': radius * i / rows} for i in range(rows)]
+
+
+def test_lru_eviction_by_entry_count(make_client):
+    client = make_client(max_entries=3)
+    fetch = CountingFetch(lambda endpoint, params: {'name': endpoint})
+
+    for name in ('A', 'B', 'C'):
+        client.get_cached_or_fetch(f'/system/name/{name}', {}, fetch)
+    client.get_cached_or_fetch('/system/name/A', {}, fetch)  # A becomes most recently used
+    client.get_cached_or_fetch('/system/name/D', {}, fetch)  # Evicts B
+
+    assert client.stats['evictions'] == 1
+    fetch.calls.clear()
+    for name in ('A', 'C', 'D'):
+        client.get_cached_or_fetch(f'/system/name/{name}', {}, fetch)
+    assert fetch.calls == []
+    client.get_cached_or_fetch('/system/name/B', {}, fetch)
+    assert fetch.calls == [('/system/name/B', {})]
+
+
+def test_lru_eviction_by_byte_budget(make_client):
+    client = make_client(max_bytes=20_000)
+    fetch = CountingFetch(lambda endpoint, params: {'payload': 'x' * 6_000})
+
+    for i in range(10):
+        client.get_cached_or_fetch(f'/system/name/S{i}', {}, fetch)
+
+    assert client.cache_bytes <= 20_000
+    assert client.stats['evictions'] >= 6
+    assert len(client.cache) == len(client.entry_sizes)
+
+
+def test_sweeper_drops_expired_entries_and_their_bytes(make_client):
+    client = make_client()
+    fetch = CountingFetch(lambda endpoint, params: {'name': endpoint})
+    client.get_cached_or_fetch('/system/name/Sol', {}, fetch)  # System TTL
+    client.get_cached_or_fetch('/station/name/Abraham Lincoln', {}, fetch)  # Metadata TTL
+
+    age_entries(client, client.TTL_SYSTEM + 1)
+
+    assert client.sweep_expired() == 1
+    assert list(client.cache) == [client._make_cache_key('/station/name/Abraham Lincoln', {})]
+    assert client.cache_bytes == sum(client.entry_sizes.values())
+    assert client.stats['expired_swept'] == 1
+
+
+def test_stale_market_entry_is_served_while_one_refresh_runs(make_client):
+    client = make_client()
+    gate = threading.Event()
+
+    def respond(endpoint, params):
+        if len(fetch.calls) == 1:
+            return {'version': 1}
+        gate.wait(5)  # Hold the background refresh until the stale hits are done
+        return {'version': 2}
+
+    fetch = CountingFetch(respond)
+    endpoint = '/system/name/Sol/commodities/exports'
+    client.get_cached_or_fetch(endpoint, {}, fetch)
+
+    age_entries(client, client.TTL_MARKET + 1)
+    served = [client.get_cached_or_fetch(endpoint, {}, fetch) for _ in range(5)]
+
+    assert served == [{'version': 1}] * 5
+    gate.set()
+    client.revalidate_executor.shutdown(wait=True)  # Let the refresh finish
+    assert client.get_cached_or_fetch(endpoint, {}, fetch) == {'version': 2}
+    assert len(fetch.calls) == 2
+    assert client.stats['revalidations'] == 1
+
+
+def test_query_past_the_stale_cap_does_not_wait_for_a_queued_refresh(plugin, stub_server):
+    stub_server.route = lambda path, query: [{'commodityName': 'gold', 'buyPrice': 100 + len(stub_server.hits)}]
+    endpoint = '/system/name/Sol/commodities/exports'
+    client = plugin.reliability_client
+    plugin.call_ardent_api(endpoint)
+
+    # Occupy every background worker (shared with neighbourhood prefetch)
+    release = threading.Event()
+    for _ in range(covinance.PriorityExecutor.BACKGROUND_LIMIT):
+        plugin.parallel_runner.submit('background', release.wait)
+
+    age_entries(client, client.TTL_MARKET + 1)
+    plugin.call_ardent_api(endpoint)  # Stale hit - refresh queued behind the busy lane
+    age_entries(client, client.MARKET_MAX_STALE)
+
+    started = time.monotonic()
+    rows = plugin.call_ardent_api(endpoint)
+    waited = time.monotonic() - started
+
+    release.set()
+    assert waited < 1.0
+    assert rows[0]['buyPrice'] == 102
+    assert stub_server.hits_for('/commodities/exports') == 2
+    deadline = time.monotonic() + 2
+    while client.revalidating and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.1)
+    assert stub_server.hits_for('/commodities/exports') == 2  # Queued refresh found a fresh entry
+
+
+def test_smaller_radius_is_filtered_from_a_cached_wider_sphere(make_client):
+    client = make_client()
+    fetch = CountingFetch(sphere)
+
+    wide = client.get_cached_or_fetch(NEARBY, {'maxDistance': 150}, fetch)
+    narrow = client.get_cached_or_fetch(NEARBY, {'maxDistance': 30}, fetch)
+
+    assert len(fetch.calls) == 1
+    assert narrow == [row for row in wide if row['distance'] <= 30]
+    assert client.stats['radius_hits'] == 1
+
+
+def test_other_params_are_part_of_the_scope(make_client):
+    client = make_client()
+    fetch = CountingFetch(sphere)
+
+    client.get_cached_or_fetch(NEARBY, {'maxDistance': 150, 'minLandingPadSize': 'L'}, fetch)
+    client.get_cached_or_fetch(NEARBY, {'maxDistance': 30, 'minLandingPadSize': 'M'}, fetch)
+    client.get_cached_or_fetch('/system/name/Lave/nearby', {'maxDistance': 30}, fetch)
+
+    assert len(fetch.calls) == 3
+
+
+def test_possibly_truncated_sphere_is_not_used(make_client):
+    client = make_client()
+    fetch = CountingFetch(lambda endpoint, params: sphere(endpoint, params, rows=client.RADIUS_RESULT_CAP))
+
+    client.get_cached_or_fetch(NEARBY, {'maxDistance': 150}, fetch)
+    client.get_cached_or_fetch(NEARBY, {'maxDistance': 30}, fetch)
+
+    assert len(fetch.calls) == 2
+
+
+def test_rows_without_distance_are_not_filtered(make_client):
+    client = make_client()
+    fetch = CountingFetch(lambda endpoint, params: [{'systemName': 'S1'}])
+
+    client.get_cached_or_fetch(NEARBY, {'maxDistance': 150}, fetch)
+    client.get_cached_or_fetch(NEARBY, {'maxDistance': 30}, fetch)
+
+    assert len(fetch.calls) == 2
+
+
+def test_streamed_view_uses_the_api_row_count(make_client):
+    client = make_client()
+    endpoint = '/system/name/Sol/commodity/name/gold/nearby/exports'
+
+    def streamed(endpoint, params):
+        kept = [row for row in sphere(endpoint, params) if row['systemName'] != 'S3']
+        return covinance.RowList(kept, client.RADIUS_RESULT_CAP)  # API sent a full page
+
+    fetch = CountingFetch(streamed)
+    client.get_cached_or_fetch(endpoint, {'maxDistance': 150}, fetch, view='buy')
+    client.get_cached_or_fetch(endpoint, {'maxDistance': 30}, fetch, view='buy')
+
+    assert len(fetch.calls) == 2
+
+
+def test_wider_sphere_replaces_narrower_entries(make_client):
+    client = make_client()
+    fetch = CountingFetch(sphere)
+
+    client.get_cached_or_fetch(NEARBY, {'maxDistance': 30}, fetch)
+    client.get_cached_or_fetch(NEARBY, {'maxDistance': 150}, fetch)
+
+    (spheres,) = client.radius_index.values()
+    assert sorted(spheres.values()) == [150.0]
+    assert len(client.cache) == 1
+    client.get_cached_or_fetch(NEARBY, {'maxDistance': 30}, fetch)
+    assert len(fetch.calls) == 2
@@ -0,0 +1,92 @@
+"""ProjectedStateProvider / COVINANCE._state_snapshot: game state from COVAS projected_states."""
+
+import json
+
+import pytest
+
+from conftest import covinance
+
+PROJECTED = {
+    'Location': {'StarSystem': 'Alpha', 'Docked': True, 'Station': 'Alpha Port', 'StarPos': [10.0, 0.0, 0.0]},
+    'ShipInfo': {'Type': 'python', 'CargoCapacity': 256, 'MaximumJumpRange': 18.5},
+    'Cargo': {'TotalItems': 12},
+    'CurrentStatus': {'Balance': 1_000_000},
+}
+
+
+def event(name, **fields):
+    return json.dumps({'timestamp': '3310-10-16T12:00:00Z', 'event': name, **fields}) + '\n'
+
+
+@pytest.fixture
+def tailer(tmp_path):
+    path = tmp_path / 'Journal.2026-10-16T120000.01.log'
+    path.write_text(
+        event('Fileheader', part=1)
+        + event('Location', StarSystem='Sol', StarPos=[0, 0, 0], Docked=True, StationName='Galileo')
+        + event('Loadout', Ship='anaconda', CargoCapacity=128, MaxJumpRange=30.0),
+        encoding='utf-8'
+    )
+    return covinance.JournalTailer(lambda: str(path))
+
+
+def test_complete_projected_state_needs_no_journal(tailer, monkeypatch):
+    monkeypatch.setattr(tailer, 'poll', lambda: pytest.fail('Journal read on the hot path'))
+    provider = covinance.ProjectedStateProvider(tailer)
+
+    snapshot = provider.snapshot(PROJECTED)
+
+    assert snapshot == {
+        'location': {'system': 'Alpha', 'station': 'Alpha Port', 'coordinates': {'x': 10.0, 'y': 0.0, 'z': 0.0}},
+        'ship': {'ShipType': 'python', 'CargoCapacity': 256, 'MaxJumpRange': 18.5, 'CurrentCargo': 12,
+                 'Credits': 1_000_000},
+    }
+    assert provider.get_stats() == {'snapshots': 1, 'journal_fallbacks': 0}
+
+
+def test_undocked_projection_clears_the_station(tailer):
+    projected = dict(PROJECTED, Location={'StarSystem': 'Alpha', 'Docked': False, 'StarPos': [10.0, 0.0, 0.0]})
+
+    snapshot = covinance.ProjectedStateProvider(tailer).snapshot(projected)
+
+    assert snapshot['location']['station'] is None
+
+
+def test_missing_fields_fall_back_to_the_journal(tailer):
+    provider = covinance.ProjectedStateProvider(tailer)
+
+    snapshot = provider.snapshot({'CurrentStatus': {'Balance': 5_000}})
+
+    assert snapshot['location'] == {'system': 'Sol', 'station': 'Galileo', 'coordinates': {'x': 0, 'y': 0, 'z': 0}}
+    assert snapshot['ship']['ShipType'] == 'anaconda'
+    assert snapshot['ship']['MaxJumpRange'] == 30.0
+    assert snapshot['ship']['Credits'] == 5_000  # Projected value wins
+    assert provider.get_stats()['journal_fallbacks'] == 1
+
+
+def test_journal_station_is_not_mixed_into_another_system(tailer):
+    snapshot = covinance.ProjectedStateProvider(tailer).snapshot({'Location': {'StarSystem': 'Alpha'}})
+
+    assert snapshot['location'] == {'system': 'Alpha'}
+
+
+def test_action_reads_location_from_projected_states(plugin):
+    result = plugin.covinance_current_location({}, PROJECTED)
+
+    assert 'Alpha' in result and 'Alpha Port' in result
+    assert (plugin.current_system, plugin.current_station) == ('Alpha', 'Alpha Port')
+    assert plugin.system_coordinates == {'x': 10.0, 'y': 0.0, 'z': 0.0}
+    assert plugin.state_provider.get_stats()['journal_fallbacks'] == 0
+
+
+def test_delegating_action_resolves_state_once(plugin, monkeypatch):
+    delegated = {}
+    monkeypatch.setattr(plugin, 'covinance_nearby_profitable_trades',
+                        lambda args, projected_states: delegated.update(args) or 'delegated')
+
+    assert plugin.covinance_trade_within_jump_range({}, PROJECTED) == 'delegated'
+
+    assert delegated['max_distance'] == 18.5
+    assert delegated['reference_system'] == 'Alpha'
+    assert plugin._state_snapshot(delegated, PROJECTED) is delegated['_state_snapshot']
+    assert plugin.state_provider.get_stats()['snapshots'] == 1
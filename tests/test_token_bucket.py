@@ -0,0 +1,93 @@
+"""TokenBucket: the shared per-host rate limit (AIMD rate, Retry-After pauses)."""
+
+import time
+from email.utils import formatdate
+
+import pytest
+
+from conftest import covinance
+
+
+def test_burst_is_free_then_callers_are_paced():
+    bucket = covinance.TokenBucket(rate=10.0, burst=3)
+
+    waits = [bucket.reserve() for _ in range(5)]
+
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert waits[3] == pytest.approx(0.1, abs=0.01)
+    assert waits[4] == pytest.approx(0.2, abs=0.01)
+
+
+def test_interactive_reservations_skip_the_queue():
+    bucket = covinance.TokenBucket(rate=10.0, burst=1)
+    bucket.reserve()
+
+    assert bucket.reserve(interactive=True) == 0.0
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)  # Bulk callers absorb the debt
+
+
+def test_rate_increases_additively_and_halves_on_throttling():
+    bucket = covinance.TokenBucket(rate=10.0, burst=5, max_rate=12.0)
+
+    bucket.reward()
+    assert bucket.rate == pytest.approx(10.2)
+    for _ in range(100):
+        bucket.reward()
+    assert bucket.rate == 12.0
+
+    bucket.penalize()
+    bucket.penalize()  # Same burst of 429s - counted once
+    assert bucket.rate == 6.0
+    assert bucket.tokens <= 0
+    assert bucket.throttled == 2
+
+
+def test_rate_never_drops_below_the_floor():
+    bucket = covinance.TokenBucket(rate=1.5, burst=1)
+    bucket.DECREASE_INTERVAL = 0
+
+    for _ in range(5):
+        bucket.penalize()
+
+    assert bucket.rate == bucket.MIN_RATE
+
+
+def test_retry_after_blocks_every_caller():
+    bucket = covinance.TokenBucket(rate=100.0, burst=10)
+
+    bucket.penalize(retry_after=2.0)
+
+    assert bucket.reserve() == pytest.approx(2.0, abs=0.05)
+    assert bucket.reserve(interactive=True) == pytest.approx(2.0, abs=0.05)
+    bucket.penalize(retry_after=3600)
+    assert bucket.reserve() <= bucket.MAX_RETRY_AFTER
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('7', 7.0), ('1.5', 1.5), ('-3', 0.0), (None, None), ('', None), ('soon', None),
+])
+def test_parse_retry_after_seconds(value, expected):
+    assert covinance.TokenBucket.parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    value = formatdate(time.time() + 30, usegmt=True)
+
+    assert covinance.TokenBucket.parse_retry_after(value) == pytest.approx(30, abs=2)
+    assert covinance.TokenBucket.parse_retry_after(formatdate(0, usegmt=True)) == 0.0
+
+
+def test_throttled_call_waits_for_retry_after_then_succeeds(plugin, stub_server):
+    responses = [(429, {'error': 'Too many requests'}, {'Retry-After': '1'}), {'systemName': 'Sol'}]
+    stub_server.route = lambda path, query: responses.pop(0)
+    rate_before = plugin.rate_limiter.rate
+
+    started = time.monotonic()
+    result = plugin.call_ardent_api('/system/name/Sol')
+    elapsed = time.monotonic() - started
+
+    assert result == {'systemName': 'Sol'}
+    assert stub_server.hits_for('/system/name/Sol') == 2
+    assert 0.9 < elapsed < 2.0  # Retry-After (1 s) matches the first backoff step - not added on top
+    assert plugin.rate_limiter.throttled == 1
+    assert plugin.rate_limiter.rate < rate_before
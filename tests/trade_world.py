@@ -0,0 +1,90 @@
+"""
+Small synthetic trade neighbourhood for route and ranking tests.
+
+Systems have coordinates; stations sell (exports) and buy (imports) commodities
+at fixed prices. TradeWorld.route serves it in Ardent's row shapes through the
+stub server, for the system, nearby and commodity market endpoints.
+"""
+
+import math
+
+UPDATED_AT = '2026-10-16T12:00:00Z'
+
+
+class TradeWorld:
+    """Systems, stations and prices, answered as Ardent API rows"""
+
+    def __init__(self):
+        self.systems = {}  # {system: (x, y, z)}
+        self.stations = []  # [{system, station, market_id, arrival_ls, station_type, exports, imports}]
+
+    def add_system(self, name, x, y=0.0, z=0.0):
+        self.systems[name] = (x, y, z)
+        return self
+
+    def add_station(self, system, station, market_id, exports=None, imports=None, arrival_ls=100,
+                    station_type='Coriolis'):
+        """exports: {commodity: price the station sells at}, imports: {commodity: price it pays}"""
+        self.stations.append({
+            'system': system, 'station': station, 'market_id': market_id, 'arrival_ls': arrival_ls,
+            'station_type': station_type, 'exports': exports or {}, 'imports': imports or {},
+        })
+        return self
+
+    def distance(self, a, b):
+        return math.dist(self.systems[a], self.systems[b])
+
+    def _system_row(self, name, origin=None):
+        x, y, z = self.systems[name]
+        row = {'systemName': name, 'systemX': x, 'systemY': y, 'systemZ': z}
+        if origin is not None:
+            row['distance'] = round(self.distance(origin, name), 2)
+        return row
+
+    def _market_row(self, station, commodity, direction, origin=None):
+        price = station[direction][commodity]
+        row = {
+            'commodityName': commodity,
+            'stationName': station['station'],
+            'stationType': station['station_type'],
+            'marketId': station['market_id'],
+            'maxLandingPadSize': 3,
+            'distanceToArrival': station['arrival_ls'],
+            'buyPrice': price if direction == 'exports' else 0,
+            'sellPrice': price if direction == 'imports' else 0,
+            'stock': 1000 if direction == 'exports' else 0,
+            'demand': 1000 if direction == 'imports' else 0,
+            'updatedAt': UPDATED_AT,
+            **self._system_row(station['system'], origin),
+        }
+        return row
+
+    def route(self, path, query):
+        parts = path.strip('/').split('/')
+        if parts[:2] != ['system', 'name'] or parts[2] not in self.systems:
+            return 404, {'error': 'Not found'}
+        system = parts[2]
+        rest = parts[3:]
+        radius = float(query.get('maxDistance', 0))
+
+        if not rest:
+            return self._system_row(system)
+        if rest == ['nearby']:
+            return [
+                self._system_row(other, system) for other in self.systems
+                if other != system and self.distance(system, other) <= radius
+            ]
+        if rest[0] == 'commodities' and rest[1] in ('exports', 'imports'):
+            return [
+                self._market_row(station, commodity, rest[1])
+                for station in self.stations if station['system'] == system
+                for commodity in station[rest[1]]
+            ]
+        if rest[:2] == ['commodity', 'name'] and rest[3] == 'nearby' and rest[4] in ('exports', 'imports'):
+            commodity = rest[2]
+            return [
+                self._market_row(station, commodity, rest[4], system)
+                for station in self.stations
+                if commodity in station[rest[4]] and self.distance(system, station['system']) <= radius
+            ]
+        return []